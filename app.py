@@ -1,7 +1,31 @@
-from ui.login_ui import LoginUI
-import tkinter as tk
+import logging
+import os
+
+from startup_profiler import StartupProfiler
+
+# Set PIPS_PROFILE_STARTUP=1 to time every startup phase up to the first paint
+profiler = StartupProfiler.from_env(os.environ)
+
+with profiler.phase("imports"):
+    from ui.login_ui import LoginUI
+    from ui.router import ScreenRouter
+    from resources.registry import AssetRegistry
+    from ui.instrumentation import UIInstrumentation
+    import tkinter as tk
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = LoginUI(root)
-    root.mainloop()
\ No newline at end of file
+    logging.basicConfig(level=logging.DEBUG)
+
+    with profiler.phase("create window"):
+        root = tk.Tk()
+        # Set PIPS_UI_TRACE=1 to time every Tk callback and log event-loop stalls
+        UIInstrumentation.from_env(root, os.environ)
+
+    with profiler.phase("build login screen"):
+        router = ScreenRouter(root)
+        app = router.show(LoginUI)
+
+    profiler.watch_first_paint(root)
+    # Load the remaining logo sizes once the login window is up
+    root.after_idle(AssetRegistry.for_widget(root).prewarm)
+    root.mainloop()
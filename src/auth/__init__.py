@@ -1,5 +1,13 @@
-# Make login and register classes available at package level
-from .login import Login
-from .register import Register
+# Make login and register classes available at package level.
+# They are imported on first access so that importing one does not pull in the other.
+import importlib
 
-__all__ = ['Login', 'Register']
\ No newline at end of file
+_exports = {'Login': '.login', 'Register': '.register'}
+
+__all__ = ['Login', 'Register']
+
+
+def __getattr__(name):
+    if name in _exports:
+        return getattr(importlib.import_module(_exports[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
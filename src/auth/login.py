@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox
 import tkinter as tk
 
@@ -10,6 +11,41 @@ class Login:
         # Initialize database operations instance
         self.db = DBOperations()
 
+        # The connection is not thread-safe, so one worker thread runs every query
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="login-db")
+        self._prefetched = None  # (username, Future of its user record)
+
+    def prewarm(self):
+        """
+        Connects to the database in the background while the user is still typing.
+        """
+        self._executor.submit(lambda: self.db.connection)
+
+    def prefetch_user(self, username):
+        """
+        Starts fetching a user's record in the background, so that on submit
+        only the password check is left.
+        """
+        if not username:
+            return
+        if self._prefetched and self._prefetched[0] == username:
+            return
+        self._prefetched = (username, self._executor.submit(self.db.get_user_by_username, username))
+
+    def get_user(self, username):
+        """
+        Returns the user's record, reusing the prefetched one when it matches.
+        """
+        prefetched, self._prefetched = self._prefetched, None
+        if prefetched and prefetched[0] == username:
+            return prefetched[1].result()
+        return self._executor.submit(self.db.get_user_by_username, username).result()
+
+    def close(self):
+        """Stops the database worker once the login screen is gone."""
+        self._prefetched = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def authenticate(self, username, password):
         """
         Authenticates the user by checking credentials against the database.
@@ -18,8 +54,8 @@ class Login:
         if not username or not password:
             return False, "Username and password are required"
 
-        # Retrieve user record by username
-        user = self.db.get_user_by_username(username)
+        # Retrieve user record by username (usually already fetched in the background)
+        user = self.get_user(username)
 
         if not user:
             return False, "Invalid username or password"
@@ -3,8 +3,7 @@ from security import hash_password
 import logging
 
 
-# Set up logging configuration
-logging.basicConfig(level=logging.DEBUG)
+# Logging is configured by the application entry point (app.py)
 logger = logging.getLogger(__name__)
 
 
@@ -7,8 +7,15 @@ class DBOperations:
     """A class to handle all database operations for the application."""
 
     def __init__(self):
-        """Initializes the DBOperations class and creates a database connection."""
-        self.connection = self.create_connection()
+        """Initializes the DBOperations class. The connection is opened on first use."""
+        self._connection = None
+
+    @property
+    def connection(self):
+        """The database connection, established the first time a query needs it."""
+        if self._connection is None:
+            self._connection = self.create_connection()
+        return self._connection
 
     def create_connection(self):
         """Establishes a connection to the MySQL database."""
@@ -136,5 +143,5 @@ class DBOperations:
 
     def __del__(self):
         """Destructor to close the database connection when the object is destroyed."""
-        if self.connection:
-            self.connection.close()
+        if self._connection:
+            self._connection.close()
@@ -1,12 +1,16 @@
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
-from PIL import Image, ImageTk
+from PIL import ImageTk
+
+from resources.card_sets import card_resample, card_source
+from resources.scaled import load_scaled
 
 
 @dataclass
 class Card:
-    suit: str  # Jenis kartu: Hearts, Diamonds, Clubs, Spades
-    value: str  # Nilai kartu: 02, 03, ..., 10, J, Q, K, A
+    suit: str  # Jenis kartu: Hearts, Diamonds, Clubs, Spades (atau "joker")
+    value: str  # Nilai kartu: 02, 03, ..., 10, J, Q, K, A (warna untuk joker: red, black)
     image_path: str  # Path ke file gambar kartu
     tk_image: Optional[ImageTk.PhotoImage] = None  # Objek gambar Tkinter (opsional)
 
@@ -21,7 +25,10 @@ class Card:
             bool: True jika berhasil dimuat, False jika file tidak ditemukan.
         """
         try:
-            img = Image.open(self.image_path).resize(size)  # Buka dan ubah ukuran gambar
+            # Gambar diambil dari set kartu yang paling pas dengan ukuran tampilannya
+            path = Path(self.image_path)
+            source = card_source(path.name, tuple(size), path.parent.parent)
+            img = load_scaled(source, size, card_resample(size))  # Ambil versi pra-skala, atau ubah ukuran saat runtime
             self.tk_image = ImageTk.PhotoImage(img)  # Simpan sebagai objek ImageTk
             return True
         except FileNotFoundError:
@@ -34,6 +41,9 @@ class Card:
         Returns:
             str: Representasi string dari kartu
         """
+        if self.suit == "joker":
+            return f"{self.value.capitalize()} Joker"
+
         # Pemetaan nilai kartu agar lebih mudah dibaca
         value_map = {
             "02": "2", "03": "3", "04": "4", "05": "5",
@@ -1,22 +1,30 @@
 import random
-from typing import List
+from typing import List, Optional
 from .card import Card  # Mengimpor kelas Card dari file card.py
 
 
 class Deck:
     """Mewakili satu dek kartu remi (52 kartu)."""
 
-    def __init__(self):
-        """Inisialisasi dek kosong dan tumpukan buangan."""
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Inisialisasi dek kosong dan tumpukan buangan.
+
+        Args:
+            rng: Sumber angka acak untuk mengocok; dengan seed yang sama, urutan kocokan
+                dapat diulang (lihat game.history). Default modul random.
+        """
+        self.rng = rng if rng is not None else random
         self.cards: List[Card] = []  # Daftar kartu yang tersedia dalam dek
         self.discard_pile: List[Card] = []  # Tumpukan kartu yang telah dibuang
 
-    def create_standard_deck(self, assets_path: str):
+    def create_standard_deck(self, assets_path: str, jokers: int = 0):
         """
         Membuat satu dek standar berisi 52 kartu menggunakan gambar dari direktori aset.
 
         Args:
             assets_path: Path folder tempat gambar kartu disimpan.
+            jokers: Jumlah joker yang ditambahkan (0-2), untuk varian seperti Joker Poker.
         """
         suits = ["hearts", "diamonds", "clubs", "spades"]  # Jenis kartu
         values = ["A", "02", "03", "04", "05", "06", "07", "08", "09", "10", "J", "Q", "K"]  # Nilai kartu
@@ -27,9 +35,13 @@ class Deck:
                 image_path = f"{assets_path}/cards_large/card_{suit}_{value}.png"
                 self.cards.append(Card(suit, value, image_path))  # Buat objek Card dan tambahkan ke dek
 
+        # Joker memakai suit "joker" dan warnanya sebagai nilai
+        for color in ["red", "black"][:jokers]:
+            self.cards.append(Card("joker", color, f"{assets_path}/cards_large/card_joker_{color}.png"))
+
     def shuffle(self):
         """Mengacak (shuffle) urutan kartu dalam dek."""
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def deal(self, num_cards: int) -> List[Card]:
         """
@@ -48,6 +60,18 @@ class Deck:
 
         return dealt
 
+    def peek(self, num_cards: int) -> List[Card]:
+        """
+        Melihat kartu teratas dek tanpa mengambilnya.
+
+        Args:
+            num_cards: Jumlah kartu yang ingin dilihat.
+
+        Returns:
+            List kartu dalam urutan yang sama seperti hasil deal().
+        """
+        return self.cards[::-1][:num_cards]
+
     def discard(self, card: Card):
         """
         Menambahkan satu kartu ke tumpukan buangan.
@@ -0,0 +1,298 @@
+import math
+import pickle
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import List, Optional, Sequence
+
+from .evaluator import evaluate
+
+
+# Kalkulator peluang menang (equity) beberapa pemain.
+#
+# Jika jumlah kemungkinan sisa kartu bersama (runout) cukup kecil, semua runout
+# dihitung satu per satu (hasil pasti). Jika tidak, dipakai Monte Carlo dengan
+# seed: sampel diambil per batch, dan berhenti lebih awal begitu interval
+# kepercayaan equity setiap pemain cukup sempit. Potongan pekerjaan dibagi ke
+# beberapa proses agar tetap cepat untuk UI.
+
+EXACT_LIMIT = 100_000  # Runout maksimum yang masih dihitung satu per satu
+BATCH_SIZE = 2_000  # Sampel Monte Carlo per potongan pekerjaan
+MAX_SAMPLES = 200_000  # Batas sampel Monte Carlo
+TOLERANCE = 0.005  # Setengah lebar interval kepercayaan yang dianggap cukup
+Z_SCORE = 1.96  # Interval kepercayaan 95%
+PARALLEL_MIN_RUNOUTS = 5_000  # Pekerjaan lebih kecil dihitung di proses ini saja
+ROUND_BATCHES = 8  # Batch Monte Carlo per putaran sebelum interval diperiksa
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+@dataclass
+class EquityResult:
+    """Hasil perhitungan equity, satu nilai per pemain sesuai urutan tangan."""
+    win: List[float]  # Peluang menang sendirian
+    tie: List[float]  # Peluang seri (berbagi pot)
+    equity: List[float]  # Bagian pot yang diharapkan: menang + bagian dari seri
+    samples: int  # Jumlah runout yang dihitung
+    exact: bool  # True jika semua runout dihitung (bukan Monte Carlo)
+    margin: List[float] = field(default_factory=list)  # Setengah lebar interval 95% (0 jika pasti)
+
+
+class _Tally:
+    """Jumlah menang, seri, dan bagian pot setiap pemain dari sejumlah runout."""
+
+    def __init__(self, players: int, evaluate_ids=None):
+        self.evaluate_ids = evaluate_ids or evaluate
+        self.samples = 0
+        self.wins = [0] * players
+        self.ties = [0] * players
+        self.shares = [0.0] * players
+        self.squares = [0.0] * players  # Jumlah kuadrat bagian pot, untuk variansi
+
+    def add_runout(self, hands, board):
+        strengths = [self.evaluate_ids(hand + board) for hand in hands]
+        best = max(strengths)
+        winners = [i for i, strength in enumerate(strengths) if strength == best]
+        share = 1.0 / len(winners)
+
+        self.samples += 1
+        for i in winners:
+            if len(winners) == 1:
+                self.wins[i] += 1
+            else:
+                self.ties[i] += 1
+            self.shares[i] += share
+            self.squares[i] += share * share
+
+    def merge(self, other):
+        self.samples += other.samples
+        for i in range(len(self.wins)):
+            self.wins[i] += other.wins[i]
+            self.ties[i] += other.ties[i]
+            self.shares[i] += other.shares[i]
+            self.squares[i] += other.squares[i]
+
+    def margins(self):
+        # Setengah lebar interval kepercayaan equity setiap pemain
+        n = self.samples
+        if n < 2:
+            return [math.inf] * len(self.wins)
+        result = []
+        for total, squares in zip(self.shares, self.squares):
+            mean = total / n
+            variance = max(0.0, squares / n - mean * mean) * n / (n - 1)
+            result.append(Z_SCORE * math.sqrt(variance / n))
+        return result
+
+    def result(self, exact):
+        n = max(self.samples, 1)
+        return EquityResult(
+            win=[w / n for w in self.wins],
+            tie=[t / n for t in self.ties],
+            equity=[s / n for s in self.shares],
+            samples=self.samples,
+            exact=exact,
+            margin=[0.0] * len(self.wins) if exact else self.margins(),
+        )
+
+
+def _exact_prefixes(count, needed, chunk):
+    """
+    Membagi semua runout (kombinasi `needed` dari `count` kartu sisa) menjadi
+    potongan berisi paling banyak sekitar `chunk` runout.
+
+    Setiap potongan adalah daftar prefiks: indeks kartu pertama runout yang
+    ditetapkan (berurutan naik). Prefiks (i, j) mencakup semua runout yang dimulai
+    dengan kartu ke-i lalu ke-j, diikuti kombinasi kartu setelah j; jadi setiap
+    proses langsung mulai dari potongannya tanpa melewati kombinasi sebelumnya.
+    """
+    if needed == 0:
+        return [[()]]
+    prefixes = []
+
+    def split(prefix, first):
+        left = needed - len(prefix)
+        for index in range(first, count - left + 1):
+            size = math.comb(count - index - 1, left - 1)
+            if size > chunk and left > 1:
+                split(prefix + (index,), index + 1)
+            else:
+                prefixes.append((prefix + (index,), size))
+
+    split((), 0)
+    chunks = []
+    current, current_size = [], 0
+    for prefix, size in prefixes:
+        if current and current_size + size > chunk:
+            chunks.append(current)
+            current, current_size = [], 0
+        current.append(prefix)
+        current_size += size
+    chunks.append(current)
+    return chunks
+
+
+def _exact_runouts(hands, board, remaining, needed, prefixes, evaluate_ids=None):
+    # Menghitung semua runout yang diawali salah satu prefiks (lihat _exact_prefixes)
+    tally = _Tally(len(hands), evaluate_ids)
+    for prefix in prefixes:
+        fixed = board + [remaining[index] for index in prefix]
+        rest = remaining[prefix[-1] + 1:] if prefix else remaining
+        for runout in combinations(rest, needed - len(prefix)):
+            tally.add_runout(hands, fixed + list(runout))
+    return tally
+
+
+_context_cache = (None, None)  # (bytes pickle, isi) konteks terakhir di proses pekerja
+
+
+def _exact_chunk(context: bytes, prefixes):
+    # Konteks (tangan, board, kartu sisa, ...) di-pickle sekali oleh pemanggil dan
+    # dibongkar sekali per proses pekerja, bukan sekali per potongan
+    global _context_cache
+    blob, value = _context_cache
+    if blob != context:
+        value = pickle.loads(context)
+        _context_cache = (context, value)
+    hands, board, remaining, needed, evaluate_ids = value
+    return _exact_runouts(hands, board, remaining, needed, prefixes, evaluate_ids)
+
+
+def _sample_batch(hands, board, remaining, needed, count, seed, evaluate_ids=None):
+    # Seed per batch berasal dari seed utama dan nomor batch, jadi hasilnya
+    # sama berapa pun jumlah proses dan urutan selesainya
+    rng = random.Random(seed)
+    tally = _Tally(len(hands), evaluate_ids)
+    for _ in range(count):
+        tally.add_runout(hands, board + rng.sample(remaining, needed))
+    return tally
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Mengembalikan process pool bersama, dibuat saat pertama kali dibutuhkan."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor()
+        return _pool
+
+
+def shutdown_pool():
+    """Menghentikan process pool bersama (mis. saat aplikasi ditutup)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def calculate_equity(
+    hands: Sequence[Sequence[int]],
+    board: Sequence[int] = (),
+    dead: Sequence[int] = (),
+    board_size: int = 5,
+    seed: Optional[int] = None,
+    exact_limit: int = EXACT_LIMIT,
+    max_samples: int = MAX_SAMPLES,
+    tolerance: float = TOLERANCE,
+    batch_size: int = BATCH_SIZE,
+    executor=None,
+    evaluate_ids=None,
+    deck_ids: Optional[Sequence[int]] = None,
+    remaining_ids: Optional[Sequence[int]] = None,
+) -> EquityResult:
+    """
+    Menghitung peluang menang, seri, dan equity setiap pemain.
+
+    Args:
+        hands: Kartu yang diketahui milik setiap pemain (id kartu 0-51).
+        board: Kartu bersama yang sudah terbuka.
+        dead: Kartu yang sudah keluar dari dek dan tidak mungkin muncul lagi.
+        board_size: Jumlah kartu bersama saat showdown (0 untuk poker 5 kartu biasa).
+        seed: Seed Monte Carlo; seed yang sama memberi hasil yang sama.
+        exact_limit: Jumlah runout maksimum yang masih dihitung satu per satu.
+        max_samples: Batas jumlah sampel Monte Carlo.
+        tolerance: Monte Carlo berhenti jika interval 95% equity setiap pemain
+            tidak lebih lebar dari +/- tolerance.
+        batch_size: Jumlah runout per potongan pekerjaan.
+        executor: Executor untuk potongan pekerjaan; default process pool bersama.
+            Pekerjaan kecil selalu dihitung di proses ini.
+        evaluate_ids: Fungsi penilai tangan (mis. WildEvaluator.evaluate); default
+            game.evaluator.evaluate.
+        deck_ids: Semua id kartu di dek (mis. termasuk joker); default 52 kartu biasa.
+        remaining_ids: Kartu yang masih bisa keluar, apa adanya, mis. Shoe.remaining_ids()
+            untuk beberapa dek (boleh berisi id yang sama lebih dari sekali). Jika
+            diberikan, deck_ids dan dead diabaikan dan kartu pemain tidak harus unik.
+
+    Returns:
+        EquityResult untuk semua pemain.
+    """
+    hands = [list(hand) for hand in hands]
+    board = list(board)
+    if remaining_ids is not None:
+        remaining = list(remaining_ids)
+    else:
+        used = [card for hand in hands for card in hand] + board + list(dead)
+        if len(set(used)) != len(used):
+            raise ValueError("Kartu yang sama muncul lebih dari sekali")
+
+        used = set(used)
+        remaining = [card for card in (deck_ids or range(52)) if card not in used]
+    needed = board_size - len(board)
+    if needed < 0 or needed > len(remaining):
+        raise ValueError("Jumlah kartu bersama tidak valid")
+
+    runouts = math.comb(len(remaining), needed)
+    if runouts <= exact_limit:
+        return _exact(hands, board, remaining, needed, runouts, batch_size, executor, evaluate_ids)
+    return _monte_carlo(
+        hands, board, remaining, needed, seed, max_samples, tolerance, batch_size, executor, evaluate_ids
+    )
+
+
+def _exact(hands, board, remaining, needed, runouts, batch_size, executor, evaluate_ids):
+    total = _Tally(len(hands))
+    if runouts < PARALLEL_MIN_RUNOUTS:
+        total.merge(_exact_runouts(hands, board, remaining, needed, [()], evaluate_ids))
+        return total.result(exact=True)
+
+    executor = executor or get_pool()
+    chunk = max(batch_size, runouts // 32)
+    context = pickle.dumps((hands, board, remaining, needed, evaluate_ids))
+    futures = [
+        executor.submit(_exact_chunk, context, prefixes)
+        for prefixes in _exact_prefixes(len(remaining), needed, chunk)
+    ]
+    for future in futures:
+        total.merge(future.result())
+    return total.result(exact=True)
+
+
+def _monte_carlo(hands, board, remaining, needed, seed, max_samples, tolerance, batch_size, executor, evaluate_ids):
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    executor = executor or get_pool()
+
+    total = _Tally(len(hands))
+    batch_index = 0
+    while total.samples < max_samples:
+        # Ukuran putaran tetap (tidak bergantung jumlah proses) dan hasil digabung
+        # sesuai nomor batch, jadi seed yang sama selalu memberi hasil yang sama
+        round_size = min(ROUND_BATCHES, math.ceil((max_samples - total.samples) / batch_size))
+        futures = []
+        for _ in range(round_size):
+            count = min(batch_size, max_samples - total.samples - len(futures) * batch_size)
+            futures.append(executor.submit(
+                _sample_batch, hands, board, remaining, needed, count, f"{seed}:{batch_index}", evaluate_ids
+            ))
+            batch_index += 1
+        for future in futures:
+            total.merge(future.result())
+
+        if max(total.margins()) <= tolerance:
+            break
+
+    return total.result(exact=False)
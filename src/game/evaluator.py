@@ -0,0 +1,368 @@
+import threading
+from itertools import combinations
+from typing import Dict, List, Sequence
+
+
+# Evaluator kekuatan tangan poker (5 kartu, atau 5 terbaik dari 6-7 kartu) dengan tabel
+# yang dihitung sekali saat modul dimuat.
+#
+# Setiap tangan dipetakan ke salah satu dari 7.462 kelas kekuatan yang berbeda.
+# Kekuatan berupa satu bilangan bulat: makin besar makin kuat (7462 = Royal Flush,
+# 1 = 7-5-4-3-2 tanpa flush), sehingga dua tangan cukup dibandingkan dengan < atau >.
+#
+# Kartu diwakili oleh id 0-51: id = peringkat * 4 + suit, dengan peringkat
+# 0 (dua) sampai 12 (as) dan suit mengikuti urutan di Deck.create_standard_deck.
+
+RANKS = "23456789TJQKA"
+SUITS = ["hearts", "diamonds", "clubs", "spades"]
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]  # Satu bilangan prima per peringkat
+
+# Nilai kartu di objek Card ("02".."10", "J", "Q", "K", "A") -> indeks peringkat
+VALUE_TO_RANK = {
+    "02": 0, "03": 1, "04": 2, "05": 3, "06": 4, "07": 5, "08": 6,
+    "09": 7, "10": 8, "J": 9, "Q": 10, "K": 11, "A": 12,
+}
+
+# Joker (lihat game.wild) memakai id setelah 52 kartu biasa
+JOKER_SUIT = "joker"
+JOKER_IDS = {"red": 52, "black": 53}
+
+# Jenis tangan dari yang terkuat, dengan jumlah kelas kekuatannya
+HAND_CLASSES = [
+    ("Straight Flush", 10),
+    ("Four of a Kind", 156),
+    ("Full House", 156),
+    ("Flush", 1277),
+    ("Straight", 10),
+    ("Three of a Kind", 858),
+    ("Two Pair", 858),
+    ("One Pair", 2860),
+    ("High Card", 1277),
+]
+CLASS_COUNT = sum(count for _, count in HAND_CLASSES)  # 7462
+ROYAL_FLUSH = CLASS_COUNT  # Kekuatan Royal Flush, straight flush tertinggi
+
+# Ciri setiap kartu, diindeks dengan id: (bit peringkat, bilangan prima, suit)
+CARD_RANK_BIT = [1 << (card_id // 4) for card_id in range(52)]
+CARD_PRIME = [PRIMES[card_id // 4] for card_id in range(52)]
+CARD_SUIT = [card_id % 4 for card_id in range(52)]
+
+
+def _straight_masks() -> List[int]:
+    # Mask 13-bit dari setiap straight, dari A-K-Q-J-T turun sampai 5-4-3-2-A
+    masks = [0b11111 << low for low in range(8, -1, -1)]
+    masks.append((1 << 12) | 0b1111)  # Wheel: as dihitung rendah
+    return masks
+
+
+def _build_tables():
+    """
+    Membangun tabel pencarian dengan menghitung mundur dari kelas terkuat.
+
+    Returns:
+        Tuple (tabel flush, tabel unique5, tabel hasil kali prima, peringkat utama).
+        Dua tabel pertama diindeks dengan mask peringkat 13-bit, tabel ketiga
+        memetakan hasil kali prima tangan yang memiliki peringkat kembar.
+        Peringkat utama diindeks dengan kekuatan: peringkat quad, trips, pasangan
+        (tertinggi), atau kartu tertinggi, sesuai jenis tangannya.
+    """
+    flush = [0] * (1 << 13)
+    unique5 = [0] * (1 << 13)
+    products: Dict[int, int] = {}
+    primary = [0] * (CLASS_COUNT + 1)
+
+    straights = _straight_masks()
+    straight_set = set(straights)
+    # Lima peringkat berbeda yang bukan straight, dari kartu tertinggi terbesar
+    high_cards = [
+        sum(1 << rank for rank in ranks)
+        for ranks in combinations(range(12, -1, -1), 5)
+    ]
+    high_cards = [mask for mask in high_cards if mask not in straight_set]
+
+    def product(counts):
+        result = 1
+        for rank, count in counts:
+            result *= PRIMES[rank] ** count
+        return result
+
+    strength = CLASS_COUNT
+    descending = range(12, -1, -1)
+
+    def top_rank(mask):
+        # Kartu tertinggi; pada wheel (5-4-3-2-A) kartu tertingginya lima
+        return 3 if mask == straights[-1] else mask.bit_length() - 1
+
+    # Straight flush
+    for mask in straights:
+        flush[mask] = strength
+        primary[strength] = top_rank(mask)
+        strength -= 1
+
+    # Four of a kind: peringkat quad, lalu kicker
+    for quad in descending:
+        for kicker in descending:
+            if kicker != quad:
+                products[product([(quad, 4), (kicker, 1)])] = strength
+                primary[strength] = quad
+                strength -= 1
+
+    # Full house: peringkat trips, lalu pasangan
+    for trips in descending:
+        for pair in descending:
+            if pair != trips:
+                products[product([(trips, 3), (pair, 2)])] = strength
+                primary[strength] = trips
+                strength -= 1
+
+    # Flush
+    for mask in high_cards:
+        flush[mask] = strength
+        primary[strength] = top_rank(mask)
+        strength -= 1
+
+    # Straight
+    for mask in straights:
+        unique5[mask] = strength
+        primary[strength] = top_rank(mask)
+        strength -= 1
+
+    # Three of a kind: peringkat trips, lalu dua kicker
+    for trips in descending:
+        for kickers in combinations([r for r in descending if r != trips], 2):
+            products[product([(trips, 3)] + [(k, 1) for k in kickers])] = strength
+            primary[strength] = trips
+            strength -= 1
+
+    # Two pair: pasangan tinggi, pasangan rendah, lalu kicker
+    for high, low in combinations(descending, 2):
+        for kicker in descending:
+            if kicker not in (high, low):
+                products[product([(high, 2), (low, 2), (kicker, 1)])] = strength
+                primary[strength] = high
+                strength -= 1
+
+    # One pair: peringkat pasangan, lalu tiga kicker
+    for pair in descending:
+        for kickers in combinations([r for r in descending if r != pair], 3):
+            products[product([(pair, 2)] + [(k, 1) for k in kickers])] = strength
+            primary[strength] = pair
+            strength -= 1
+
+    # High card
+    for mask in high_cards:
+        unique5[mask] = strength
+        primary[strength] = top_rank(mask)
+        strength -= 1
+
+    assert strength == 0, "Jumlah kelas kekuatan harus tepat 7462"
+    return flush, unique5, products, primary
+
+
+FLUSH_TABLE, UNIQUE5_TABLE, PRODUCT_TABLE, _PRIMARY = _build_tables()
+
+# Batas bawah kekuatan setiap jenis tangan, dari yang terkuat
+_CLASS_FLOORS = []
+_floor = CLASS_COUNT
+for _name, _count in HAND_CLASSES:
+    _floor -= _count
+    _CLASS_FLOORS.append((_floor + 1, _name))
+
+# Five of a Kind (hanya dengan kartu liar, lihat game.wild): 13 kelas di atas Royal Flush
+FIVE_OF_A_KIND_BASE = CLASS_COUNT  # Kekuatan = FIVE_OF_A_KIND_BASE + 1 + peringkat
+MAX_STRENGTH = FIVE_OF_A_KIND_BASE + 13
+
+
+def card_id(card) -> int:
+    """
+    Mengubah objek Card menjadi id kartu 0-51.
+
+    Args:
+        card: Objek Card dengan suit (mis. "hearts") dan value (mis. "02", "A"),
+            atau joker dengan suit "joker" dan value "red"/"black" (id 52/53).
+    """
+    if card.suit == JOKER_SUIT:
+        return JOKER_IDS[card.value]
+    return VALUE_TO_RANK[card.value] * 4 + SUITS.index(card.suit)
+
+
+def card_ids(cards) -> List[int]:
+    """Mengubah daftar objek Card menjadi daftar id kartu."""
+    return [card_id(card) for card in cards]
+
+
+def evaluate5(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """
+    Menghitung kekuatan tepat lima kartu.
+
+    Args:
+        c1..c5: Id kartu 0-51.
+
+    Returns:
+        Kekuatan 1-7462, makin besar makin kuat.
+    """
+    mask = CARD_RANK_BIT[c1] | CARD_RANK_BIT[c2] | CARD_RANK_BIT[c3] | CARD_RANK_BIT[c4] | CARD_RANK_BIT[c5]
+    suit = CARD_SUIT[c1]
+    if suit == CARD_SUIT[c2] == CARD_SUIT[c3] == CARD_SUIT[c4] == CARD_SUIT[c5]:
+        return FLUSH_TABLE[mask]
+
+    strength = UNIQUE5_TABLE[mask]
+    if strength:
+        return strength  # Lima peringkat berbeda: straight atau high card
+    return PRODUCT_TABLE[CARD_PRIME[c1] * CARD_PRIME[c2] * CARD_PRIME[c3] * CARD_PRIME[c4] * CARD_PRIME[c5]]
+
+
+# Hasil terbaik untuk 6-7 kartu, diisi saat pertama kali dibutuhkan:
+# mask peringkat suit flush -> kekuatan, dan hasil kali prima peringkat -> kekuatan.
+# Tanpa flush, suit tidak berpengaruh, jadi jumlah tiap peringkat (yang dikodekan
+# secara unik oleh hasil kali prima) sudah cukup sebagai kunci. Paling banyak ada
+# 49.205 kombinasi jumlah peringkat untuk 7 kartu.
+_best_flush: Dict[int, int] = {}
+_best_ranks: Dict[int, int] = {}
+_memo_lock = threading.Lock()
+
+
+def _compute_best_flush(mask: int) -> int:
+    bits = [1 << rank for rank in range(13) if mask >> rank & 1]
+    return max(FLUSH_TABLE[sum(subset)] for subset in combinations(bits, 5))
+
+
+def _compute_best_ranks(ranks: List[int]) -> int:
+    best = 0
+    for subset in set(combinations(sorted(ranks), 5)):
+        mask = 0
+        product = 1
+        for rank in subset:
+            mask |= 1 << rank
+            product *= PRIMES[rank]
+        strength = UNIQUE5_TABLE[mask] if len(set(subset)) == 5 else PRODUCT_TABLE.get(product, 0)
+        best = max(best, strength)
+    return best
+
+
+def evaluate_best(ids: Sequence[int]) -> int:
+    """
+    Menghitung kekuatan lima kartu terbaik dari 5-7 kartu tanpa mencoba
+    ke-21 subset satu per satu.
+
+    Suit dihitung dulu: jika ada lima kartu sesuit, hasilnya diambil dari mask
+    peringkat suit itu (dengan 7 kartu, flush selalu mengalahkan kombinasi
+    tanpa flush). Jika tidak, hasilnya diambil dari hasil kali prima semua
+    peringkat. Kedua tabel diingat (memo) setelah perhitungan pertama.
+
+    Args:
+        ids: 5 sampai 7 id kartu 0-51.
+
+    Returns:
+        Kekuatan 1-7462, makin besar makin kuat.
+    """
+    suit_counts = [0, 0, 0, 0]
+    suit_masks = [0, 0, 0, 0]
+    product = 1
+    for card in ids:
+        suit = card & 3
+        suit_counts[suit] += 1
+        suit_masks[suit] |= CARD_RANK_BIT[card]
+        product *= CARD_PRIME[card]
+
+    for suit in range(4):
+        if suit_counts[suit] >= 5:
+            mask = suit_masks[suit]
+            strength = _best_flush.get(mask)
+            if strength is None:
+                strength = _compute_best_flush(mask)
+                with _memo_lock:
+                    _best_flush[mask] = strength
+            return strength
+
+    strength = _best_ranks.get(product)
+    if strength is None:
+        strength = _compute_best_ranks([card >> 2 for card in ids])
+        with _memo_lock:
+            _best_ranks[product] = strength
+    return strength
+
+
+def evaluate(ids: Sequence[int]) -> int:
+    """
+    Menghitung kekuatan tangan: lima kartu, atau lima kartu terbaik dari 6-7 kartu.
+
+    Args:
+        ids: 5 sampai 7 id kartu 0-51.
+
+    Returns:
+        Kekuatan 1-7462, makin besar makin kuat.
+    """
+    if len(ids) == 5:
+        return evaluate5(*ids)
+    if 5 < len(ids) <= 7:
+        return evaluate_best(ids)
+    raise ValueError(f"Evaluator membutuhkan 5-7 kartu, bukan {len(ids)}")
+
+
+def _hand_class(strength: int) -> str:
+    if strength > CLASS_COUNT:
+        return "Five of a Kind"
+    if strength == ROYAL_FLUSH:
+        return "Royal Flush"
+    for floor, name in _CLASS_FLOORS:
+        if strength >= floor:
+            return name
+    raise ValueError(f"Kekuatan di luar jangkauan: {strength}")
+
+
+# Nama jenis tangan dan peringkat utamanya untuk setiap kekuatan 1..MAX_STRENGTH (indeks 0 tidak dipakai)
+CLASS_NAMES = [""] + [_hand_class(strength) for strength in range(1, MAX_STRENGTH + 1)]
+PRIMARY_RANK = _PRIMARY + [rank for rank in range(13)]
+
+
+def hand_class(strength: int) -> str:
+    """
+    Mengembalikan nama jenis tangan dari sebuah kekuatan, mis. "Full House".
+    Straight flush tertinggi dinamai "Royal Flush"; kekuatan di atasnya hanya
+    mungkin dengan kartu liar (lihat game.wild) dan dinamai "Five of a Kind".
+    """
+    if not 1 <= strength <= MAX_STRENGTH:
+        raise ValueError(f"Kekuatan di luar jangkauan: {strength}")
+    return CLASS_NAMES[strength]
+
+
+def compare(hand_a: Sequence[int], hand_b: Sequence[int]) -> int:
+    """
+    Membandingkan dua tangan.
+
+    Returns:
+        1 jika hand_a lebih kuat, -1 jika hand_b lebih kuat, 0 jika seri.
+    """
+    a, b = evaluate(hand_a), evaluate(hand_b)
+    return (a > b) - (a < b)
+
+
+def rank_many(hands: Sequence[Sequence[int]], evaluate_ids=None) -> List[List[int]]:
+    """
+    Mengurutkan tangan beberapa pemain untuk showdown.
+
+    Setiap tangan dievaluasi tepat sekali, lalu indeks pemain diurutkan
+    menurut kekuatannya dan yang seri dikelompokkan.
+
+    Args:
+        hands: Tangan setiap pemain, masing-masing berupa id kartu.
+        evaluate_ids: Fungsi penilai lain (mis. WildEvaluator.evaluate); default evaluate().
+
+    Returns:
+        Kelompok indeks pemain dari yang terkuat; kelompok pertama adalah
+        pemenang (lebih dari satu jika seri), mis. [[2], [0, 3], [1]].
+    """
+    strengths = [(evaluate_ids or evaluate)(hand) for hand in hands]
+    order = sorted(range(len(hands)), key=strengths.__getitem__, reverse=True)
+
+    groups: List[List[int]] = []
+    previous = None
+    for index in order:
+        if strengths[index] != previous:
+            groups.append([])
+            previous = strengths[index]
+        groups[-1].append(index)
+    for group in groups:
+        group.sort()
+    return groups
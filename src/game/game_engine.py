@@ -1,9 +1,15 @@
-from typing import Dict, Optional, List
-from collections import Counter
+import random
+from typing import Dict, Optional, List, Union
 from enum import IntEnum
 from .card import Card
 from .deck import Deck
+from .equity import EquityResult, calculate_equity
+from .evaluator import CLASS_NAMES, JOKER_IDS, card_ids, evaluate, rank_many
 from .hand import Hand
+from .history import HandHistoryWriter
+from .paytable import DEFAULT_PAYTABLE, Paytable, get_paytable
+from .tracker import DeckTracker, DrawOdds
+from .wild import WildEvaluator, WildRules
 
 
 # Mendefinisikan peringkat tangan poker sebagai enumerasi integer.
@@ -11,6 +17,8 @@ class HandRank(IntEnum):
     """
     Enumerasi untuk peringkat tangan poker, diurutkan dari terlemah hingga terkuat.
     Nilai integer mewakili skor untuk setiap jenis tangan.
+    Skor yang dipakai saat bermain berasal dari paytable "default" di paytables.json,
+    yang berisi nilai yang sama.
     """
     HIGH_CARD = 10
     ONE_PAIR = 20
@@ -22,6 +30,7 @@ class HandRank(IntEnum):
     FOUR_OF_A_KIND = 80
     STRAIGHT_FLUSH = 90
     ROYAL_FLUSH = 100
+    FIVE_OF_A_KIND = 110  # Hanya mungkin dengan kartu liar
 
 
 # Kelas utama yang mengatur logika permainan kartu.
@@ -33,24 +42,56 @@ class GameEngine:
     # String yang mewakili peringkat kartu dalam urutan menaik.
     RANKS = "23456789TJQKA"
 
-    def __init__(self):
+    def __init__(self, wild_rules: Optional[WildRules] = None, paytable: Union[str, Paytable] = DEFAULT_PAYTABLE,
+                 seed: Optional[int] = None):
         """
         Menginisialisasi mesin permainan, menyiapkan dek, tangan, skor,
         dan tumpukan buangan untuk sesi permainan baru.
+        Args:
+            wild_rules: Aturan kartu liar (mis. game.wild.DEUCES_WILD); None untuk poker biasa.
+            paytable: Paytable untuk menilai tangan (kunci di paytables.json atau Paytable).
+            seed: Seed semua kocokan dek; seed yang sama memberi urutan kartu yang sama.
+                Jika None, seed acak dipilih (dan tetap dapat dibaca di self.seed).
         """
-        self.deck = Deck()  # Dek kartu untuk permainan.
+        self.history: Optional[HandHistoryWriter] = None  # Log riwayat tangan (opsional).
+        self.set_paytable(paytable)
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)  # Dipakai oleh setiap dek milik mesin ini.
+        self.wild_rules = wild_rules
+        self.wild_evaluator = WildEvaluator(wild_rules) if wild_rules else None
+        self.deck = Deck(self.rng)  # Dek kartu untuk permainan.
         self.hand: Optional[Hand] = None  # Tangan pemain saat ini.
         self.score = 0  # Total skor yang terkumpul dari semua ronde.
         self.discard_pile: List[Card] = []  # Kartu yang dibuang oleh pemain.
         self.current_hand_points = 0  # Skor yang diperoleh dari tangan saat ini saja.
+        self.community_cards: List[Card] = []  # Kartu bersama (varian seperti Hold'em), kosong untuk 5 kartu biasa.
+        self.tracker = DeckTracker(wild_rules)  # Jumlah peringkat dan suit yang tersisa di dek.
+
+    def prepare_deck(self, assets_path: str) -> Deck:
+        """
+        Menyiapkan dek baru yang sudah dikocok tanpa memakainya, sehingga
+        kartu tangan berikutnya dapat diketahui (dan gambarnya dimuat) lebih awal.
+        Args:
+            assets_path: Path folder tempat gambar kartu disimpan.
+        Returns:
+            Dek 52 kartu yang sudah diacak.
+        """
+        deck = Deck(self.rng)  # Membuat instance Deck baru dengan sumber acak milik mesin.
+        # Mengisi dengan 52 kartu standar, ditambah joker jika variannya memakai joker.
+        deck.create_standard_deck(assets_path, self.wild_rules.jokers if self.wild_rules else 0)
+        deck.shuffle()  # Mengacak urutan kartu.
+        return deck
 
-    def initialize_game(self, assets_path: str):
-        self.deck = Deck()  # Membuat instance Deck baru.
-        self.deck.create_standard_deck(assets_path)  # Mengisi dengan 52 kartu standar.
-        self.deck.shuffle()  # Mengacak urutan kartu.
+    def initialize_game(self, assets_path: str, deck: Optional[Deck] = None):
+        # Memakai dek yang sudah disiapkan dengan prepare_deck() jika ada.
+        self.deck = deck if deck is not None else self.prepare_deck(assets_path)
+        self.tracker.reset(self.deck.cards)  # Satu-satunya pemindaian dek; selanjutnya diperbarui per kartu.
+        if self.history:
+            self.history.new_deck()
         self.hand = None  # Mengosongkan tangan pemain.
         self.current_hand_points = 0  # Mengatur ulang poin untuk tangan baru.
         self.discard_pile = []  # Mengosongkan tumpukan buangan.
+        self.community_cards = []  # Mengosongkan kartu bersama.
         # Total skor (self.score) sengaja tidak direset untuk akumulasi antar sesi.
 
     def deal_hand(self, num_cards=5) -> Hand:
@@ -66,11 +107,15 @@ class GameEngine:
         if len(self.deck.cards) < num_cards:
             # Jika tidak, tambahkan kartu yang dibuang kembali ke dalam dek.
             self.deck.cards.extend(self.discard_pile)
+            self.tracker.add(self.discard_pile)
             self.discard_pile = []  # Mengosongkan tumpukan buangan.
             self.deck.shuffle()  # Mengacak ulang dek.
 
         # Membagikan jumlah kartu yang diminta dari dek.
         cards = self.deck.deal(num_cards)
+        self.tracker.remove(cards)
+        if self.history:
+            self.history.deal(cards)
         self.hand = Hand(cards)  # Membuat Hand baru dengan kartu-kartu ini.
         self.current_hand_points = 0  # Mengatur ulang skor untuk tangan baru ini.
         return self.hand
@@ -88,6 +133,9 @@ class GameEngine:
         if not self.hand:
             return []
 
+        if self.history:
+            self.history.discard([i for i in card_indices if 0 <= i < len(self.hand.cards)])
+
         discarded = []
         # Mengurutkan indeks secara terbalik untuk menghindari masalah dengan pengindeksan ulang list setelah menghapus item.
         for i in sorted(card_indices, reverse=True):
@@ -97,6 +145,7 @@ class GameEngine:
                 discarded.append(self.hand.cards.pop(i))
 
         # Menambahkan semua kartu yang dibuang ke tumpukan buangan permainan.
+        # Kartu buangan tidak kembali ke dek, jadi tracker tidak berubah sampai didaur ulang.
         self.discard_pile.extend(discarded)
         return discarded
 
@@ -108,77 +157,148 @@ class GameEngine:
         Returns:
             Daftar objek Card baru yang diambil dari dek.
         """
-        return self.deck.deal(num_cards)
+        cards = self.deck.deal(num_cards)
+        self.tracker.remove(cards)
+        if self.history:
+            self.history.draw(cards)
+        return cards
+
+    def deal_community(self, num_cards: int) -> List[Card]:
+        """
+        Membuka sejumlah kartu bersama dari atas dek (flop, turn, river).
+        Args:
+            num_cards: Jumlah kartu bersama yang akan dibuka.
+        Returns:
+            Daftar kartu bersama yang baru dibuka.
+        """
+        cards = self.deck.deal(num_cards)
+        self.tracker.remove(cards)
+        if self.history:
+            self.history.community(cards)
+        self.community_cards.extend(cards)
+        return cards
 
     def evaluate_hand(self) -> Dict:
         """
         Mengevaluasi tangan pemain saat ini (5 kartu) untuk menentukan peringkat poker dan skornya.
+        Jika ada kartu bersama, lima kartu terbaik dari tangan dan kartu bersama (5-7 kartu) yang dinilai.
         Memperbarui skor tangan saat ini dan total skor yang terkumpul.
         Returns:
-            Kamus yang berisi jenis tangan (misalnya, "Full House") dan skornya.
+            Kamus yang berisi jenis tangan (misalnya, "Full House"), skornya menurut paytable,
+            dan kekuatan lengkapnya ("strength").
+        """
+        # Tanpa kartu bersama, tangan harus berisi tepat 5 kartu untuk dievaluasi.
+        if not self.hand or (not self.community_cards and len(self.hand.cards) != 5):
+            return {"type": "Tangan Tidak Valid", "score": 0}
+
+        return self.evaluate_best_hand(self.hand.cards + self.community_cards)
+
+    def evaluate_best_hand(self, cards: List[Card]) -> Dict:
+        """
+        Menilai lima kartu terbaik dari 5-7 kartu (mis. 2 kartu tangan + 5 kartu bersama)
+        dengan evaluator 7 kartu (atau evaluator kartu liar jika varian memakainya),
+        lalu memperbarui skor seperti evaluate_hand.
+        Args:
+            cards: 5 sampai 7 objek Card.
+        Returns:
+            Kamus berisi jenis tangan, skornya, dan kekuatan lengkapnya ("strength").
         """
-        # Tangan harus ada dan berisi tepat 5 kartu untuk dievaluasi.
-        if not self.hand or len(self.hand.cards) != 5:
+        if not 5 <= len(cards) <= 7:
             return {"type": "Tangan Tidak Valid", "score": 0}
 
-        # Normalisasi nilai dan suit kartu untuk mempermudah pemrosesan.
-        normalized_values = []
-        normalized_suits = []
-
-        for card in self.hand.cards:
-            # Standarisasi representasi nilai kartu (misalnya, menghapus '0', '10' menjadi 'T').
-            value = card.value.lstrip('0') if card.value[0] == '0' else card.value
-            value = 'T' if value == '10' else value
-            normalized_values.append(value)
-            # Standarisasi representasi suit ke huruf pertama, huruf besar.
-            normalized_suits.append(card.suit[0].upper())
-
-        # Menghitung kemunculan setiap peringkat dan suit.
-        rank_counts = Counter(normalized_values)
-        suit_counts = Counter(normalized_suits)
-        # Mendapatkan daftar terurut berapa kali setiap peringkat muncul (misalnya, [3, 1, 1] untuk three of a kind).
-        counts = sorted(rank_counts.values(), reverse=True)
-
-        # Memeriksa flush (semua kartu memiliki suit yang sama).
-        is_flush = len(suit_counts) == 1
-
-        # Memeriksa straight (lima kartu berurutan).
-        indices = [self.RANKS.index(val) for val in normalized_values]
-        indices = sorted(set(indices)) # Menggunakan set untuk menangani pasangan dengan benar
-        is_straight = len(indices) == 5 and (indices[-1] - indices[0] == 4)
-        # Kasus khusus untuk straight Ace-rendah (A, 2, 3, 4, 5).
-        if set(normalized_values) == {'A', '2', '3', '4', '5'}:
-            is_straight = True
-            # Mengurutkan ulang indeks untuk Ace-rendah agar dievaluasi dengan benar sebagai straight.
-            indices = [0, 1, 2, 3, 12]
-
-        # Menentukan peringkat tangan berdasarkan pemeriksaan di atas, dari terbaik hingga terburuk.
-        if is_flush and set(normalized_values) == {'A', 'K', 'Q', 'J', 'T'}:
-            result = {"type": "Royal Flush", "score": HandRank.ROYAL_FLUSH}
-        elif is_flush and is_straight:
-            result = {"type": "Straight Flush", "score": HandRank.STRAIGHT_FLUSH}
-        elif 4 in counts:
-            result = {"type": "Four of a Kind", "score": HandRank.FOUR_OF_A_KIND}
-        elif 3 in counts and 2 in counts:
-            result = {"type": "Full House", "score": HandRank.FULL_HOUSE}
-        elif is_flush:
-            result = {"type": "Flush", "score": HandRank.FLUSH}
-        elif is_straight:
-            result = {"type": "Straight", "score": HandRank.STRAIGHT}
-        elif 3 in counts:
-            result = {"type": "Three of a Kind", "score": HandRank.THREE_OF_A_KIND}
-        elif counts.count(2) == 2:
-            result = {"type": "Two Pair", "score": HandRank.TWO_PAIR}
-        elif 2 in counts:
-            result = {"type": "One Pair", "score": HandRank.ONE_PAIR}
-        else:
-            result = {"type": "High Card", "score": HandRank.HIGH_CARD}
+        strength = self.hand_strength(cards)
+        # Skor adalah satu akses list pada paytable yang sudah dikompilasi.
+        points = self.paytable.scores[strength]
 
         # Memperbarui skor permainan dengan hasil dari tangan ini.
-        self.current_hand_points = result['score']
+        self.current_hand_points = points
         self.score += self.current_hand_points
+        if self.history:
+            self.history.evaluate(strength, points)
+        return {"type": CLASS_NAMES[strength], "score": points, "strength": strength}
+
+    def draw_odds(self, discard_indices: List[int]) -> DrawOdds:
+        """
+        Menghitung peluang setiap jenis tangan jika kartu pada indeks tertentu dibuang
+        dan diganti dari dek, beserta skor rata-ratanya menurut paytable aktif.
+        Args:
+            discard_indices: Indeks kartu di tangan yang akan dibuang.
+        Returns:
+            DrawOdds dari keadaan dek saat ini.
+        """
+        hold = [card for i, card in enumerate(self.hand.cards) if i not in discard_indices] if self.hand else []
+        return self.tracker.odds(hold, self.paytable.scores)
+
+    def set_paytable(self, paytable: Union[str, Paytable]):
+        """
+        Mengganti paytable yang dipakai untuk menilai tangan berikutnya.
+        Tabel evaluator tidak perlu dibangun ulang.
+        Args:
+            paytable: Kunci varian di paytables.json (mis. "jacks_or_better") atau Paytable.
+        """
+        self.paytable = get_paytable(paytable) if isinstance(paytable, str) else paytable
+        if self.history:
+            self.history.paytable(self.paytable.key)
+
+    def attach_history(self, history: Optional[HandHistoryWriter]):
+        """
+        Mencatat setiap operasi permainan berikutnya ke log riwayat tangan (lihat game.history).
+        Args:
+            history: HandHistoryWriter yang terbuka, atau None untuk berhenti mencatat.
+        """
+        self.history = history
+        if history:
+            history.session(self.seed, self.wild_rules, self.paytable.key)
+
+    def hand_strength(self, cards: List[Card]) -> int:
+        """
+        Menghitung kekuatan lengkap sebuah tangan, termasuk kicker.
+        Args:
+            cards: 5 sampai 7 objek Card; dari 6-7 kartu dipakai lima kartu terbaik.
+        Returns:
+            Kekuatan 1-7462 (lihat game.evaluator); makin besar makin kuat.
+        """
+        if self.wild_evaluator:
+            return self.wild_evaluator.evaluate(card_ids(cards))
+        return evaluate(card_ids(cards))
+
+    def showdown(self, hands: List[Hand]) -> List[List[int]]:
+        """
+        Menentukan urutan pemenang dari tangan beberapa pemain.
+        Berbeda dengan evaluate_hand, dua One Pair dibedakan oleh peringkat pasangan dan kickernya.
+        Args:
+            hands: Tangan setiap pemain, masing-masing berisi lima kartu (atau kurang,
+                jika dilengkapi dengan kartu bersama hingga 5-7 kartu).
+        Returns:
+            Kelompok indeks pemain dari yang terkuat; kelompok pertama berisi pemenang
+            (lebih dari satu pemain jika seri).
+        """
+        evaluate_ids = self.wild_evaluator.evaluate if self.wild_evaluator else None
+        return rank_many([card_ids(hand.cards + self.community_cards) for hand in hands], evaluate_ids)
 
-        return result
+    def equity(self, hands: List[Hand], board_size: Optional[int] = None, seed: Optional[int] = None) -> EquityResult:
+        """
+        Menghitung peluang menang setiap pemain dari kartu yang sudah diketahui.
+        Kartu bersama yang terbuka ikut dihitung, dan kartu di tumpukan buangan dianggap sudah mati.
+        Args:
+            hands: Tangan setiap pemain.
+            board_size: Jumlah kartu bersama saat showdown (0 untuk poker 5 kartu biasa, 5 untuk Hold'em).
+                Jika None: 0 bila belum ada kartu bersama, selain itu paling sedikit 5.
+            seed: Seed Monte Carlo agar hasilnya dapat diulang.
+        Returns:
+            EquityResult berisi peluang menang, seri, dan equity setiap pemain.
+        """
+        if board_size is None:
+            board_size = max(len(self.community_cards), 5) if self.community_cards else 0
+        return calculate_equity(
+            [card_ids(hand.cards) for hand in hands],
+            board=card_ids(self.community_cards),
+            dead=card_ids(self.discard_pile),
+            board_size=board_size,
+            seed=seed,
+            evaluate_ids=self.wild_evaluator.evaluate if self.wild_evaluator else None,
+            deck_ids=list(range(52)) + list(JOKER_IDS.values())[:self.wild_rules.jokers] if self.wild_rules else None,
+        )
 
     def reset_score(self):
         """
@@ -0,0 +1,384 @@
+import mmap
+import os
+import zlib
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from .evaluator import VALUE_TO_RANK, card_ids
+from .wild import WildRules
+
+
+# Log riwayat tangan biner yang hanya ditambah (append-only), untuk audit dan replay.
+#
+# Isi file: header (MAGIC + versi), lalu rekaman berurutan. Setiap rekaman adalah
+# panjang payload (varint) diikuti payload: satu byte jenis rekaman dan datanya.
+# Kartu ditulis sebagai id kartu satu byte (lihat game.evaluator) dan angka
+# sebagai varint (LEB128). Setiap CHECKPOINT_INTERVAL rekaman, dan saat log
+# ditutup, ditulis rekaman CHECKPOINT berisi CRC32 semua byte sejak checkpoint
+# sebelumnya (atau sejak awal sesi), sehingga kerusakan file dapat dideteksi.
+#
+# Satu sesi dimulai dengan rekaman SESSION (seed dan aturan varian); semua
+# rekaman setelahnya sampai SESSION berikutnya milik sesi itu. Karena dek dikocok
+# dengan random.Random(seed), replay() dapat membangun ulang sesi dengan
+# menjalankan ulang operasinya dan memeriksa kartunya sama dengan log.
+
+MAGIC = b"PIPSHH"
+VERSION = 1
+HEADER = MAGIC + bytes([VERSION])
+CHECKPOINT_INTERVAL = 64  # Rekaman di antara dua checkpoint
+MAX_TORN_TAIL = 4096  # Byte terpotong terbanyak di akhir file yang dibuang saat dibuka lagi
+
+# Jenis rekaman
+SESSION = 1  # seed, jumlah joker, peringkat liar, kunci paytable
+NEW_DECK = 2  # initialize_game: dek baru dikocok
+DEAL = 3  # Kartu tangan yang dibagikan
+DISCARD = 4  # Mask indeks kartu yang dibuang (bit i = indeks i)
+DRAW = 5  # Kartu pengganti yang diambil
+COMMUNITY = 6  # Kartu bersama yang dibuka
+EVALUATE = 7  # Kekuatan dan skor tangan
+PAYTABLE = 8  # Paytable diganti
+CHECKPOINT = 9  # CRC32 sejak checkpoint sebelumnya
+
+RECORD_NAMES = {
+    SESSION: "session", NEW_DECK: "new_deck", DEAL: "deal", DISCARD: "discard", DRAW: "draw",
+    COMMUNITY: "community", EVALUATE: "evaluate", PAYTABLE: "paytable", CHECKPOINT: "checkpoint",
+}
+
+# Set ke path file untuk mencatat setiap tangan di GameUI.
+ENV_VAR = "PIPS_HAND_HISTORY"
+
+
+class HistoryError(Exception):
+    """Dilempar jika log rusak (checksum salah) atau replay tidak cocok dengan log."""
+
+
+def encode_varint(value: int) -> bytes:
+    """Mengodekan bilangan bulat tidak negatif sebagai varint LEB128."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(data, offset: int) -> Tuple[int, int]:
+    """
+    Membaca varint dari `data` mulai di `offset`.
+
+    Returns:
+        (nilai, offset setelah varint).
+
+    Raises:
+        IndexError: Jika data berakhir di tengah varint.
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _text(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return encode_varint(len(raw)) + raw
+
+
+def _read_text(payload, offset: int) -> Tuple[str, int]:
+    length, offset = decode_varint(payload, offset)
+    return bytes(payload[offset:offset + length]).decode("utf-8"), offset + length
+
+
+class HandHistoryWriter:
+    """Menulis rekaman ke akhir file log; dipasang ke GameEngine dengan attach_history()."""
+
+    def __init__(self, path: str, checkpoint_interval: int = CHECKPOINT_INTERVAL):
+        """
+        Args:
+            path: File log; dibuat jika belum ada, dan rekaman baru ditambahkan di akhir.
+            checkpoint_interval: Rekaman di antara dua checkpoint.
+
+        Raises:
+            HistoryError: Jika file sudah ada tetapi bukan log riwayat tangan.
+        """
+        self.path = path
+        self.checkpoint_interval = checkpoint_interval
+        self.file = open(path, "ab")
+        try:
+            self._repair()
+        except BaseException:
+            self.file.close()
+            raise
+        self._crc = 0
+        self._since_checkpoint = 0
+
+    def _repair(self):
+        # Rekaman terakhir yang terpotong (aplikasi berhenti di tengah penulisan)
+        # dibuang sebelum menambah rekaman baru; jika tidak, scanner berhenti di
+        # sana dan semua sesi setelahnya tidak bisa dibaca
+        size = self.file.tell()
+        if size < len(HEADER):
+            with open(self.path, "rb") as f:
+                if not HEADER.startswith(f.read()):
+                    raise HistoryError(f"{self.path} bukan log riwayat tangan")
+            self.file.truncate(0)
+            self.file.write(HEADER)
+            return
+        with HistoryScanner(self.path, verify=False) as scanner:
+            for _ in scanner:
+                pass
+            end = scanner.end
+        if size - end > MAX_TORN_TAIL:
+            # Lebih dari satu rekaman yang terpotong: kerusakan di tengah file, jangan dibuang
+            raise HistoryError(f"{self.path} rusak di offset {end}; {size - end} byte setelahnya tidak terbaca")
+        if end < size:
+            self.file.truncate(end)
+
+    @classmethod
+    def from_env(cls, environ) -> Optional["HandHistoryWriter"]:
+        """Membuka log di path dari variabel lingkungan ENV_VAR, atau None jika tidak diatur."""
+        path = environ.get(ENV_VAR)
+        return cls(path) if path else None
+
+    def _write(self, kind: int, data: bytes = b""):
+        record = encode_varint(len(data) + 1) + bytes([kind]) + data
+        self.file.write(record)
+        self._crc = zlib.crc32(record, self._crc)
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= self.checkpoint_interval:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Menulis CRC32 rekaman sejak checkpoint terakhir."""
+        if self._since_checkpoint:
+            crc = self._crc.to_bytes(4, "little")
+            self.file.write(encode_varint(5) + bytes([CHECKPOINT]) + crc)
+            self._crc = 0
+            self._since_checkpoint = 0
+
+    def session(self, seed: int, wild_rules: Optional[WildRules], paytable_key: str):
+        """Memulai sesi baru; checksum dihitung ulang mulai dari rekaman ini."""
+        # Sisa rekaman tanpa checkpoint (mis. dari proses yang berhenti mendadak) tidak
+        # ikut checksum sesi ini
+        self.checkpoint()
+        self._crc = 0
+        jokers = wild_rules.jokers if wild_rules else 0
+        wild_ranks = sorted(wild_rules.wild_ranks) if wild_rules else []
+        self._write(
+            SESSION,
+            encode_varint(seed) + bytes([jokers, len(wild_ranks)] + wild_ranks) + _text(paytable_key),
+        )
+
+    def new_deck(self):
+        self._write(NEW_DECK)
+
+    def deal(self, cards):
+        self._write(DEAL, bytes(card_ids(cards)))
+
+    def discard(self, indices):
+        self._write(DISCARD, encode_varint(sum(1 << i for i in set(indices))))
+
+    def draw(self, cards):
+        self._write(DRAW, bytes(card_ids(cards)))
+
+    def community(self, cards):
+        self._write(COMMUNITY, bytes(card_ids(cards)))
+
+    def evaluate(self, strength: int, score: int):
+        self._write(EVALUATE, encode_varint(strength) + encode_varint(score))
+
+    def paytable(self, key: str):
+        self._write(PAYTABLE, _text(key))
+
+    def flush(self):
+        """Menulis checkpoint dan memastikan semua rekaman sampai ke file."""
+        self.checkpoint()
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+class HistoryScanner:
+    """
+    Membaca rekaman log secara berurutan lewat memory map, dengan memori tetap
+    berapa pun ukuran filenya.
+
+    Iterasi menghasilkan (offset, jenis, payload) dengan payload sebagai
+    memoryview tanpa salinan; payload hanya berlaku selama scanner terbuka.
+    Checksum diperiksa di setiap CHECKPOINT; rekaman setelah checkpoint terakhir
+    dihasilkan tanpa diperiksa. Rekaman terakhir yang terpotong
+    (mis. aplikasi berhenti di tengah penulisan) mengakhiri iterasi dan
+    menandai `truncated`; `end` adalah offset setelah rekaman utuh terakhir.
+    """
+
+    def __init__(self, path: str, verify: bool = True):
+        self.path = path
+        self.verify = verify
+        self.truncated = False
+        self.end = len(HEADER)
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        if self._map[:len(MAGIC)] != MAGIC or size < len(HEADER):
+            self.close()
+            raise HistoryError(f"{path} bukan log riwayat tangan")
+        if self._map[len(MAGIC)] != VERSION:
+            self.close()
+            raise HistoryError(f"Versi log {self._map[len(MAGIC)]} tidak didukung")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __iter__(self) -> Iterator[Tuple[int, int, memoryview]]:
+        data = self._map
+        view = memoryview(data)
+        size = len(data)
+        offset = len(HEADER)
+        checked = offset  # Awal byte yang belum diperiksa checksum-nya
+        verify = self.verify
+        self.truncated = False
+        self.end = offset
+
+        while offset < size:
+            length = data[offset]
+            if length < 0x80:
+                start = offset + 1  # Hampir semua rekaman lebih pendek dari 128 byte
+            else:
+                try:
+                    length, start = decode_varint(data, offset)
+                except IndexError:
+                    self.truncated = True
+                    return
+            end = start + length
+            if length == 0 or end > size:
+                self.truncated = True
+                return
+
+            kind = data[start]
+            if kind == SESSION:
+                checked = offset  # Setiap sesi memulai checksum baru
+            if kind == CHECKPOINT:
+                if verify and zlib.crc32(view[checked:offset]) != int.from_bytes(data[start + 1:end], "little"):
+                    raise HistoryError(f"Checksum salah untuk rekaman di offset {checked}-{offset}")
+                checked = end
+            else:
+                yield offset, kind, view[start + 1:end]
+            offset = self.end = end
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # Masih ada memoryview payload; map ditutup saat dibebaskan
+        self._file.close()
+
+
+@dataclass
+class SessionInfo:
+    """Isi rekaman SESSION."""
+    offset: int  # Posisi rekaman SESSION di file
+    seed: int
+    wild_rules: Optional[WildRules]
+    paytable: str
+
+
+def parse_session(offset: int, payload) -> SessionInfo:
+    """Membaca payload rekaman SESSION."""
+    seed, position = decode_varint(payload, 0)
+    jokers = payload[position]
+    wild_count = payload[position + 1]
+    wild_ranks = payload[position + 2:position + 2 + wild_count]
+    paytable, _ = _read_text(payload, position + 2 + wild_count)
+
+    rank_to_value = {rank: value for value, rank in VALUE_TO_RANK.items()}
+    wild_values = frozenset(rank_to_value[rank] for rank in wild_ranks)
+    wild_rules = WildRules(wild_values=wild_values, jokers=jokers) if jokers or wild_values else None
+    return SessionInfo(offset=offset, seed=seed, wild_rules=wild_rules, paytable=paytable)
+
+
+def sessions(path: str) -> Iterator[SessionInfo]:
+    """Menghasilkan SessionInfo setiap sesi di log, berurutan."""
+    with HistoryScanner(path) as scanner:
+        for offset, kind, payload in scanner:
+            if kind == SESSION:
+                yield parse_session(offset, payload)
+
+
+def replay(path: str, session: int = 0, assets_path: str = ""):
+    """
+    Membangun ulang sebuah sesi dengan menjalankan ulang operasinya pada GameEngine baru.
+
+    Setiap kartu yang dibagikan atau diambil, dan setiap hasil evaluasi, dibandingkan
+    dengan log; kartu pengganti dimasukkan ke tangan seperti di GameUI.
+
+    Args:
+        path: File log.
+        session: Nomor sesi (0 untuk sesi pertama) di log.
+        assets_path: Path folder gambar kartu untuk objek Card hasil replay.
+
+    Returns:
+        (GameEngine pada akhir sesi, list hasil evaluate_hand setiap tangan).
+
+    Raises:
+        HistoryError: Jika sesi tidak ada atau hasil replay berbeda dengan log.
+    """
+    from .game_engine import GameEngine  # game_engine mengimpor modul ini
+
+    engine = None
+    results: List[dict] = []
+    index = -1
+    with HistoryScanner(path) as scanner:
+        for offset, kind, payload in scanner:
+            if kind == SESSION:
+                index += 1
+                if index > session:
+                    break
+                if index == session:
+                    info = parse_session(offset, payload)
+                    engine = GameEngine(info.wild_rules, info.paytable, seed=info.seed)
+                continue
+            if engine is None:
+                continue
+
+            if kind == NEW_DECK:
+                engine.initialize_game(assets_path)
+            elif kind == DEAL:
+                _expect(offset, card_ids(engine.deal_hand(len(payload)).cards), payload)
+            elif kind == DISCARD:
+                mask, _ = decode_varint(payload, 0)
+                engine.discard_cards([i for i in range(mask.bit_length()) if mask >> i & 1])
+            elif kind == DRAW:
+                cards = engine.draw_cards(len(payload))
+                _expect(offset, card_ids(cards), payload)
+                engine.hand.cards.extend(cards)
+            elif kind == COMMUNITY:
+                _expect(offset, card_ids(engine.deal_community(len(payload))), payload)
+            elif kind == EVALUATE:
+                strength, position = decode_varint(payload, 0)
+                score, _ = decode_varint(payload, position)
+                result = engine.evaluate_hand()
+                if (result.get("strength"), result["score"]) != (strength, score):
+                    raise HistoryError(f"Evaluasi di offset {offset} berbeda: {result} != {(strength, score)}")
+                results.append(result)
+            elif kind == PAYTABLE:
+                engine.set_paytable(_read_text(payload, 0)[0])
+
+    if engine is None:
+        raise HistoryError(f"Sesi {session} tidak ada di {path}")
+    return engine, results
+
+
+def _expect(offset: int, actual: List[int], payload):
+    if bytes(actual) != bytes(payload):
+        raise HistoryError(f"Kartu di offset {offset} berbeda: {list(actual)} != {list(payload)}")
@@ -0,0 +1,125 @@
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .evaluator import CLASS_NAMES, MAX_STRENGTH, PRIMARY_RANK, RANKS
+
+
+# Tabel pembayaran (paytable) untuk berbagai varian, dimuat dari file JSON.
+#
+# Setiap varian dikompilasi menjadi satu list datar yang diindeks dengan kekuatan
+# tangan (lihat game.evaluator), jadi menilai sebuah tangan cukup satu akses list.
+# Aturan per peringkat (mis. pasangan Jack ke atas, bonus quad As) sudah
+# dimasukkan saat kompilasi karena setiap kekuatan mewakili satu susunan peringkat.
+# Mengganti paytable tidak membangun ulang tabel evaluator.
+
+PAYTABLES_PATH = Path(__file__).with_name("paytables.json")
+PAYTABLES_VERSION = 1
+DEFAULT_PAYTABLE = "default"
+
+_cache: Dict[str, Dict[str, "Paytable"]] = {}  # Path file -> paytable yang sudah dikompilasi
+_cache_lock = threading.Lock()
+
+
+class Paytable:
+    """Satu paytable yang sudah dikompilasi: scores[kekuatan] = skor."""
+
+    def __init__(self, key: str, name: str, scores: List[int]):
+        self.key = key
+        self.name = name
+        self.scores = scores
+
+    def score(self, strength: int) -> int:
+        """Mengembalikan skor sebuah kekuatan tangan."""
+        return self.scores[strength]
+
+    def __repr__(self) -> str:
+        return f"Paytable({self.key!r})"
+
+
+def _parse_ranks(spec: str) -> List[int]:
+    # "A" -> [12], "2-4" -> [0, 1, 2], "J-A" -> [9, 10, 11, 12]
+    spec = spec.replace("10", "T")
+    if "-" in spec:
+        low, high = spec.split("-")
+        return list(range(RANKS.index(low), RANKS.index(high) + 1))
+    return [RANKS.index(spec)]
+
+
+def compile_paytable(key: str, definition: Dict) -> Paytable:
+    """
+    Mengompilasi definisi paytable menjadi list skor datar.
+
+    Args:
+        key: Kunci varian, mis. "jacks_or_better".
+        definition: Kamus dengan "name" dan "payouts". Setiap payout berupa angka,
+            atau kamus rentang peringkat utama -> angka (mis. {"J-A": 1}). Jenis
+            tangan dan peringkat yang tidak disebut bernilai 0.
+
+    Raises:
+        ValueError: Jika nama jenis tangan atau peringkat tidak dikenal.
+    """
+    known = set(CLASS_NAMES[1:])
+    by_class: Dict[str, List[int]] = {}
+    for hand_type, payout in definition["payouts"].items():
+        if hand_type not in known:
+            raise ValueError(f"Jenis tangan tidak dikenal di paytable {key!r}: {hand_type!r}")
+        per_rank = [0] * len(RANKS)
+        if isinstance(payout, dict):
+            for spec, amount in payout.items():
+                try:
+                    ranks = _parse_ranks(spec)
+                except ValueError:
+                    raise ValueError(f"Peringkat tidak dikenal di paytable {key!r}: {spec!r}") from None
+                for rank in ranks:
+                    per_rank[rank] = amount
+        else:
+            per_rank = [payout] * len(RANKS)
+        by_class[hand_type] = per_rank
+
+    zero = [0] * len(RANKS)
+    scores = [0] + [
+        by_class.get(CLASS_NAMES[strength], zero)[PRIMARY_RANK[strength]]
+        for strength in range(1, MAX_STRENGTH + 1)
+    ]
+    return Paytable(key, definition.get("name", key), scores)
+
+
+def load_paytables(path: Union[str, Path] = PAYTABLES_PATH, reload: bool = False) -> Dict[str, Paytable]:
+    """
+    Memuat dan mengompilasi semua paytable dari file JSON.
+
+    Hasilnya disimpan per file; reload=True membaca ulang file (mis. setelah diedit).
+
+    Raises:
+        OSError: Jika file tidak dapat dibaca.
+        ValueError: Jika isi atau versi file tidak valid.
+    """
+    key = str(Path(path).resolve())
+    with _cache_lock:
+        if not reload and key in _cache:
+            return _cache[key]
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != PAYTABLES_VERSION:
+        raise ValueError(f"Versi file paytable tidak didukung: {data.get('version')!r}")
+
+    paytables = {
+        name: compile_paytable(name, definition)
+        for name, definition in data["paytables"].items()
+    }
+    with _cache_lock:
+        _cache[key] = paytables
+    return paytables
+
+
+def get_paytable(name: str = DEFAULT_PAYTABLE, path: Optional[Union[str, Path]] = None) -> Paytable:
+    """
+    Mengembalikan paytable yang sudah dikompilasi berdasarkan kuncinya.
+
+    Raises:
+        KeyError: Jika varian tidak ada di file.
+    """
+    return load_paytables(path or PAYTABLES_PATH)[name]
@@ -0,0 +1,308 @@
+import random
+from bisect import bisect_right
+from typing import List, Optional, Sequence
+
+from .card import Card
+from .equity import EquityResult, calculate_equity
+from .evaluator import (
+    CLASS_NAMES, FIVE_OF_A_KIND_BASE, FLUSH_TABLE, PRIMES, PRODUCT_TABLE, SUITS, UNIQUE5_TABLE, card_id, evaluate_best,
+)
+
+
+# Sepatu (shoe) berisi beberapa dek sekaligus, mis. 6 atau 8 dek.
+#
+# Kartu yang tersisa tidak disimpan sebagai objek Card satu per satu, melainkan
+# sebagai jumlah per id kartu (52 slot). Pengambilan acak berbobot memakai
+# Fenwick tree di atas jumlah tersebut, jadi mengambil satu kartu cukup O(log 52)
+# tanpa perlu mengocok ratusan objek. Objek Card baru dibuat hanya saat kartu
+# benar-benar dibagikan.
+
+CARD_SLOTS = 52
+VALUES = ["02", "03", "04", "05", "06", "07", "08", "09", "10", "J", "Q", "K", "A"]  # Sesuai urutan peringkat
+
+
+def _plain_flushes():
+    # Semua flush biasa (bukan straight flush) sebagai (peringkat menurun, kekuatan), terurut
+    flushes = []
+    for mask in range(1 << 13):
+        if bin(mask).count("1") == 5 and CLASS_NAMES[FLUSH_TABLE[mask]] == "Flush":
+            ranks = tuple(rank for rank in range(12, -1, -1) if mask >> rank & 1)
+            flushes.append((ranks, FLUSH_TABLE[mask]))
+    flushes.sort()
+    return [ranks for ranks, _ in flushes], [strength for _, strength in flushes]
+
+
+_FLUSH_RANKS, _FLUSH_STRENGTHS = _plain_flushes()
+
+
+def _duplicate_flush(ranks: Sequence[int]) -> int:
+    """
+    Kekuatan flush dari lima kartu sesuit yang peringkatnya ada yang kembar
+    (mis. A A K Q J sekop dari sepatu beberapa dek).
+
+    Tabel flush hanya berisi lima peringkat berbeda, jadi dipakai flush biasa
+    terkuat yang tidak melebihi kartu-kartu ini bila dibandingkan kartu demi
+    kartu dari yang tertinggi (A A K Q J setara A K Q J 9), atau flush terlemah.
+    Peringkat kembar tidak pernah membentuk straight.
+    """
+    top = tuple(sorted(ranks, reverse=True)[:5])
+    index = bisect_right(_FLUSH_RANKS, top) - 1
+    return _FLUSH_STRENGTHS[max(index, 0)]
+
+
+def _evaluate5(ids: Sequence[int]) -> int:
+    counts = [0] * 13
+    for card in ids:
+        counts[card >> 2] += 1
+    top = max(counts)
+
+    if top == 5:
+        return FIVE_OF_A_KIND_BASE + 1 + (ids[0] >> 2)
+    suited = len({card & 3 for card in ids}) == 1
+    if top == 1:
+        mask = sum(1 << (card >> 2) for card in ids)
+        return FLUSH_TABLE[mask] if suited else UNIQUE5_TABLE[mask]
+    product = 1
+    for card in ids:
+        product *= PRIMES[card >> 2]
+    strength = PRODUCT_TABLE[product]
+    if suited:
+        # Lima kartu sesuit tetap flush walau ada peringkat kembar; hanya
+        # Full House dan Four of a Kind yang lebih kuat
+        strength = max(strength, _duplicate_flush([card >> 2 for card in ids]))
+    return strength
+
+
+def evaluate_shoe(ids: Sequence[int]) -> int:
+    """
+    Menghitung kekuatan tangan dari sepatu beberapa dek: lima kartu, atau lima
+    kartu terbaik dari 6-7 kartu.
+
+    Tabel game.evaluator menganggap setiap id kartu unik; di sini kartu kembar
+    (mis. dua As sekop) boleh muncul. Lima kartu sama peringkat dinilai sebagai
+    Five of a Kind, dan lima kartu sesuit selalu flush, juga jika ada peringkat
+    yang kembar (lihat _duplicate_flush).
+
+    Untuk 6-7 kartu dipakai evaluator.evaluate_best (satu pencarian memo, bukan
+    ke-21 subset): flush terbaik dari setiap suit yang berisi lima kartu atau
+    lebih dibandingkan dengan hasil terbaik tanpa flush, karena dengan kartu
+    kembar Four of a Kind atau Full House bisa muncul bersama flush.
+    """
+    if len(ids) == 5:
+        return _evaluate5(ids)
+    if not 5 < len(ids) <= 7:
+        raise ValueError(f"Evaluator membutuhkan 5-7 kartu, bukan {len(ids)}")
+
+    suit_ranks = [[], [], [], []]
+    rank_counts = [0] * 13
+    for card in ids:
+        suit_ranks[card & 3].append(card >> 2)
+        rank_counts[card >> 2] += 1
+
+    for rank in range(12, -1, -1):
+        if rank_counts[rank] >= 5:
+            return FIVE_OF_A_KIND_BASE + 1 + rank  # Mengalahkan tangan apa pun
+
+    best = 0
+    for suit, ranks in enumerate(suit_ranks):
+        if len(ranks) < 5:
+            continue
+        distinct = set(ranks)
+        if len(distinct) >= 5:
+            # Kartu kembar tidak menambah apa pun pada straight flush; cukup satu per peringkat
+            best = max(best, evaluate_best([rank * 4 + suit for rank in distinct]))
+        if len(distinct) < len(ranks):
+            best = max(best, _duplicate_flush(ranks))
+
+    # Tanpa flush hanya peringkat yang berpengaruh; suit diganti agar id unik dan
+    # tidak ada lima kartu sesuit (kartu sama peringkat berurutan, paling banyak empat)
+    ranks = sorted(card >> 2 for card in ids)
+    return max(best, evaluate_best([rank * 4 + i % 4 for i, rank in enumerate(ranks)]))
+
+
+# Lima kartu sesuit dengan peringkat kembar tetap flush (A A K Q J sekop, A A A K Q sekop)
+assert CLASS_NAMES[evaluate_shoe([51, 51, 47, 43, 39])] == "Flush"
+assert CLASS_NAMES[evaluate_shoe([51, 51, 51, 47, 43, 0, 5])] == "Flush"
+assert CLASS_NAMES[evaluate_shoe([51, 51, 51, 47, 47])] == "Full House"
+
+
+class _Fenwick:
+    """Fenwick tree (binary indexed tree) untuk jumlah awalan dan pencarian berbobot."""
+
+    def __init__(self, counts: List[int]):
+        self.size = len(counts)
+        self.tree = [0] * (self.size + 1)
+        for index, count in enumerate(counts):
+            self.add(index, count)
+        # Pangkat dua terbesar yang tidak melebihi ukuran, untuk pencarian biner
+        self.top = 1 << (self.size.bit_length() - 1)
+
+    def add(self, index: int, delta: int):
+        index += 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix(self, index: int) -> int:
+        """Jumlah slot 0 sampai index - 1."""
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, target: int) -> int:
+        """Slot tempat kartu ke-target (dihitung dari 0) berada."""
+        position = 0
+        step = self.top
+        while step:
+            next_position = position + step
+            if next_position <= self.size and self.tree[next_position] <= target:
+                position = next_position
+                target -= self.tree[next_position]
+            step >>= 1
+        return position
+
+
+class Shoe:
+    """
+    Mewakili beberapa dek kartu remi yang digabung (tanpa joker).
+
+    Kartu yang tersisa disimpan sebagai jumlah per id kartu (lihat game.evaluator),
+    sehingga komposisi sisa kartu dapat dibaca langsung oleh perhitungan peluang.
+    """
+
+    def __init__(self, assets_path: str, decks: int = 6, rng: Optional[random.Random] = None):
+        """
+        Args:
+            assets_path: Path folder tempat gambar kartu disimpan.
+            decks: Jumlah dek di dalam sepatu.
+            rng: Sumber angka acak; default random.Random() baru.
+        """
+        if decks < 1:
+            raise ValueError("Sepatu membutuhkan minimal satu dek")
+        self.assets_path = assets_path
+        self.decks = decks
+        self.rng = rng or random.Random()
+        self.discard_pile: List[Card] = []  # Tumpukan kartu yang telah dibuang
+        self._fill()
+
+    def _fill(self):
+        self.counts = [self.decks] * CARD_SLOTS  # Sisa kartu per id kartu
+        self.rank_counts = [self.decks * 4] * 13  # Sisa kartu per peringkat
+        self.suit_counts = [self.decks * 13] * 4  # Sisa kartu per suit
+        self.remaining = self.decks * CARD_SLOTS
+        self._tree = _Fenwick(self.counts)
+
+    def __len__(self) -> int:
+        return self.remaining
+
+    def count(self, card: int) -> int:
+        """Jumlah salinan id kartu `card` yang masih ada di sepatu."""
+        return self.counts[card]
+
+    def probability(self, card: int) -> float:
+        """Peluang kartu berikutnya adalah id kartu `card`."""
+        return self.counts[card] / self.remaining if self.remaining else 0.0
+
+    def remaining_ids(self) -> List[int]:
+        """
+        Semua kartu yang tersisa sebagai id, satu entri per salinan fisik.
+        Dapat diberikan ke calculate_equity(remaining_ids=...).
+        """
+        return [card for card, count in enumerate(self.counts) for _ in range(count)]
+
+    def equity(self, hands: Sequence[Sequence[int]], board: Sequence[int] = (), board_size: int = 5,
+               seed: Optional[int] = None) -> EquityResult:
+        """
+        Menghitung equity beberapa pemain dari komposisi sisa sepatu.
+
+        Kartu pemain dan kartu bersama dianggap sudah diambil dari sepatu
+        (dengan draw_ids() atau remove()).
+        """
+        return calculate_equity(
+            hands, board, board_size=board_size, seed=seed,
+            evaluate_ids=evaluate_shoe, remaining_ids=self.remaining_ids(),
+        )
+
+    def _take(self, card: int):
+        self.counts[card] -= 1
+        self.rank_counts[card >> 2] -= 1
+        self.suit_counts[card & 3] -= 1
+        self.remaining -= 1
+        self._tree.add(card, -1)
+
+    def remove(self, card: int):
+        """
+        Mengeluarkan satu salinan id kartu tertentu, mis. kartu yang terlihat di meja.
+
+        Raises:
+            ValueError: Jika tidak ada salinan yang tersisa.
+        """
+        if self.counts[card] <= 0:
+            raise ValueError(f"Kartu {card} sudah habis di sepatu")
+        self._take(card)
+
+    def draw_ids(self, num_cards: int) -> List[int]:
+        """
+        Mengambil sejumlah kartu acak, masing-masing dengan peluang sebanding
+        dengan jumlah salinannya yang tersisa.
+
+        Returns:
+            List id kartu; lebih pendek dari num_cards jika sepatu habis.
+        """
+        drawn = []
+        for _ in range(min(num_cards, self.remaining)):
+            card = self._tree.find(self.rng.randrange(self.remaining))
+            self._take(card)
+            drawn.append(card)
+        return drawn
+
+    def card(self, card: int) -> Card:
+        """Membuat objek Card untuk sebuah id kartu."""
+        suit = SUITS[card & 3]
+        value = VALUES[card >> 2]
+        return Card(suit, value, f"{self.assets_path}/cards_large/card_{suit}_{value}.png")
+
+    def deal(self, num_cards: int) -> List[Card]:
+        """
+        Membagikan sejumlah kartu acak, seperti Deck.deal().
+
+        Args:
+            num_cards: Jumlah kartu yang ingin dibagikan.
+
+        Returns:
+            List dari objek Card yang telah dibagikan.
+        """
+        return [self.card(card) for card in self.draw_ids(num_cards)]
+
+    def discard(self, card: Card):
+        """
+        Menambahkan satu kartu ke tumpukan buangan.
+
+        Args:
+            card: Objek Card yang ingin dibuang.
+        """
+        self.discard_pile.append(card)
+
+    def reset(self):
+        """Mengembalikan semua kartu (termasuk buangan) ke sepatu."""
+        self.discard_pile = []
+        self._fill()
+
+    def return_cards(self, cards: List[Card]):
+        """
+        Mengembalikan kartu tertentu ke sepatu, mis. tumpukan buangan tanpa reset penuh.
+
+        Raises:
+            ValueError: Jika semua salinan kartu itu sudah ada di sepatu.
+        """
+        for card in cards:
+            index = card_id(card)
+            if self.counts[index] >= self.decks:
+                raise ValueError(f"Sepatu sudah berisi semua salinan {card}")
+            self.counts[index] += 1
+            self.rank_counts[index >> 2] += 1
+            self.suit_counts[index & 3] += 1
+            self.remaining += 1
+            self._tree.add(index, 1)
@@ -0,0 +1,187 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .card import Card
+from .evaluator import CLASS_NAMES, FLUSH_TABLE, JOKER_IDS, PRIMES, PRODUCT_TABLE, UNIQUE5_TABLE, card_id
+from .wild import WildRules, best_strength
+
+
+# Pelacak sisa dek selama satu tangan berlangsung.
+#
+# Jumlah kartu per peringkat dan per suit di Deck.cards diperbarui setiap kali
+# kartu keluar atau kembali ke dek (O(1) per kartu), jadi dek tidak perlu
+# dipindai ulang. Peluang hasil akhir setelah membuang kartu dihitung dari
+# jumlah tersebut: kartu yang diambil dikelompokkan menurut peringkatnya
+# (paling banyak 6.188 kelompok untuk 5 kartu), dan banyaknya cara mengambil
+# setiap kelompok adalah hasil kali kombinasi jumlah per peringkat. Suit hanya
+# diperiksa jika flush masih mungkin.
+
+CARD_SLOTS = 52 + len(JOKER_IDS)
+HAND_SIZE = 5
+
+
+@dataclass
+class DrawOdds:
+    """Peluang hasil akhir tangan jika kartu `hold` dipertahankan dan sisanya diganti."""
+    draws: int  # Jumlah kartu yang diambil
+    outcomes: int  # Jumlah kemungkinan kartu pengganti
+    categories: Dict[str, float] = field(default_factory=dict)  # Jenis tangan -> peluang
+    expected_score: float = 0.0  # Skor rata-rata menurut paytable
+
+
+def _strength(ranks: List[int], suited: bool, wilds: int) -> int:
+    # Kekuatan lima kartu dari peringkatnya saja
+    if wilds:
+        return best_strength(ranks, suited, wilds)
+    if len(set(ranks)) == HAND_SIZE:
+        mask = sum(1 << rank for rank in ranks)
+        return FLUSH_TABLE[mask] if suited else UNIQUE5_TABLE[mask]
+    product = 1
+    for rank in ranks:
+        product *= PRIMES[rank]
+    return PRODUCT_TABLE[product]
+
+
+class DeckTracker:
+    """
+    Jumlah kartu per peringkat dan per suit yang masih ada di dek.
+
+    GameEngine memanggil remove()/add() setiap kali kartu keluar dari atau
+    kembali ke dek; odds() menjawab peluang hasil akhir dari jumlah tersebut.
+    """
+
+    def __init__(self, wild_rules: Optional[WildRules] = None):
+        self.wild_ranks = wild_rules.wild_ranks if wild_rules else frozenset()
+        self.present = [0] * CARD_SLOTS  # 1 jika id kartu ada di dek
+        self.rank_counts = [0] * 13  # Kartu per peringkat (tanpa joker)
+        self.suit_counts = [0] * 4  # Kartu per suit (tanpa joker)
+        self.jokers = 0
+        self.total = 0
+
+    def reset(self, cards: Iterable[Card]):
+        """Mengisi ulang dari isi dek yang baru, mis. setelah dek dikocok di awal tangan."""
+        self.present = [0] * CARD_SLOTS
+        self.rank_counts = [0] * 13
+        self.suit_counts = [0] * 4
+        self.jokers = 0
+        self.total = 0
+        self.add(cards)
+
+    def add(self, cards: Iterable[Card]):
+        """Mencatat kartu yang masuk kembali ke dek."""
+        for card in cards:
+            self._update(card_id(card), 1)
+
+    def remove(self, cards: Iterable[Card]):
+        """Mencatat kartu yang keluar dari dek (dibagikan atau diambil)."""
+        for card in cards:
+            self._update(card_id(card), -1)
+
+    def _update(self, card: int, delta: int):
+        self.present[card] += delta
+        self.total += delta
+        if card >= 52:
+            self.jokers += delta
+        else:
+            self.rank_counts[card >> 2] += delta
+            self.suit_counts[card & 3] += delta
+
+    def snapshot(self) -> "DeckTracker":
+        """Salinan keadaan saat ini, aman dipakai odds() di thread lain."""
+        copy = DeckTracker()
+        copy.wild_ranks = self.wild_ranks
+        copy.present = self.present[:]
+        copy.rank_counts = self.rank_counts[:]
+        copy.suit_counts = self.suit_counts[:]
+        copy.jokers = self.jokers
+        copy.total = self.total
+        return copy
+
+    def odds(self, hold: Sequence[Card], scores: Optional[Sequence[int]] = None) -> DrawOdds:
+        """
+        Menghitung peluang setiap jenis tangan jika `hold` dipertahankan dan
+        kartu lainnya diganti dengan kartu dari dek.
+
+        Args:
+            hold: Kartu yang dipertahankan (0-5 kartu).
+            scores: Skor per kekuatan tangan (Paytable.scores) untuk expected_score.
+
+        Returns:
+            DrawOdds; peluang dihitung pasti, bukan dengan sampel.
+        """
+        draws = HAND_SIZE - len(hold)
+        outcomes = math.comb(self.total, draws) if 0 <= draws <= self.total else 0
+        if not outcomes:
+            return DrawOdds(draws=draws, outcomes=0)
+
+        wild_ranks = self.wild_ranks
+        held_ranks = []
+        held_suits = set()
+        held_wilds = 0
+        for card in map(card_id, hold):
+            if card >= 52 or card >> 2 in wild_ranks:
+                held_wilds += 1
+            else:
+                held_ranks.append(card >> 2)
+                held_suits.add(card & 3)
+
+        # Peringkat yang bisa diambil; semua kartu liar di dek dihitung sebagai satu kelompok
+        ranks = [rank for rank in range(13) if rank not in wild_ranks and self.rank_counts[rank]]
+        deck_wilds = self.jokers + sum(self.rank_counts[rank] for rank in wild_ranks)
+        # Flush hanya mungkin jika kartu yang dipegang (selain kartu liar) sesuit dan berbeda peringkat
+        flush_suits = []
+        if len(held_suits) <= 1 and len(set(held_ranks)) == len(held_ranks):
+            flush_suits = list(held_suits) if held_suits else range(4)
+            flush_suits = [
+                suit for suit in flush_suits
+                if self.suit_counts[suit] + deck_wilds >= draws
+            ]
+
+        present = self.present
+        ways_by_strength: Dict[int, int] = {}
+        drawn: List[int] = []
+
+        def tally(ways: int, wilds_drawn: int):
+            wilds = held_wilds + wilds_drawn
+            all_ranks = held_ranks + drawn
+            suited_ways = 0
+            if flush_suits and not all_ranks:
+                # Semua kartu liar: sesuit di setiap suit sekaligus, dihitung sekali saja
+                suited_ways = ways
+            elif flush_suits and len(set(all_ranks)) == len(all_ranks):
+                wild_ways = math.comb(deck_wilds, wilds_drawn)
+                for suit in flush_suits:
+                    suit_ways = wild_ways
+                    for rank in drawn:
+                        suit_ways *= present[rank * 4 + suit]
+                    suited_ways += suit_ways
+            if suited_ways:
+                strength = _strength(all_ranks, True, wilds)
+                ways_by_strength[strength] = ways_by_strength.get(strength, 0) + suited_ways
+            if ways > suited_ways:
+                strength = _strength(all_ranks, False, wilds)
+                ways_by_strength[strength] = ways_by_strength.get(strength, 0) + ways - suited_ways
+
+        def choose(index: int, left: int, ways: int):
+            if index == len(ranks):
+                if left <= deck_wilds:
+                    tally(ways * math.comb(deck_wilds, left), left)
+                return
+            rank = ranks[index]
+            available = self.rank_counts[rank]
+            for taken in range(min(available, left) + 1):
+                drawn.extend([rank] * taken)
+                choose(index + 1, left - taken, ways * math.comb(available, taken))
+                del drawn[len(drawn) - taken:]
+
+        choose(0, draws, 1)
+
+        categories: Dict[str, float] = {}
+        expected = 0
+        for strength, ways in ways_by_strength.items():
+            name = CLASS_NAMES[strength]
+            categories[name] = categories.get(name, 0) + ways / outcomes
+            if scores is not None:
+                expected += scores[strength] * ways
+        return DrawOdds(draws=draws, outcomes=outcomes, categories=categories, expected_score=expected / outcomes)
@@ -0,0 +1,221 @@
+import threading
+from dataclasses import dataclass, field
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, FrozenSet, Sequence, Tuple
+
+from .evaluator import (
+    FIVE_OF_A_KIND_BASE, FLUSH_TABLE, JOKER_IDS, PRIMES, PRODUCT_TABLE, UNIQUE5_TABLE,
+    VALUE_TO_RANK, evaluate,
+)
+
+
+# Evaluator untuk varian dengan kartu liar (Deuces Wild, Joker Poker).
+#
+# Kartu liar boleh menggantikan kartu apa pun. Hasil penggantian terbaik hanya
+# bergantung pada pola kartu yang tidak liar (jumlah tiap peringkat, dan apakah
+# semuanya sesuit) serta jumlah kartu liar, bukan pada kartunya satu per satu.
+# Karena itu hasilnya disimpan dalam tabel dengan kunci (hasil kali prima
+# peringkat, sesuit, jumlah kartu liar); satu tangan cukup satu pencarian tabel.
+# Tabel diisi saat kunci pertama kali muncul, atau sekaligus dengan build_tables().
+
+# (hasil kali prima kartu tidak liar, sesuit, jumlah kartu liar) -> kekuatan terbaik
+_table: Dict[Tuple[int, bool, int], int] = {}
+_table_lock = threading.Lock()
+
+HAND_SIZE = 5
+
+# Memo lima kartu terbaik dari 6-7 kartu (lihat WildEvaluator.evaluate_best):
+# (hasil kali prima semua kartu tidak liar, jumlah kartu liar) -> kekuatan terbaik tanpa flush
+_best_ranks: Dict[Tuple[int, int], int] = {}
+# (mask peringkat kartu tidak liar satu suit, jumlah kartu liar) -> kekuatan flush terbaik
+_best_flush: Dict[Tuple[int, int], int] = {}
+
+
+@dataclass(frozen=True)
+class WildRules:
+    """Aturan kartu liar sebuah varian."""
+    wild_values: FrozenSet[str] = field(default_factory=frozenset)  # Nilai kartu yang liar, mis. {"02"}
+    jokers: int = 0  # Jumlah joker di dek (0-2); joker selalu liar
+
+    @property
+    def wild_ranks(self) -> FrozenSet[int]:
+        return frozenset(VALUE_TO_RANK[value] for value in self.wild_values)
+
+
+DEUCES_WILD = WildRules(wild_values=frozenset({"02"}))
+JOKER_POKER = WildRules(jokers=1)
+
+
+def _best_substitution(ranks: Tuple[int, ...], suited: bool, wilds: int) -> int:
+    # Mencoba setiap kumpulan peringkat pengganti (urutannya tidak berpengaruh)
+    best = 0
+    for extra in combinations_with_replacement(range(13), wilds):
+        hand = ranks + extra
+        counts = [0] * 13
+        for rank in hand:
+            counts[rank] += 1
+        top = max(counts)
+
+        if top == 5:
+            strength = FIVE_OF_A_KIND_BASE + 1 + hand[0]
+        elif top == 1:
+            mask = sum(1 << rank for rank in hand)
+            # Kartu liar bisa mengikuti suit kartu lain, jadi flush mungkin jika semuanya sesuit
+            strength = FLUSH_TABLE[mask] if suited else UNIQUE5_TABLE[mask]
+        else:
+            product = 1
+            for rank in hand:
+                product *= PRIMES[rank]
+            strength = PRODUCT_TABLE[product]
+        best = max(best, strength)
+    return best
+
+
+def best_strength(ranks: Sequence[int], suited: bool, wilds: int) -> int:
+    """
+    Kekuatan terbaik untuk peringkat kartu tidak liar ditambah sejumlah kartu liar.
+
+    Args:
+        ranks: Peringkat (0-12) kartu yang tidak liar.
+        suited: True jika kartu tidak liar sesuit dan peringkatnya berbeda semua.
+        wilds: Jumlah kartu liar (1-5).
+    """
+    product = 1
+    for rank in ranks:
+        product *= PRIMES[rank]
+    key = (product, suited, wilds)
+
+    strength = _table.get(key)
+    if strength is None:
+        strength = _best_substitution(tuple(sorted(ranks)), suited, wilds)
+        with _table_lock:
+            _table[key] = strength
+    return strength
+
+
+def _compute_best_ranks(ranks: Sequence[int], wilds: int) -> int:
+    # Kombinasi peringkat yang sama cukup dicoba sekali
+    return max(
+        best_strength(subset, False, wilds)
+        for subset in set(combinations(sorted(ranks), HAND_SIZE - wilds))
+    )
+
+
+def _compute_best_flush(mask: int, wilds: int) -> int:
+    ranks = [rank for rank in range(13) if mask >> rank & 1]
+    return max(best_strength(subset, True, wilds) for subset in combinations(ranks, HAND_SIZE - wilds))
+
+
+def build_tables():
+    """
+    Mengisi seluruh tabel sekaligus untuk 1-5 kartu liar, mis. sebelum simulasi panjang.
+
+    Returns:
+        Jumlah entri tabel.
+    """
+    for wilds in range(1, 6):
+        for ranks in combinations_with_replacement(range(13), 5 - wilds):
+            if max((ranks.count(rank) for rank in set(ranks)), default=0) > 4:
+                continue
+            best_strength(ranks, False, wilds)
+            if len(set(ranks)) == len(ranks):
+                best_strength(ranks, True, wilds)
+    return len(_table)
+
+
+class WildEvaluator:
+    """
+    Menghitung kekuatan tangan dengan kartu liar sesuai WildRules.
+
+    Kekuatan sama dengan game.evaluator (1-7462) ditambah 13 kelas
+    Five of a Kind (7463-7475) di atas Royal Flush.
+    """
+
+    def __init__(self, rules: WildRules):
+        self.rules = rules
+        # Penanda liar per id kartu, termasuk joker
+        wild_ranks = rules.wild_ranks
+        self.is_wild = [card >> 2 in wild_ranks for card in range(52)] + [True] * len(JOKER_IDS)
+
+    def evaluate5(self, ids: Sequence[int]) -> int:
+        """Menghitung kekuatan tepat lima kartu."""
+        is_wild = self.is_wild
+        wilds = 0
+        ranks = []
+        suits = set()
+        for card in ids:
+            if is_wild[card]:
+                wilds += 1
+            else:
+                ranks.append(card >> 2)
+                suits.add(card & 3)
+
+        if not wilds:
+            return evaluate(ids)
+        suited = len(suits) <= 1 and len(set(ranks)) == len(ranks)
+        return best_strength(ranks, suited, wilds)
+
+    def evaluate(self, ids: Sequence[int]) -> int:
+        """
+        Menghitung kekuatan tangan: lima kartu, atau lima kartu terbaik dari 6-7 kartu.
+        """
+        if len(ids) == 5:
+            return self.evaluate5(ids)
+        if not any(self.is_wild[card] for card in ids):
+            return evaluate(ids)
+        if 5 < len(ids) <= 7:
+            return self.evaluate_best(ids)
+        raise ValueError(f"Evaluator membutuhkan 5-7 kartu, bukan {len(ids)}")
+
+    def evaluate_best(self, ids: Sequence[int]) -> int:
+        """
+        Menghitung kekuatan lima kartu terbaik dari 6-7 kartu tanpa mencoba
+        ke-21 subset satu per satu.
+
+        Kartu liar bisa menjadi kartu apa pun, jadi tangan terbaik selalu memakai
+        sebanyak mungkin kartu liar (paling banyak lima). Sisanya dipilih dari
+        kartu tidak liar: tanpa flush hasilnya hanya bergantung pada hasil kali
+        prima peringkatnya, dan flush pada mask peringkat setiap suit yang cukup
+        kartunya. Keduanya diingat (memo) per jumlah kartu liar; berbeda dengan
+        evaluator.evaluate_best, flush tidak selalu menang (mis. Five of a Kind),
+        jadi keduanya dibandingkan.
+        """
+        is_wild = self.is_wild
+        wilds = 0
+        suit_counts = [0, 0, 0, 0]
+        suit_masks = [0, 0, 0, 0]
+        product = 1
+        ranks = []
+        for card in ids:
+            if is_wild[card]:
+                wilds += 1
+                continue
+            rank = card >> 2
+            suit = card & 3
+            suit_counts[suit] += 1
+            suit_masks[suit] |= 1 << rank
+            product *= PRIMES[rank]
+            ranks.append(rank)
+
+        if not wilds:
+            return evaluate(ids)
+        wilds = min(wilds, HAND_SIZE)
+
+        key = (product, wilds)
+        best = _best_ranks.get(key)
+        if best is None:
+            best = _compute_best_ranks(ranks, wilds)
+            with _table_lock:
+                _best_ranks[key] = best
+
+        for suit in range(4):
+            if suit_counts[suit] + wilds < HAND_SIZE:
+                continue
+            key = (suit_masks[suit], wilds)
+            strength = _best_flush.get(key)
+            if strength is None:
+                strength = _compute_best_flush(suit_masks[suit], wilds)
+                with _table_lock:
+                    _best_flush[key] = strength
+            best = max(best, strength)
+        return best
@@ -0,0 +1,79 @@
+import math
+
+
+SUB_BUCKETS = 4  # Histogram buckets per power of two
+
+
+class LatencyHistogram:
+    """
+    In-memory histogram of durations in milliseconds.
+
+    Buckets grow geometrically: every power of two is split into SUB_BUCKETS
+    buckets, so a bucket is at most ~19% wider than its lower bound.
+    Percentiles interpolate within their bucket and never fall outside the
+    smallest and largest sample recorded.
+    """
+
+    # Upper bounds of the buckets in ms; the last bucket holds everything slower
+    BOUNDS = [0.25 * 2 ** (i / SUB_BUCKETS) for i in range(15 * SUB_BUCKETS + 1)]  # 0.25 ms .. ~8 s
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, ms):
+        if ms <= self.BOUNDS[0]:
+            index = 0
+        else:
+            index = min(len(self.BOUNDS), math.ceil(SUB_BUCKETS * math.log2(ms / self.BOUNDS[0])))
+        self.counts[index] += 1
+        self.count += 1
+        self.total += ms
+        self.min = min(self.min, ms)
+        self.max = max(self.max, ms)
+
+    def merge(self, other):
+        """Adds the samples of another histogram to this one."""
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, fraction):
+        """
+        Returns the duration below which the given fraction of samples fall,
+        interpolated linearly within its bucket and clamped to the observed range.
+        """
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= threshold:
+                lower = max(self.BOUNDS[i - 1] if i else 0.0, self.min)
+                upper = min(self.BOUNDS[i] if i < len(self.BOUNDS) else self.max, self.max)
+                value = lower + (upper - lower) * max(threshold - seen, 0) / count
+                return round(min(max(value, self.min), self.max), 3)
+            seen += count
+        return round(self.max, 3)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": {
+                (f"<={bound:.4g}" if i < len(self.BOUNDS) else f">{self.BOUNDS[-1]:.4g}"): count
+                for i, (bound, count) in enumerate(zip(self.BOUNDS + [math.inf], self.counts))
+                if count
+            },
+        }
@@ -0,0 +1,10 @@
+# Expose the asset helpers shared by the UI screens
+from .atlas import CardAtlas, get_atlas, open_card_image
+from .registry import AssetRegistry, get_image, prefetch_image
+from .scaled import iter_scaled_frames, load_scaled
+
+__all__ = [
+    'CardAtlas', 'get_atlas', 'open_card_image',
+    'AssetRegistry', 'get_image', 'prefetch_image',
+    'iter_scaled_frames', 'load_scaled',
+]
@@ -0,0 +1,169 @@
+import json
+import math
+import threading
+from pathlib import Path
+
+
+# Built atlases live outside the source image folders so they can be regenerated freely.
+ATLAS_DIR = Path("assets") / "build" / "atlas"
+ATLAS_VERSION = 1
+
+_atlases = {}  # size class -> CardAtlas, or None when no atlas has been built
+_lock = threading.Lock()
+
+
+class CardAtlas:
+    """A single decoded sprite sheet holding every card image of one size class."""
+
+    def __init__(self, image, rects):
+        self.image = image
+        self.rects = rects
+
+    @classmethod
+    def load(cls, size_class, atlas_dir=ATLAS_DIR):
+        """
+        Loads and decodes the atlas image and its index for a size class.
+
+        Args:
+            size_class (str): Name of the source folder, e.g. "cards_large".
+            atlas_dir (Path): Folder holding the built atlas files.
+
+        Returns:
+            CardAtlas: The decoded atlas, or None if it has not been built or is outdated.
+        """
+        from PIL import Image
+
+        index_path = Path(atlas_dir) / f"{size_class}.json"
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != ATLAS_VERSION:
+                return None
+
+            image = Image.open(Path(atlas_dir) / index["image"])
+            image.load()  # Decode once here so every crop is a plain memory copy
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return cls(image, {name: tuple(rect) for name, rect in index["cards"].items()})
+
+    def __contains__(self, name):
+        return name in self.rects
+
+    def crop(self, name):
+        """Returns a copy of the card called `name` (file stem, e.g. "card_hearts_A")."""
+        x, y, w, h = self.rects[name]
+        return self.image.crop((x, y, x + w, y + h))
+
+
+def get_atlas(size_class):
+    """Returns the process-wide atlas for a size class, loading it on first use."""
+    with _lock:
+        if size_class not in _atlases:
+            _atlases[size_class] = CardAtlas.load(size_class)
+        return _atlases[size_class]
+
+
+def open_card_image(path):
+    """
+    Opens a card image, cropping it from its size class atlas when one is available.
+
+    Falls back to reading the individual file, so the UI keeps working before
+    the atlases have been built.
+
+    Args:
+        path (str | Path): Path to the individual card file, e.g.
+            "assets/images/cards_large/card_hearts_A.png".
+
+    Returns:
+        PIL.Image.Image: The card image.
+
+    Raises:
+        FileNotFoundError: If the card is neither in the atlas nor on disk.
+    """
+    from PIL import Image
+
+    path = Path(path)
+    atlas = get_atlas(path.parent.name)
+
+    if atlas is not None and path.stem in atlas:
+        return atlas.crop(path.stem)
+
+    return Image.open(path)
+
+
+def build_atlas(source_dir, atlas_dir=ATLAS_DIR):
+    """
+    Packs every card_*.png of a folder into one atlas image plus a JSON index.
+
+    All cards are remapped onto one shared palette so that the atlas stays a
+    small paletted PNG and crops resize exactly like the original files.
+
+    Args:
+        source_dir (str | Path): Folder with the individual card images.
+        atlas_dir (str | Path): Folder to write the atlas files to.
+
+    Returns:
+        Path: Path of the written JSON index.
+    """
+    from PIL import Image
+
+    source_dir = Path(source_dir)
+    atlas_dir = Path(atlas_dir)
+    atlas_dir.mkdir(parents=True, exist_ok=True)
+
+    files = sorted(source_dir.glob("card_*.png"))
+    if not files:
+        raise FileNotFoundError(f"No card images found in {source_dir}")
+
+    cards = [(f.stem, Image.open(f).convert("RGBA")) for f in files]
+    cell_w = max(img.width for _, img in cards)
+    cell_h = max(img.height for _, img in cards)
+    columns = math.ceil(math.sqrt(len(cards)))
+    rows = math.ceil(len(cards) / columns)
+
+    sheet = Image.new("RGBA", (columns * cell_w, rows * cell_h), (0, 0, 0, 0))
+    rects = {}
+    for i, (name, img) in enumerate(cards):
+        x, y = (i % columns) * cell_w, (i // columns) * cell_h
+        sheet.paste(img, (x, y))
+        rects[name] = [x, y, img.width, img.height]
+
+    size_class = source_dir.name
+    image_name = f"{size_class}.png"
+    sheet = _to_paletted(sheet)
+    if sheet.mode == "P":
+        sheet.save(atlas_dir / image_name, optimize=True, transparency=0)
+    else:
+        sheet.save(atlas_dir / image_name, optimize=True)
+
+    index_path = atlas_dir / f"{size_class}.json"
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": ATLAS_VERSION,
+            "image": image_name,
+            "cell": [cell_w, cell_h],
+            "cards": rects,
+        }, f, sort_keys=True)
+
+    return index_path
+
+
+def _to_paletted(sheet):
+    from PIL import Image
+
+    # Index 0 is reserved for fully transparent pixels, like the source files
+    counts = sheet.getcolors(maxcolors=1 << 16)
+    colors = {color for _, color in counts or [] if color[3] == 255}
+    if counts is None or len(colors) > 255:
+        return sheet  # Too many colours for a palette, keep the sheet as RGBA
+
+    lookup = {color: i + 1 for i, color in enumerate(sorted(colors))}
+    indices = bytes(lookup.get(pixel, 0) for pixel in sheet.getdata())
+
+    paletted = Image.frombytes("P", sheet.size, indices)
+    palette = [0, 0, 0]
+    for color in sorted(colors):
+        palette.extend(color[:3])
+    paletted.putpalette(palette)
+    return paletted
@@ -0,0 +1,44 @@
+"""
+Builds the derived image assets used by the UI.
+
+Run from the project root with the source folder on the path:
+
+    PYTHONPATH=src python -m resources.build_assets
+"""
+import argparse
+from pathlib import Path
+
+from resources.atlas import ATLAS_DIR, build_atlas
+from resources.manifest import SCALED_ASSETS
+from resources.scaled import SCALED_DIR, build_scaled
+
+
+CARD_SIZE_CLASSES = ["cards_large", "cards_medium", "cards_small"]
+
+
+def build_atlases(images_dir, atlas_dir=ATLAS_DIR):
+    """Packs every card size class into its own atlas."""
+    for size_class in CARD_SIZE_CLASSES:
+        index_path = build_atlas(Path(images_dir) / size_class, atlas_dir)
+        print(f"Built atlas {index_path}")
+
+
+def build_prescaled(scaled_dir=SCALED_DIR):
+    """Pre-scales every asset listed in the manifest."""
+    written = build_scaled(SCALED_ASSETS, scaled_dir)
+    print(f"Built {len(written)} pre-scaled images in {scaled_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build derived image assets for Pip's Bluff.")
+    parser.add_argument("--images", default="assets/images", help="Folder with the source images")
+    parser.add_argument("--atlas-out", default=str(ATLAS_DIR), help="Folder to write the atlases to")
+    parser.add_argument("--scaled-out", default=str(SCALED_DIR), help="Folder to write pre-scaled images to")
+    args = parser.parse_args()
+
+    build_atlases(args.images, args.atlas_out)
+    build_prescaled(args.scaled_out)
+
+
+if __name__ == "__main__":
+    main()
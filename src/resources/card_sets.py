@@ -0,0 +1,100 @@
+"""
+The card image sets and the size their pixel art was drawn at.
+
+Every set holds the same cards drawn at a different resolution. Scaling
+down from the closest larger set is cheap and sharp, scaling up from a
+smaller one is blurry, so screens pick their source set from the size they
+display the cards at. Cards shown larger than every set are enlarged once
+from the largest set, pixel for pixel, so the pixel art stays sharp.
+"""
+from functools import lru_cache
+from pathlib import Path
+
+
+CARD_IMAGES_DIR = Path("assets") / "images"
+
+# (folder, native size), smallest first
+CARD_SETS = [
+    ("cards_small", (16, 16)),
+    ("cards_medium", (32, 32)),
+    ("cards_large", (64, 64)),
+]
+
+# Card scales used while a window is resized; snapping to a few levels keeps
+# the number of cached (and pre-scaled) sizes small
+SCALE_LEVELS = (0.5, 0.75, 1.0, 1.25, 1.5, 2.0)
+
+
+def quantize_scale(scale, levels=SCALE_LEVELS):
+    """Returns the scale level closest to `scale`."""
+    return min(levels, key=lambda level: abs(level - scale))
+
+
+def scaled_size(size, scale):
+    """Returns `size` (width, height) multiplied by `scale`, in whole pixels."""
+    width, height = size
+    return round(width * scale), round(height * scale)
+
+
+def pick_card_set(size):
+    """
+    Returns the card set to scale from for cards displayed at `size`.
+
+    Args:
+        size (tuple): Display size as (width, height).
+
+    Returns:
+        str: The smallest set at least as large as `size`, or the largest set
+        if none is.
+    """
+    width, height = size
+    for name, (native_width, native_height) in CARD_SETS:
+        if native_width >= width and native_height >= height:
+            return name
+    return CARD_SETS[-1][0]
+
+
+def card_resample(size, resample=None):
+    """
+    Returns the Pillow filter (or its name) to scale a card to `size` with.
+
+    Args:
+        size (tuple): Display size as (width, height).
+        resample: Filter used when scaling down, None for Pillow's default.
+
+    Returns:
+        "NEAREST" when `size` is larger than every set, as the card is then
+        enlarged from the largest one; `resample` otherwise.
+    """
+    width, height = size
+    native_width, native_height = CARD_SETS[-1][1]
+    if width > native_width or height > native_height:
+        return "NEAREST"
+    return resample
+
+
+@lru_cache(maxsize=1024)
+def card_source(file_name, size, images_dir=CARD_IMAGES_DIR):
+    """
+    Returns the path of the card image to scale to `size`.
+
+    Not every set has every image, so a card missing from the preferred set
+    comes from the next larger one, then from the smaller ones.
+
+    Args:
+        file_name (str): Card file name, e.g. "card_hearts_A.png".
+        size (tuple): Display size as (width, height).
+        images_dir (Path): Folder holding the card set folders.
+
+    Returns:
+        Path: Path of the image; the preferred set's path if no set has it.
+    """
+    names = [name for name, _ in CARD_SETS]
+    start = names.index(pick_card_set(size))
+    preferred = Path(images_dir) / names[start] / file_name
+
+    for name in names[start:] + names[:start][::-1]:
+        path = Path(images_dir) / name / file_name
+        if path.exists():
+            return path
+    return preferred
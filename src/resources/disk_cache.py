@@ -0,0 +1,228 @@
+"""
+Persistent cache of decoded, scaled images.
+
+Every image the UI loads at runtime is also written here as raw RGBA pixels,
+so later launches map the file into memory and hand the pixels to Tk without
+decoding or resizing anything. Entries are keyed by the source path, its
+modification time and size, and the target size, so editing an asset
+invalidates its entries. Bumping CACHE_VERSION invalidates the whole cache.
+
+Layout of an entry: a header (see _HEADER), one duration per frame, then the
+RGBA pixels of every frame back to back.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+from pathlib import Path
+
+from .scaled import resample_name
+
+
+# Set to a folder to move the cache, or to 0 to turn it off.
+ENV_VAR = "PIPS_CACHE_DIR"
+
+CACHE_VERSION = 1
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+_MAGIC = b"PIPS"
+_HEADER = struct.Struct("<4sHHIII")  # magic, version, reserved, width, height, frame count
+_DURATION = struct.Struct("<I")  # ms, 0 when the frame has none
+
+_lock = threading.Lock()
+_total_bytes = None  # Size of the cache folder, measured on the first write
+
+
+def cache_dir():
+    """
+    Returns the folder of the current cache version, or None if caching is off.
+
+    Defaults to the platform's per-user cache folder.
+    """
+    override = os.environ.get(ENV_VAR)
+    if override == "0":
+        return None
+    if override:
+        base = Path(override)
+    elif sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "PipsBluff" / "Cache"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches" / "PipsBluff"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "pips_bluff"
+    return base / "images" / f"v{CACHE_VERSION}"
+
+
+def _entry_path(source, size, resample, kind):
+    folder = cache_dir()
+    if folder is None:
+        return None
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+
+    width, height = size
+    key = f"{kind}|{os.path.abspath(source)}|{stat.st_mtime_ns}|{stat.st_size}|{width}x{height}|{resample_name(resample)}"
+    return folder / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.rgba"
+
+
+def _read(path):
+    # Returns (size, [(pixel buffer, duration)]) mapped from the entry, None if unusable
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        magic, version, _, width, height, count = _HEADER.unpack_from(mapped, 0)
+    except struct.error:
+        return None
+    frame_bytes = width * height * 4
+    data_start = _HEADER.size + count * _DURATION.size
+    if magic != _MAGIC or version != CACHE_VERSION or len(mapped) != data_start + count * frame_bytes:
+        return None
+
+    view = memoryview(mapped)
+    frames = []
+    for i in range(count):
+        (duration,) = _DURATION.unpack_from(mapped, _HEADER.size + i * _DURATION.size)
+        start = data_start + i * frame_bytes
+        frames.append((view[start:start + frame_bytes], duration or None))
+
+    try:
+        os.utime(path)  # Marks the entry as recently used for pruning
+    except OSError:
+        pass
+    return (width, height), frames
+
+
+def _write(path, frames):
+    # frames: [(RGBA image, duration)], all the same size
+    width, height = frames[0][0].size
+    parts = [_HEADER.pack(_MAGIC, CACHE_VERSION, 0, width, height, len(frames))]
+    parts += [_DURATION.pack(round(duration or 0)) for _, duration in frames]
+    parts += [image.tobytes() for image, _ in frames]
+    data = b"".join(parts)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp, "wb") as f:
+            f.write(data)
+        os.replace(temp, path)
+    except OSError:
+        return  # The cache is only an optimisation
+
+    _account(path.parent, len(data))
+
+
+def load_image(source, size, resample="LANCZOS"):
+    """
+    Returns the cached RGBA copy of `source` at `size`, or None on a miss.
+
+    The image's pixels live in the memory-mapped cache file; it is read-only.
+    """
+    from PIL import Image
+
+    path = _entry_path(source, size, resample, "image")
+    entry = _read(path) if path is not None else None
+    if entry is None:
+        return None
+
+    (width, height), frames = entry
+    if len(frames) != 1:
+        return None
+    return Image.frombuffer("RGBA", (width, height), frames[0][0], "raw", "RGBA", 0, 1)
+
+
+def store_image(source, size, resample, image):
+    """Writes `image`, the copy of `source` scaled to `size`, to the cache."""
+    path = _entry_path(source, size, resample, "image")
+    if path is not None:
+        _write(path, [(image.convert("RGBA"), None)])
+
+
+def load_frames(source, size, resample="LANCZOS"):
+    """Returns the cached [(RGBA frame, duration ms or None)] of an animation, or None on a miss."""
+    from PIL import Image
+
+    path = _entry_path(source, size, resample, "frames")
+    entry = _read(path) if path is not None else None
+    if entry is None:
+        return None
+
+    image_size, frames = entry
+    return [
+        (Image.frombuffer("RGBA", image_size, pixels, "raw", "RGBA", 0, 1), duration)
+        for pixels, duration in frames
+    ]
+
+
+def store_frames(source, size, resample, frames):
+    """Writes every (frame, duration) of an animation of `source` scaled to `size` to the cache."""
+    path = _entry_path(source, size, resample, "frames")
+    if path is not None and frames:
+        _write(path, [(image.convert("RGBA"), duration) for image, duration in frames])
+
+
+def _account(folder, added):
+    global _total_bytes
+
+    with _lock:
+        if _total_bytes is None:
+            # First write of this launch; also clears out older cache versions
+            _total_bytes = prune(folder, MAX_CACHE_BYTES)
+        else:
+            _total_bytes += added
+        if _total_bytes > MAX_CACHE_BYTES:
+            _total_bytes = prune(folder, MAX_CACHE_BYTES * 3 // 4)
+
+
+def prune(folder=None, max_bytes=MAX_CACHE_BYTES):
+    """
+    Deletes the least recently used entries until the cache fits in `max_bytes`.
+
+    Entries of older cache versions are always deleted.
+
+    Returns:
+        int: Bytes left in the cache.
+    """
+    folder = Path(folder) if folder is not None else cache_dir()
+    if folder is None or not folder.is_dir():
+        return 0
+
+    for stale in folder.parent.glob("v*"):
+        if stale != folder and stale.is_dir():
+            for entry in stale.iterdir():
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+            try:
+                stale.rmdir()
+            except OSError:
+                pass
+
+    entries = []
+    for entry in os.scandir(folder):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue  # Removed meanwhile, e.g. a temporary file being renamed
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort()
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass
+    return total
@@ -0,0 +1,37 @@
+"""
+Every (asset, target size) pair the UI displays.
+
+The asset build pre-scales each entry so the screens never resize at runtime.
+Sources may be glob patterns; `resample` (a Pillow filter name, None for the
+default) must match what the screen would use when falling back to runtime
+resizing, so both paths give the same pixels.
+"""
+
+
+from .card_sets import SCALE_LEVELS, card_resample, pick_card_set, scaled_size
+
+
+LOGO_PATH = "assets/images/logo.png"
+
+# Card sizes at scale 1.0; the screens scale them by SCALE_LEVELS as the window grows
+GAME_CARD_SIZE = (100, 145)
+INFO_CARD_SIZE = (50, 75)
+
+# Entries marked "prewarm" are turned into PhotoImages by AssetRegistry.prewarm() at startup.
+SCALED_ASSETS = [
+    # Cards on the game table at every scale level (GameUI, Card.load_image)
+    *[
+        {"source": f"assets/images/{pick_card_set(size)}/card_*.png", "size": size,
+         "resample": card_resample(size)}
+        for size in sorted({scaled_size(GAME_CARD_SIZE, scale) for scale in SCALE_LEVELS})
+    ],
+    # Example hands on the Hand Info page (InfoUI)
+    {"source": f"assets/images/{pick_card_set(INFO_CARD_SIZE)}/card_*.png", "size": INFO_CARD_SIZE,
+     "resample": card_resample(INFO_CARD_SIZE, "LANCZOS")},
+    # Logo on the login/register headers, the dashboard header and the About page
+    {"source": LOGO_PATH, "size": (175, 120), "resample": "LANCZOS", "prewarm": True},
+    {"source": LOGO_PATH, "size": (150, 95), "resample": "LANCZOS", "prewarm": True},
+    {"source": LOGO_PATH, "size": (200, 200), "resample": "LANCZOS", "prewarm": True},
+    # Profile page animation (DashboardUI), stored as an animated PNG
+    {"source": "assets/Gif/gif1.gif", "size": (400, 300), "resample": "LANCZOS", "animated": True},
+]
@@ -0,0 +1,156 @@
+import threading
+import tkinter as tk
+
+from . import disk_cache
+from .manifest import SCALED_ASSETS
+from .scaled import is_fresh, load_scaled, resample_name, scaled_path
+
+
+# Decoded, scaled images are plain pixel data, so one copy serves the whole process.
+_images = {}
+_images_lock = threading.Lock()
+
+# Worker that decodes images ahead of time, created on the first prefetch.
+_prefetch_executor = None
+
+
+def get_image(source, size, resample="LANCZOS"):
+    """
+    Returns the process-wide copy of `source` scaled to `size`.
+
+    Images come from the disk cache when possible; anything decoded here is
+    written to it for the next launch.
+
+    Args:
+        source (str | Path): Path of the original asset.
+        size (tuple): Target size as (width, height).
+        resample: Pillow resampling filter (or its name) used if the image must be resized at runtime.
+
+    Returns:
+        PIL.Image.Image: The decoded image. Callers must not modify it.
+    """
+    key = (str(source), tuple(size), resample_name(resample))
+    with _images_lock:
+        image = _images.get(key)
+    if image is None:
+        image = disk_cache.load_image(source, size, resample)
+        if image is None:
+            image = load_scaled(source, size, resample)
+            image.load()
+            disk_cache.store_image(source, size, resample, image)
+        with _images_lock:
+            image = _images.setdefault(key, image)
+    return image
+
+
+def cached_image(source, size, resample="LANCZOS"):
+    """Returns the process-wide copy of `source` at `size` if it is already decoded, else None."""
+    key = (str(source), tuple(size), resample_name(resample))
+    with _images_lock:
+        return _images.get(key)
+
+
+def prefetch_image(source, size, resample="LANCZOS"):
+    """
+    Decodes `source` at `size` into the process-wide cache on a worker thread.
+
+    Returns:
+        concurrent.futures.Future | None: The pending decode, None if the image is already cached.
+    """
+    global _prefetch_executor
+
+    if cached_image(source, size, resample) is not None:
+        return None
+    with _images_lock:
+        if _prefetch_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image-prefetch")
+    return _prefetch_executor.submit(get_image, source, size, resample)
+
+
+class AssetRegistry:
+    """
+    PhotoImages shared by every screen of one Tk interpreter.
+
+    A PhotoImage belongs to the interpreter that created it and dies with its
+    root, so each root gets its own registry (see for_widget()) and drops its
+    images when that root is destroyed. The decoded pixels behind them are
+    shared by the whole process.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.photos = {}
+
+        self.root.bind("<Destroy>", self._on_root_destroy, add="+")
+
+    @classmethod
+    def for_widget(cls, widget):
+        """Returns the registry of the Tk root that `widget` lives in, creating it if needed."""
+        root = widget._root()
+        registry = getattr(root, '_asset_registry', None)
+        if registry is None:
+            registry = root._asset_registry = cls(root)
+        return registry
+
+    def photo(self, source, size, resample="LANCZOS"):
+        """
+        Returns a PhotoImage of `source` at `size`, creating it on first request.
+
+        An image already decoded by prefetch() or found in the disk cache is
+        only copied into Tk. Otherwise a pre-scaled copy is handed straight to
+        Tk, which reads PNG itself, and a worker fills the disk cache for the
+        next launch. Only an image without either is decoded here.
+
+        Raises:
+            OSError: If the asset cannot be read.
+        """
+        key = (str(source), tuple(size), resample_name(resample))
+        photo = self.photos.get(key)
+        if photo is None:
+            scaled = scaled_path(source, size)
+            image = cached_image(source, size, resample)
+            if image is None:
+                image = disk_cache.load_image(source, size, resample)
+            if image is not None:
+                from PIL import ImageTk
+                photo = ImageTk.PhotoImage(image, master=self.root)
+            elif is_fresh(scaled, source):
+                photo = tk.PhotoImage(file=str(scaled), master=self.root)
+                if disk_cache.cache_dir() is not None:
+                    prefetch_image(source, size, resample)
+            else:
+                from PIL import ImageTk
+                photo = ImageTk.PhotoImage(get_image(source, size, resample), master=self.root)
+            self.photos[key] = photo
+        return photo
+
+    def prefetch(self, source, size, resample="LANCZOS"):
+        """
+        Starts decoding an image that photo() will soon be asked for.
+
+        The file is read and resized on a worker thread; only the PhotoImage
+        itself is created later, on the Tk thread, by photo().
+        """
+        key = (str(source), tuple(size), resample_name(resample))
+        if key not in self.photos:
+            prefetch_image(source, size, resample)
+
+    def prewarm(self, entries=None):
+        """
+        Creates the PhotoImages of every manifest entry marked for pre-warming.
+
+        Assets that fail to load are skipped; the screens show their fallbacks.
+        """
+        if entries is None:
+            entries = [entry for entry in SCALED_ASSETS if entry.get("prewarm")]
+
+        for entry in entries:
+            try:
+                self.photo(entry["source"], entry["size"], entry.get("resample"))
+            except Exception as e:
+                print(f"Error pre-warming {entry['source']}: {e}")
+
+    def _on_root_destroy(self, event):
+        if event.widget is self.root:
+            self.photos = {}
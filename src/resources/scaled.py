@@ -0,0 +1,151 @@
+import glob
+from pathlib import Path
+
+from .atlas import open_card_image
+
+
+# Pre-scaled copies are written here by resources.build_assets.
+SCALED_DIR = Path("assets") / "build" / "scaled"
+
+
+def scaled_path(source, size, scaled_dir=SCALED_DIR):
+    """
+    Returns where the pre-scaled copy of `source` at `size` is stored.
+
+    Args:
+        source (str | Path): Path of the original asset, e.g. "assets/images/logo.png".
+        size (tuple): Target size as (width, height).
+        scaled_dir (Path): Folder holding the pre-scaled files.
+
+    Returns:
+        Path: Path of the pre-scaled PNG.
+    """
+    source = Path(source)
+    if source.is_absolute():
+        try:
+            source = source.relative_to(Path.cwd())
+        except ValueError:
+            pass  # Outside the project; keep the full path in the name
+
+    parts = source.with_suffix("").parts
+    if parts and parts[0] == "assets":
+        parts = parts[1:]
+    width, height = size
+    return Path(scaled_dir) / f"{'_'.join(parts)}_{width}x{height}.png"
+
+
+def is_fresh(scaled, source):
+    """Returns True if the pre-scaled file exists and is not older than its source."""
+    try:
+        return scaled.stat().st_mtime >= Path(source).stat().st_mtime
+    except OSError:
+        return False
+
+
+def resample_name(resample):
+    """Returns the filter name ("LANCZOS", ...) of a Pillow filter or name, None for the default."""
+    return getattr(resample, 'name', resample)
+
+
+def _resize(image, size, resample):
+    from PIL import Image
+
+    # resample=None keeps Pillow's default, which is what the card screens always used
+    if resample is None:
+        return image.resize(size)
+    if isinstance(resample, str):
+        resample = Image.Resampling[resample]
+    return image.resize(size, resample)
+
+
+def load_scaled(source, size, resample=None):
+    """
+    Loads an image at exactly `size`, preferring its pre-scaled copy.
+
+    A missing or outdated copy falls back to opening the original (from its
+    card atlas when there is one) and resizing it at runtime.
+
+    Args:
+        source (str | Path): Path of the original asset.
+        size (tuple): Target size as (width, height).
+        resample: Pillow resampling filter (or its name) for the fallback, None for the default.
+
+    Returns:
+        PIL.Image.Image: The image at the requested size.
+    """
+    from PIL import Image
+
+    scaled = scaled_path(source, size)
+    if is_fresh(scaled, source):
+        return Image.open(scaled)
+
+    return _resize(open_card_image(source), size, resample)
+
+
+def iter_scaled_frames(source, size, resample="LANCZOS"):
+    """
+    Yields the frames of an animation as RGBA images at exactly `size`.
+
+    Args:
+        source (str | Path): Path of the original animated image (GIF).
+        size (tuple): Target size as (width, height).
+        resample: Pillow resampling filter (or its name) for the fallback.
+
+    Yields:
+        tuple: (frame image, frame duration in milliseconds or None).
+    """
+    from PIL import Image, ImageSequence
+
+    scaled = scaled_path(source, size)
+    if is_fresh(scaled, source):
+        for frame in ImageSequence.Iterator(Image.open(scaled)):
+            yield frame.convert('RGBA'), frame.info.get('duration')
+        return
+
+    for frame in ImageSequence.Iterator(Image.open(source)):
+        yield _resize(frame.copy().convert('RGBA'), size, resample), frame.info.get('duration')
+
+
+def build_scaled(entries, scaled_dir=SCALED_DIR):
+    """
+    Writes the pre-scaled copy of every manifest entry.
+
+    Files are stored as uncompressed PNGs, which decode with a plain copy
+    instead of an inflate pass. Animations become animated PNGs.
+
+    Args:
+        entries (list): Manifest entries, see resources.manifest.SCALED_ASSETS.
+        scaled_dir (Path): Folder to write the pre-scaled files to.
+
+    Returns:
+        list: Paths of the written files.
+    """
+    from PIL import Image, ImageSequence
+
+    Path(scaled_dir).mkdir(parents=True, exist_ok=True)
+    written = []
+
+    for entry in entries:
+        size = tuple(entry["size"])
+        resample = entry.get("resample")
+
+        for source in sorted(glob.glob(entry["source"])):
+            target = scaled_path(source, size, scaled_dir)
+
+            if entry.get("animated"):
+                frames, durations = [], []
+                for frame in ImageSequence.Iterator(Image.open(source)):
+                    frames.append(_resize(frame.copy().convert('RGBA'), size, resample))
+                    durations.append(frame.info.get('duration', 100))
+                frames[0].save(target, save_all=True, append_images=frames[1:],
+                               duration=durations, loop=0, compress_level=0)
+            else:
+                image = _resize(Image.open(source), size, resample)
+                save_kwargs = {"compress_level": 0}
+                if "transparency" in image.info:
+                    save_kwargs["transparency"] = image.info["transparency"]
+                image.save(target, **save_kwargs)
+
+            written.append(target)
+
+    return written
@@ -0,0 +1,13 @@
+# Expose the game server and its client at package level.
+# They are imported on first access so that a client does not pull in the server.
+import importlib
+
+_exports = {'GameServer': '.game_server', 'GameClient': '.client', 'ServerError': '.client'}
+
+__all__ = ['GameServer', 'GameClient', 'ServerError']
+
+
+def __getattr__(name):
+    if name in _exports:
+        return getattr(importlib.import_module(_exports[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,4 @@
+from .game_server import main
+
+if __name__ == "__main__":
+    main()
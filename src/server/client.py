@@ -0,0 +1,117 @@
+import asyncio
+import itertools
+from collections import deque
+
+from .protocol import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE, decode, encode
+
+
+class ServerError(Exception):
+    """Raised when the server answers a request with an error."""
+
+
+class GameClient:
+    """
+    Asyncio client for the game server.
+
+    One client owns one connection and may drive any number of sessions on it.
+    Concurrent requests are pipelined: each is written as soon as it is made,
+    and since the server answers in order, responses are matched first in,
+    first out.
+
+    Usage:
+        client = await GameClient.connect()
+        session = await client.new()
+        hand = (await client.deal(session))["hand"]
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self._ids = itertools.count(1)
+        self._waiting = deque()  # Futures of the requests sent, oldest first
+        self._reader_task = None
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def request(self, op, **fields):
+        """
+        Sends one request and returns its response.
+
+        Raises:
+            ServerError: If the response reports an error.
+            ConnectionError: If the server closed the connection.
+        """
+        message = {"id": next(self._ids), "op": op}
+        message.update(fields)
+        if self._reader_task is None:
+            self._reader_task = asyncio.create_task(self._read_responses())
+        elif self._reader_task.done():
+            raise ConnectionError("server closed the connection")
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.append(future)
+        self.writer.write(encode(message))
+        await self.writer.drain()
+
+        response = decode(await future)
+        if not response.get("ok"):
+            raise ServerError(response.get("error", "unknown error"))
+        return response
+
+    async def _read_responses(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line or not self._waiting:
+                    break
+                future = self._waiting.popleft()
+                if not future.done():
+                    future.set_result(line)
+        except ConnectionError:
+            pass
+        finally:
+            while self._waiting:
+                future = self._waiting.popleft()
+                if not future.done():
+                    future.set_exception(ConnectionError("server closed the connection"))
+
+    async def new(self, variant=None, seed=None):
+        """Starts a session and returns its id."""
+        fields = {}
+        if variant is not None:
+            fields["variant"] = variant
+        if seed is not None:
+            fields["seed"] = seed
+        return (await self.request("new", **fields))["session"]
+
+    async def deal(self, session):
+        return await self.request("deal", session=session)
+
+    async def discard(self, session, indices):
+        return await self.request("discard", session=session, indices=list(indices))
+
+    async def draw(self, session, count=None):
+        fields = {} if count is None else {"count": count}
+        return await self.request("draw", session=session, **fields)
+
+    async def evaluate(self, session):
+        return await self.request("evaluate", session=session)
+
+    async def state(self, session):
+        return await self.request("state", session=session)
+
+    async def end(self, session):
+        """Ends a session on the server."""
+        return await self.request("close", session=session)
+
+    async def close(self):
+        """Closes the connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
@@ -0,0 +1,252 @@
+"""
+Asyncio front end of the game server.
+
+Clients connect over TCP and exchange JSON lines (see server.protocol). The
+front end only parses a request far enough to find its session, then
+forwards it to the shard process owning that session; the shard's reply is
+written back to the client as is. A connection may drive any number of
+sessions, and its requests are answered in order.
+
+Run from the project root with the source folder on the path:
+
+    PYTHONPATH=src python -m server --port 8765 --workers 4
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import secrets
+import socket
+import zlib
+from pathlib import Path
+
+from .protocol import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE, ProtocolError, decode, encode, error
+from .shard import IDLE_TIMEOUT, MAX_RESIDENT, run_shard
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path("sessions")
+
+
+def shard_for(session_id, shards):
+    """Index of the shard owning `session_id`; stable across restarts."""
+    return zlib.crc32(session_id.encode("ascii")) % shards
+
+
+def raise_open_file_limit():
+    """Raises the soft limit of open files to the hard limit; every connection is a file descriptor."""
+    try:
+        import resource
+    except ImportError:
+        return  # Not available on Windows
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+class ShardLink:
+    """The front end's connection to one shard process."""
+
+    def __init__(self, index, store_path, idle_timeout, max_resident):
+        self.index = index
+        self.store_path = store_path
+        self.idle_timeout = idle_timeout
+        self.max_resident = max_resident
+        self.process = None
+        self._writer = None
+        self._reader_task = None
+        self._pending = {}  # seq -> Future of the reply line
+        self._seq = 0
+
+    async def start(self):
+        """Starts the shard process and the task reading its replies."""
+        parent, child = socket.socketpair()
+        context = multiprocessing.get_context("spawn")  # Forking a running event loop is unsafe
+        self.process = context.Process(
+            target=run_shard,
+            args=(child, str(self.store_path), self.idle_timeout, self.max_resident),
+            name=f"game-shard-{self.index}",
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+
+        reader, self._writer = await asyncio.open_connection(sock=parent, limit=MAX_LINE * 4)
+        self._reader_task = asyncio.create_task(self._read_replies(reader))
+
+    async def call(self, session_id, line):
+        """Forwards one request line and returns the shard's response line."""
+        if self._writer is None or self._writer.is_closing():
+            raise ConnectionError(f"shard {self.index} is not running")
+        self._seq += 1
+        seq = self._seq
+        future = asyncio.get_running_loop().create_future()
+        self._pending[seq] = future
+        self._writer.write(b"%d %s %s\n" % (seq, session_id.encode("ascii"), line.rstrip(b"\n")))
+        await self._writer.drain()
+        return await future
+
+    async def _read_replies(self, reader):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                seq, _, response = line.partition(b" ")
+                future = self._pending.pop(int(seq), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except ConnectionError:
+            logger.error("Lost the connection to shard %d", self.index)
+        finally:
+            # The shard is gone; fail whatever was still waiting on it
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"shard {self.index} stopped"))
+            self._pending.clear()
+
+    async def close(self):
+        """Closes the link; the shard stores its sessions and exits."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._reader_task is not None:
+            await self._reader_task
+        if self.process is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.process.join)
+
+
+class GameServer:
+    """
+    Hosts game sessions for many clients, sharded across worker processes.
+
+    Usage:
+        server = GameServer(port=0, workers=2)
+        await server.start()
+        ...
+        await server.close()
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, store_dir=DEFAULT_STORE_DIR,
+                 idle_timeout=IDLE_TIMEOUT, max_resident=MAX_RESIDENT):
+        """
+        Args:
+            host (str): Interface to listen on.
+            port (int): TCP port; 0 picks a free one (see `address`).
+            workers (int): Shard processes; defaults to the CPU count.
+            store_dir (str | Path): Folder of the evicted-session databases, one per shard.
+            idle_timeout (float): Seconds without a request before a session is evicted.
+            max_resident (int): Sessions kept in memory per shard.
+        """
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.store_dir = Path(store_dir)
+        self.shards = [
+            ShardLink(i, self.store_dir / f"shard-{i}.sqlite3", idle_timeout, max_resident)
+            for i in range(self.workers)
+        ]
+        self._server = None
+        self.connections = 0
+
+    @property
+    def address(self):
+        """(host, port) the server listens on."""
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self):
+        raise_open_file_limit()
+        await asyncio.gather(*(shard.start() for shard in self.shards))
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port, limit=MAX_LINE, backlog=4096
+        )
+        logger.info("Game server listening on %s:%d with %d shards", *self.address, self.workers)
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stops accepting clients and shuts the shards down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await asyncio.gather(*(shard.close() for shard in self.shards))
+
+    async def _handle_client(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(encode(error(None, "message too long")))
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                writer.write(await self._dispatch(line))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _dispatch(self, line):
+        # Returns the response line for one request line
+        try:
+            request = decode(line)
+        except ProtocolError as e:
+            return encode(error(None, str(e)))
+
+        request_id = request.get("id")
+        op = request.get("op")
+        if op == "ping":
+            return encode({"id": request_id, "ok": True})
+
+        if op == "new":
+            session_id = secrets.token_hex(8)
+        else:
+            session_id = request.get("session")
+            if not isinstance(session_id, str) or not session_id.isalnum() or not session_id.isascii():
+                return encode(error(request_id, "missing or invalid session"))
+
+        shard = self.shards[shard_for(session_id, len(self.shards))]
+        try:
+            return await shard.call(session_id, line)
+        except ConnectionError as e:
+            return encode(error(request_id, str(e)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Pip's Bluff game server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="Shard processes (default: CPU count)")
+    parser.add_argument("--store", default=str(DEFAULT_STORE_DIR), help="Folder for evicted sessions")
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT,
+                        help="Seconds before an idle session is moved to storage")
+    parser.add_argument("--max-resident", type=int, default=MAX_RESIDENT,
+                        help="Sessions kept in memory per shard")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = GameServer(args.host, args.port, args.workers, args.store, args.idle_timeout, args.max_resident)
+
+    async def run():
+        await server.start()
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,360 @@
+"""
+Synthetic clients for sizing and soak-testing the game server.
+
+Opens many concurrent sessions, each playing hands in a loop
+(new → deal → discard → draw → evaluate), and records a latency histogram
+per operation, throughput and errors, both for the whole run and for every
+reporting interval. Unless --connect is given, a server process is launched
+locally for the run, so no other infrastructure is needed.
+
+Run from the project root with the source folder on the path:
+
+    PYTHONPATH=src python -m server.loadgen --sessions 5000 --duration 60
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from latency import LatencyHistogram
+
+from .client import GameClient, ServerError
+from .game_server import raise_open_file_limit
+from .protocol import DEFAULT_HOST
+
+
+OPERATIONS = ("new", "deal", "discard", "draw", "evaluate")
+SERVER_START_TIMEOUT = 30.0  # Seconds to wait for a launched server to answer
+ERROR_BACKOFF = 0.05  # Seconds a session waits after an error, doubled per consecutive error
+MAX_BACKOFF = 2.0  # Longest wait between retries
+MAX_CONSECUTIVE_ERRORS = 5  # A session gives up after this many errors in a row
+
+
+def _discard_none(hand, rng):
+    return []
+
+
+def _discard_all(hand, rng):
+    return list(range(len(hand)))
+
+
+def _discard_random(hand, rng):
+    return [i for i in range(len(hand)) if rng.random() < 0.5]
+
+
+def _discard_unpaired(hand, rng):
+    # Keeps every card whose rank appears more than once, draws to the rest
+    # (jokers are 52 and 53, so they share rank 13 and are kept in pairs too)
+    ranks = [card >> 2 for card in hand]
+    return [i for i, rank in enumerate(ranks) if ranks.count(rank) == 1]
+
+
+POLICIES = {
+    "none": _discard_none,
+    "all": _discard_all,
+    "random": _discard_random,
+    "unpaired": _discard_unpaired,
+}
+
+
+class LoadStats:
+    """Latency, throughput and errors of a run, in total and per reporting interval."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.total = {op: LatencyHistogram() for op in OPERATIONS}
+        self.errors = {op: 0 for op in OPERATIONS}
+        self.error_messages = {}  # Error message -> count
+        self.hands = 0
+        self.abandoned = 0  # Sessions that gave up after repeated errors
+        self.timeline = []  # One report per interval
+        self._reset_window()
+
+    def _reset_window(self):
+        self.window_started = time.monotonic()
+        self.window = {op: LatencyHistogram() for op in OPERATIONS}
+        self.window_errors = 0
+        self.window_hands = 0
+
+    def record(self, op, ms):
+        self.window[op].record(ms)
+
+    def record_error(self, op, message):
+        self.errors[op] += 1
+        self.window_errors += 1
+        self.error_messages[message] = self.error_messages.get(message, 0) + 1
+
+    def record_abandoned(self):
+        self.abandoned += 1
+
+    def record_hand(self):
+        self.hands += 1
+        self.window_hands += 1
+
+    def close_window(self):
+        """Ends the current interval; returns its report."""
+        now = time.monotonic()
+        seconds = max(now - self.window_started, 1e-9)
+        operations = sum(histogram.count for histogram in self.window.values())
+        report = {
+            "t": round(now - self.started, 3),
+            "ops_per_s": round(operations / seconds, 1),
+            "hands_per_s": round(self.window_hands / seconds, 1),
+            "errors": self.window_errors,
+            "latency_ms": {
+                op: {"p50": histogram.percentile(0.5), "p99": histogram.percentile(0.99)}
+                for op, histogram in self.window.items() if histogram.count
+            },
+        }
+        for op, histogram in self.window.items():
+            self.total[op].merge(histogram)
+        self.timeline.append(report)
+        self._reset_window()
+        return report
+
+    def summary(self, sessions, connections):
+        seconds = max(time.monotonic() - self.started, 1e-9)
+        operations = sum(histogram.count for histogram in self.total.values())
+        attempts = operations + sum(self.errors.values())
+        return {
+            "sessions": sessions,
+            "connections": connections,
+            "seconds": round(seconds, 3),
+            "operations": operations,
+            "ops_per_s": round(operations / seconds, 1),
+            "hands": self.hands,
+            "hands_per_s": round(self.hands / seconds, 1),
+            "errors": dict(self.errors),
+            "error_rate": round(sum(self.errors.values()) / attempts, 6) if attempts else 0.0,
+            "error_messages": self.error_messages,
+            "abandoned_sessions": self.abandoned,
+            "latency": {op: histogram.to_dict() for op, histogram in self.total.items()},
+            "timeline": self.timeline,
+        }
+
+
+async def _timed(stats, op, call):
+    # Returns the response, or None if the server answered with an error; a lost
+    # connection is counted as an error too, then raised to end the session
+    start = time.perf_counter()
+    try:
+        response = await call
+    except ServerError as e:
+        stats.record_error(op, str(e))
+        return None
+    except ConnectionError as e:
+        stats.record_error(op, f"connection lost: {e}")
+        raise
+    stats.record(op, (time.perf_counter() - start) * 1000)
+    return response
+
+
+async def _play_hand(client, stats, policy, rng, session):
+    # Plays one hand; returns False as soon as an operation fails
+    dealt = await _timed(stats, "deal", client.deal(session))
+    if dealt is None:
+        return False
+    discard = policy(dealt["hand"], rng)
+    if discard:
+        if await _timed(stats, "discard", client.discard(session, discard)) is None:
+            return False
+        if await _timed(stats, "draw", client.draw(session)) is None:
+            return False
+    if await _timed(stats, "evaluate", client.evaluate(session)) is None:
+        return False
+    stats.record_hand()
+    return True
+
+
+async def play_session(client, stats, policy, rng, deadline, hands=None, variant=None):
+    """
+    Plays hands on one session until `deadline` (monotonic) or `hands` are done.
+
+    After a failed hand the session backs off, doubling the wait per
+    consecutive failure, and gives up after MAX_CONSECUTIVE_ERRORS in a row,
+    so a broken session does not hammer the server and skew the results.
+    A session that cannot be started or loses its connection is abandoned
+    at once.
+    """
+    try:
+        session = await _timed(stats, "new", client.new(variant=variant, seed=rng.getrandbits(63)))
+        if session is None:
+            stats.record_abandoned()
+            return
+        played = 0
+        failures = 0
+        while time.monotonic() < deadline and (hands is None or played < hands):
+            if await _play_hand(client, stats, policy, rng, session):
+                played += 1
+                failures = 0
+                continue
+            failures += 1
+            if failures >= MAX_CONSECUTIVE_ERRORS:
+                stats.record_abandoned()
+                return
+            backoff = min(ERROR_BACKOFF * 2 ** (failures - 1), MAX_BACKOFF)
+            await asyncio.sleep(min(backoff, max(deadline - time.monotonic(), 0)))
+    except ConnectionError:
+        stats.record_abandoned()  # Already counted as an error by _timed
+
+
+async def _report(stats, interval, out):
+    while True:
+        await asyncio.sleep(interval)
+        report = stats.close_window()
+        latency = "  ".join(
+            f"{op} {values['p50']:g}/{values['p99']:g}ms" for op, values in report["latency_ms"].items()
+        )
+        print(f"t={report['t']:7.1f}s  ops/s={report['ops_per_s']:9.1f}  hands/s={report['hands_per_s']:8.1f}  "
+              f"errors={report['errors']}  p50/p99: {latency}", file=out, flush=True)
+
+
+async def run_load(host, port, sessions=1000, connections=100, duration=30.0, hands=None,
+                   policy="unpaired", variant=None, seed=None, report_interval=5.0, out=sys.stdout):
+    """
+    Plays `sessions` concurrent sessions over `connections` connections.
+
+    Args:
+        duration (float): Seconds to run; sessions finish their current hand.
+        hands (int): Hands per session; stops earlier than `duration` when reached.
+        policy (str): Discard policy, a key of POLICIES.
+        variant (str): Paytable key of the sessions; the server default when None.
+        seed (int): Seed of the clients' choices, for repeatable runs.
+        report_interval (float): Seconds between interval reports.
+
+    Returns:
+        dict: Summary with totals, per-operation histograms and the timeline.
+    """
+    raise_open_file_limit()
+    rng = random.Random(seed)
+    stats = LoadStats()
+    clients = await asyncio.gather(*(GameClient.connect(host, port) for _ in range(min(connections, sessions))))
+    deadline = time.monotonic() + duration
+    reporter = asyncio.create_task(_report(stats, report_interval, out))
+    try:
+        results = await asyncio.gather(*(
+            play_session(clients[i % len(clients)], stats, POLICIES[policy],
+                         random.Random(rng.getrandbits(64)), deadline, hands, variant)
+            for i in range(sessions)
+        ), return_exceptions=True)
+    finally:
+        reporter.cancel()
+        await asyncio.gather(*(client.close() for client in clients))
+
+    stats.close_window()
+    # Anything else that ended a session early (connection errors are counted above)
+    for result in results:
+        if isinstance(result, Exception):
+            stats.error_messages[repr(result)] = stats.error_messages.get(repr(result), 0) + 1
+    return stats.summary(sessions, len(clients))
+
+
+def _free_port(host):
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def launch_server(host=DEFAULT_HOST, workers=None, store_dir=None):
+    """
+    Starts `python -m server` in a child process for the duration of the block.
+
+    Yields:
+        int: The port it listens on.
+    """
+    port = _free_port(host)
+    source_dir = str(Path(__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [source_dir, env.get("PYTHONPATH")]))
+
+    with tempfile.TemporaryDirectory(prefix="pips-load-") as temp_dir:
+        command = [sys.executable, "-m", "server", "--host", host, "--port", str(port),
+                   "--store", store_dir or temp_dir]
+        if workers:
+            command += ["--workers", str(workers)]
+        process = subprocess.Popen(command, env=env)
+        try:
+            asyncio.run(_wait_for_server(host, port, process))
+            yield port
+        finally:
+            if process.poll() is None:
+                # SIGINT lets the server close its shards; Windows has no equivalent for a child
+                if os.name == "nt":
+                    process.terminate()
+                else:
+                    process.send_signal(signal.SIGINT)
+                try:
+                    process.wait(timeout=SERVER_START_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+
+
+async def _wait_for_server(host, port, process):
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while True:
+        if process.poll() is not None:
+            raise RuntimeError(f"game server exited with code {process.returncode}")
+        try:
+            client = await GameClient.connect(host, port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError("game server did not start in time") from None
+            await asyncio.sleep(0.1)
+            continue
+        await client.request("ping")
+        await client.close()
+        return
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the Pip's Bluff game server.")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="Use a running server instead of launching one")
+    parser.add_argument("--workers", type=int, default=None, help="Shard processes of the launched server")
+    parser.add_argument("--sessions", type=int, default=1000, help="Concurrent sessions")
+    parser.add_argument("--connections", type=int, default=100, help="Connections the sessions share")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--hands", type=int, default=None, help="Stop each session after this many hands")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="unpaired", help="Which cards to discard")
+    parser.add_argument("--variant", default=None, help="Paytable key of the sessions")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the clients' choices")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between progress reports")
+    parser.add_argument("--output", help="Write the full report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    def run(host, port):
+        return asyncio.run(run_load(
+            host, port, args.sessions, args.connections, args.duration, args.hands,
+            args.policy, args.variant, args.seed, args.interval,
+        ))
+
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        summary = run(host or DEFAULT_HOST, int(port))
+    else:
+        with launch_server(workers=args.workers) as port:
+            summary = run(DEFAULT_HOST, port)
+
+    print(f"{summary['hands']} hands, {summary['operations']} operations in {summary['seconds']}s: "
+          f"{summary['ops_per_s']} ops/s, error rate {summary['error_rate']:.4%}, "
+          f"{summary['abandoned_sessions']} sessions abandoned")
+    for op, latency in summary["latency"].items():
+        print(f"  {op:<9} n={latency['count']:<8} mean={latency['mean_ms']}ms  min={latency['min_ms']}ms  "
+              f"p50={latency['p50_ms']}ms  p95={latency['p95_ms']}ms  p99={latency['p99_ms']}ms  "
+              f"max={latency['max_ms']}ms")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
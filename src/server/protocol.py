@@ -0,0 +1,60 @@
+"""
+Wire format of the game server.
+
+Every message is one JSON object on its own line (UTF-8, terminated by "\\n").
+A request names an operation and, except for "new", the session it acts on:
+
+    {"id": 7, "op": "discard", "session": "9f2c...", "indices": [0, 3]}
+
+The response echoes the request id, and carries "ok" plus either the
+operation's result or an "error" message:
+
+    {"id": 7, "ok": true, "hand": [51, 12, 40], "discarded": [3, 7]}
+    {"id": 7, "ok": false, "error": "unknown session"}
+
+Cards are sent as card ids (see game.evaluator): rank * 4 + suit, with the
+jokers as 52 and 53.
+"""
+import json
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_LINE = 64 * 1024  # Longest accepted message, in bytes
+
+OPERATIONS = ("new", "deal", "discard", "draw", "evaluate", "state", "close", "ping")
+
+
+class ProtocolError(Exception):
+    """Raised for a message that is not a valid request or response."""
+
+
+def encode(message):
+    """Returns `message` as one line of compact JSON."""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode(line):
+    """
+    Parses one line into a message.
+
+    Raises:
+        ProtocolError: If the line is not a JSON object.
+    """
+    try:
+        message = json.loads(line)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ProtocolError(f"invalid JSON: {e}") from None
+    if not isinstance(message, dict):
+        raise ProtocolError("a message must be a JSON object")
+    return message
+
+
+def is_integer(value):
+    """True for a JSON integer; JSON true/false decode to bool, which Python counts as int."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def error(request_id, message):
+    """Returns an error response for the request `request_id`."""
+    return {"id": request_id, "ok": False, "error": message}
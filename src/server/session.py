@@ -0,0 +1,201 @@
+"""
+Compact per-session game state and the operations played on it.
+
+A server holds thousands of games at once, so a session does not keep a
+GameEngine with its Card objects. The deck, hand and discard pile are byte
+strings of card ids, and the shuffle of every hand is derived from the
+session seed and the hand number, so no random generator state is kept
+either. The rules are the same as GameEngine's: cards are dealt from the
+end of the deck, and hands are scored with the variant's paytable.
+"""
+import random
+import struct
+import time
+
+from game.evaluator import CLASS_NAMES, JOKER_IDS, evaluate
+from game.paytable import get_paytable, load_paytables
+from game.wild import DEUCES_WILD, JOKER_POKER, WildEvaluator
+
+from .protocol import is_integer
+
+
+HAND_SIZE = 5
+DEFAULT_VARIANT = "default"
+WILD_VARIANTS = {"deuces_wild": DEUCES_WILD, "joker_poker": JOKER_POKER}
+
+# version, variant index, open hand, seed, hands dealt, score, hands played,
+# then the lengths of the deck, hand and discard pile
+_STATE = struct.Struct("<BBBQIqIBBB")
+_STATE_VERSION = 1
+
+_variants = None  # Sorted variant keys; the index of a key is stored in the state
+_evaluators = {}  # Variant key -> function scoring card ids
+
+
+class SessionError(Exception):
+    """Raised for an operation the session cannot perform; sent back as the error message."""
+
+
+def variants():
+    """Returns every variant key, i.e. every paytable in game/paytables.json."""
+    global _variants
+    if _variants is None:
+        _variants = sorted(load_paytables())
+    return _variants
+
+
+def _evaluator(variant):
+    evaluate_ids = _evaluators.get(variant)
+    if evaluate_ids is None:
+        rules = WILD_VARIANTS.get(variant)
+        evaluate_ids = WildEvaluator(rules).evaluate if rules else evaluate
+        _evaluators[variant] = evaluate_ids
+    return evaluate_ids
+
+
+class Session:
+    """One game: a deck, a hand, a discard pile and the running score."""
+
+    __slots__ = (
+        "id", "variant", "seed", "deals", "deck", "hand", "discards",
+        "score", "hands_played", "open", "last_seen",
+    )
+
+    def __init__(self, session_id, variant=DEFAULT_VARIANT, seed=None):
+        """
+        Args:
+            session_id (str): Key of the session.
+            variant (str): Paytable key, e.g. "jacks_or_better" or "deuces_wild".
+            seed (int): Seed of every shuffle in this session; random when None.
+
+        Raises:
+            SessionError: If the variant does not exist.
+        """
+        if variant not in variants():
+            raise SessionError(f"unknown variant {variant!r}")
+        self.id = session_id
+        self.variant = variant
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.deals = 0  # Hands dealt so far; numbers the shuffle of the next hand
+        self.deck = bytearray()
+        self.hand = bytearray()
+        self.discards = bytearray()
+        self.score = 0
+        self.hands_played = 0
+        self.open = False  # True between deal and evaluate
+        self.last_seen = time.monotonic()
+
+    def to_bytes(self):
+        """Packs the session into a few dozen bytes for storage."""
+        header = _STATE.pack(
+            _STATE_VERSION, variants().index(self.variant), self.open, self.seed, self.deals,
+            self.score, self.hands_played, len(self.deck), len(self.hand), len(self.discards),
+        )
+        return header + self.deck + self.hand + self.discards
+
+    @classmethod
+    def from_bytes(cls, session_id, data):
+        """
+        Restores a session packed by to_bytes().
+
+        Raises:
+            SessionError: If the data was written by an incompatible version.
+        """
+        (version, variant, is_open, seed, deals, score, hands_played,
+         deck_size, hand_size, discard_size) = _STATE.unpack_from(data)
+        if version != _STATE_VERSION:
+            raise SessionError("stored session has an unsupported version")
+
+        session = cls(session_id, variants()[variant], seed)
+        session.open = bool(is_open)
+        session.deals = deals
+        session.score = score
+        session.hands_played = hands_played
+        start = _STATE.size
+        session.deck = bytearray(data[start:start + deck_size])
+        start += deck_size
+        session.hand = bytearray(data[start:start + hand_size])
+        start += hand_size
+        session.discards = bytearray(data[start:start + discard_size])
+        return session
+
+    def apply(self, op, request):
+        """
+        Runs the operation `op` with the arguments in `request`.
+
+        Returns:
+            dict: The result fields of the response.
+
+        Raises:
+            SessionError: If the operation is unknown or not allowed right now.
+        """
+        self.last_seen = time.monotonic()
+        handler = getattr(self, f"op_{op}", None)
+        if handler is None:
+            raise SessionError(f"unknown operation {op!r}")
+        return handler(request)
+
+    def _require_open(self):
+        if not self.open:
+            raise SessionError("no hand in progress; deal first")
+
+    def op_deal(self, request):
+        # A fresh shuffled deck for every hand, like GameEngine.initialize_game
+        jokers = WILD_VARIANTS[self.variant].jokers if self.variant in WILD_VARIANTS else 0
+        cards = list(range(52)) + list(JOKER_IDS.values())[:jokers]
+        random.Random(f"{self.seed}:{self.deals}").shuffle(cards)
+        self.deals += 1
+
+        self.deck = bytearray(cards)
+        self.hand = bytearray(reversed(self.deck[-HAND_SIZE:]))
+        del self.deck[-HAND_SIZE:]
+        self.discards = bytearray()
+        self.open = True
+        return {"hand": list(self.hand), "deck": len(self.deck)}
+
+    def op_discard(self, request):
+        self._require_open()
+        indices = request.get("indices", [])
+        if not isinstance(indices, list) or not all(is_integer(i) for i in indices):
+            raise SessionError("indices must be a list of integers")
+
+        discarded = []
+        for i in sorted(set(indices), reverse=True):
+            if 0 <= i < len(self.hand):
+                discarded.append(self.hand.pop(i))
+        self.discards.extend(discarded)
+        return {"hand": list(self.hand), "discarded": discarded}
+
+    def op_draw(self, request):
+        self._require_open()
+        count = request.get("count", HAND_SIZE - len(self.hand))
+        if not is_integer(count) or not 0 <= count <= HAND_SIZE - len(self.hand):
+            raise SessionError("count must fill the hand to at most five cards")
+
+        # Taken from the end of the deck, like Deck.deal
+        drawn = list(reversed(self.deck[len(self.deck) - count:])) if count else []
+        del self.deck[len(self.deck) - len(drawn):]
+        self.hand.extend(drawn)
+        return {"hand": list(self.hand), "drawn": drawn, "deck": len(self.deck)}
+
+    def op_evaluate(self, request):
+        self._require_open()
+        if len(self.hand) != HAND_SIZE:
+            raise SessionError("the hand must hold five cards")
+
+        strength = _evaluator(self.variant)(list(self.hand))
+        points = get_paytable(self.variant).scores[strength]
+        self.score += points
+        self.hands_played += 1
+        self.open = False
+        return {"type": CLASS_NAMES[strength], "score": points, "strength": strength, "total": self.score}
+
+    def op_state(self, request):
+        return {
+            "variant": self.variant,
+            "hand": list(self.hand),
+            "deck": len(self.deck),
+            "open": self.open,
+            "score": self.score,
+            "hands_played": self.hands_played,
+        }
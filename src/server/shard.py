@@ -0,0 +1,167 @@
+"""
+Worker process holding one shard of the sessions.
+
+The front server sends one request per line over a socket pair, prefixed
+with a sequence number and the session id it routed on:
+
+    <seq> <session id> <request JSON>
+
+and the shard answers with the sequence number and the response JSON.
+Requests are handled in the order they arrive, so a session never sees two
+operations at once. Sessions idle for longer than `idle_timeout` seconds,
+or the least recently used ones beyond `max_resident`, are packed into the
+shard's SessionStore and loaded back on their next request.
+"""
+import json
+import logging
+import select
+import signal
+import time
+from collections import OrderedDict
+
+from .protocol import error, is_integer
+from .session import DEFAULT_VARIANT, Session, SessionError
+from .store import SessionStore
+
+
+logger = logging.getLogger(__name__)
+
+IDLE_TIMEOUT = 300.0  # Seconds without a request before a session is evicted
+MAX_RESIDENT = 50_000  # Sessions kept in memory per shard
+SWEEP_INTERVAL = 1.0  # Seconds between checks for idle sessions
+
+
+class Shard:
+    """The sessions of one worker process, in least recently used order."""
+
+    def __init__(self, store, idle_timeout=IDLE_TIMEOUT, max_resident=MAX_RESIDENT):
+        self.store = store
+        self.idle_timeout = idle_timeout
+        self.max_resident = max_resident
+        self.sessions = OrderedDict()  # id -> Session, least recently used first
+        self.evicted = 0
+        self._next_sweep = time.monotonic() + SWEEP_INTERVAL
+
+    def handle_line(self, line):
+        """Handles one `<seq> <session id> <request JSON>` line and returns the reply line."""
+        seq, _, rest = line.partition(b" ")
+        request = None
+        try:
+            session_id, payload = rest.split(b" ", 1)
+            request = json.loads(payload)
+            response = self.handle(session_id.decode("ascii"), request)
+        except Exception as e:
+            # One bad request must not take the shard, and every session on it, down
+            logger.exception("Request failed on the shard")
+            request_id = request.get("id") if isinstance(request, dict) else None
+            response = error(request_id, f"internal error: {e}")
+        return seq + b" " + json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    def handle(self, session_id, request):
+        """Runs one request and returns its response."""
+        request_id = request.get("id")
+        op = request.get("op")
+        try:
+            if op == "new":
+                result = self._new(session_id, request)
+            elif op == "close":
+                self.sessions.pop(session_id, None)
+                self.store.delete(session_id)
+                result = {}
+            else:
+                result = self._session(session_id).apply(op, request)
+        except SessionError as e:
+            return error(request_id, str(e))
+        except (TypeError, ValueError) as e:
+            return error(request_id, f"bad request: {e}")
+
+        response = {"id": request_id, "ok": True}
+        response.update(result)
+        return response
+
+    def _new(self, session_id, request):
+        seed = request.get("seed")
+        if seed is not None and not (is_integer(seed) and 0 <= seed < 2 ** 64):
+            raise SessionError("seed must be an integer from 0 to 2**64 - 1")
+        session = Session(session_id, request.get("variant", DEFAULT_VARIANT), seed)
+        self.sessions[session_id] = session
+        self._limit()
+        return {"session": session_id, "variant": session.variant, "seed": session.seed}
+
+    def _session(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+            return session
+
+        data = self.store.get(session_id)
+        if data is None:
+            raise SessionError("unknown session")
+        session = Session.from_bytes(session_id, data)
+        self.sessions[session_id] = session
+        self._limit()
+        return session
+
+    def _limit(self):
+        # Evicts the least recently used sessions beyond max_resident
+        excess = len(self.sessions) - self.max_resident
+        if excess > 0:
+            self._evict([self.sessions.popitem(last=False)[1] for _ in range(excess)])
+
+    def _evict(self, sessions):
+        if sessions:
+            self.store.put_many([(session.id, session.to_bytes()) for session in sessions])
+            self.evicted += len(sessions)
+
+    def sweep(self, now=None):
+        """Evicts every session idle for longer than idle_timeout."""
+        now = time.monotonic() if now is None else now
+        self._next_sweep = now + SWEEP_INTERVAL
+        cutoff = now - self.idle_timeout
+        idle = []
+        for session in self.sessions.values():
+            if session.last_seen > cutoff:
+                break  # Ordered by last use, so every later session is newer
+            idle.append(session)
+        for session in idle:
+            del self.sessions[session.id]
+        self._evict(idle)
+
+    def sweep_if_due(self):
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self.sweep(now)
+
+    def close(self):
+        """Stores every resident session, so a restarted server picks them up."""
+        self._evict(list(self.sessions.values()))
+        self.sessions.clear()
+        self.store.close()
+
+
+def run_shard(sock, store_path, idle_timeout=IDLE_TIMEOUT, max_resident=MAX_RESIDENT):
+    """
+    Entry point of a shard process: serves requests from `sock` until the
+    front server closes it.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # The front server shuts us down
+    shard = Shard(SessionStore(store_path), idle_timeout, max_resident)
+    buffer = b""
+    try:
+        while True:
+            readable, _, _ = select.select([sock], [], [], SWEEP_INTERVAL)
+            if not readable:
+                shard.sweep()
+                continue
+            chunk = sock.recv(256 * 1024)
+            if not chunk:
+                break
+
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            # All replies to one read go back in a single write
+            sock.sendall(b"".join(shard.handle_line(line) for line in lines))
+            shard.sweep_if_due()
+    finally:
+        shard.close()
+        sock.close()
@@ -0,0 +1,50 @@
+import sqlite3
+from pathlib import Path
+
+
+class SessionStore:
+    """
+    Packed sessions that were evicted from memory, kept in an SQLite file.
+
+    Each shard process owns its own file, so writes never wait on another
+    process's lock.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str | Path): Database file; ":memory:" keeps nothing across restarts.
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, state BLOB NOT NULL)"
+        )
+        self.connection.commit()
+
+    def get(self, session_id):
+        """Returns the packed state of a session, or None if it is not stored."""
+        row = self.connection.execute("SELECT state FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, items):
+        """Stores [(session id, packed state)] in one transaction."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO sessions (id, state) VALUES (?, ?)", items
+            )
+
+    def delete(self, session_id):
+        """Forgets a session."""
+        with self.connection:
+            self.connection.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def count(self):
+        """Number of stored sessions."""
+        return self.connection.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
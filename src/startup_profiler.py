@@ -0,0 +1,170 @@
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+
+# Set to 1 to print the startup report, or to a file path to also save it as JSON.
+ENV_VAR = "PIPS_PROFILE_STARTUP"
+
+
+class _TimedLoader:
+    """Wraps a module loader and reports how long executing the module takes."""
+
+    def __init__(self, loader, timer, name):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._timer.enter()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(self._name, start)
+
+
+class ImportTimer:
+    """
+    Records the self and cumulative time of every module import,
+    like `python -X importtime`, but collected inside the running process.
+    """
+
+    def __init__(self):
+        self.records = []  # (module, self ms, cumulative ms, depth)
+        self._children = []  # Time spent in nested imports, one entry per active import
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        # Let the real finders locate the module, then time its loader
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self, fullname)
+                return spec
+        return None
+
+    def enter(self):
+        self._children.append(0.0)
+
+    def leave(self, name, start):
+        cumulative = (time.perf_counter() - start) * 1000
+        nested = self._children.pop()
+        if self._children:
+            self._children[-1] += cumulative
+        self.records.append((name, cumulative - nested, cumulative, len(self._children)))
+
+    def slowest(self, count=15):
+        """Returns the `count` imports with the highest cumulative time."""
+        return sorted(self.records, key=lambda record: record[2], reverse=True)[:count]
+
+
+class StartupProfiler:
+    """
+    Times the phases of application startup up to the first paint of the window.
+
+    When disabled every method is a cheap no-op, so the entry point can keep
+    its phase markers in place.
+    """
+
+    def __init__(self, enabled=False, output=None):
+        self.enabled = enabled
+        self.output = output  # Optional JSON report path
+        self.start = time.perf_counter()
+        self.phases = []  # (name, start ms, duration ms)
+        self.first_paint = None  # ms since start
+        self.imports = ImportTimer() if enabled else None
+
+        if self.imports:
+            self.imports.install()
+
+    @classmethod
+    def from_env(cls, environ):
+        """Builds a profiler configured by the PIPS_PROFILE_STARTUP variable."""
+        value = environ.get(ENV_VAR, "")
+        if not value or value == "0":
+            return cls(enabled=False)
+        return cls(enabled=True, output=None if value == "1" else value)
+
+    def _elapsed(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        """Times the enclosed block as one startup phase."""
+        if not self.enabled:
+            yield
+            return
+
+        begin = self._elapsed()
+        try:
+            yield
+        finally:
+            self.phases.append((name, begin, self._elapsed() - begin))
+
+    def watch_first_paint(self, root):
+        """Reports once `root` is first drawn on screen."""
+        if not self.enabled:
+            return
+
+        def on_expose(event):
+            if self.first_paint is None and event.widget is root:
+                self.first_paint = self._elapsed()
+                self.finish()
+
+        root.bind("<Expose>", on_expose, add="+")
+
+    def finish(self):
+        """Stops timing imports and prints (and optionally saves) the report."""
+        if self.imports:
+            self.imports.uninstall()
+
+        print(self.format_report(), file=sys.stderr)
+
+        if self.output:
+            with open(self.output, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, indent=2)
+
+    def report(self):
+        """Returns the collected timings as a JSON-serializable dict."""
+        return {
+            "phases": [
+                {"name": name, "start_ms": round(begin, 2), "duration_ms": round(duration, 2)}
+                for name, begin, duration in self.phases
+            ],
+            "first_paint_ms": None if self.first_paint is None else round(self.first_paint, 2),
+            "imports": [
+                {"module": name, "self_ms": round(own, 2), "cumulative_ms": round(total, 2), "depth": depth}
+                for name, own, total, depth in (self.imports.records if self.imports else [])
+            ],
+        }
+
+    def format_report(self):
+        lines = ["Startup profile (ms):"]
+        for name, begin, duration in self.phases:
+            lines.append(f"  {name:<24}{duration:>9.1f}   (at {begin:.1f})")
+        if self.first_paint is not None:
+            lines.append(f"  {'first paint':<24}{self.first_paint:>9.1f}")
+
+        if self.imports and self.imports.records:
+            lines.append("Slowest imports (self | cumulative ms):")
+            for name, own, total, depth in self.imports.slowest():
+                lines.append(f"  {own:>8.1f} | {total:>8.1f} | {'  ' * depth}{name}")
+
+        return "\n".join(lines)
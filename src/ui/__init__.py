@@ -1,5 +1,13 @@
-# Expose UI components at package level
-from .login_ui import LoginUI
-from .register_ui import RegisterUI
+# Expose UI components at package level.
+# They are imported on first access so that importing one screen does not load the others.
+import importlib
 
-__all__ = ['LoginUI', 'RegisterUI']
\ No newline at end of file
+_exports = {'LoginUI': '.login_ui', 'RegisterUI': '.register_ui'}
+
+__all__ = ['LoginUI', 'RegisterUI']
+
+
+def __getattr__(name):
+    if name in _exports:
+        return getattr(importlib.import_module(_exports[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,5 +1,7 @@
 import tkinter as tk
-from PIL import Image, ImageTk
+
+from resources.manifest import LOGO_PATH
+from resources.registry import AssetRegistry
 
 
 class AboutUI:
@@ -63,11 +65,10 @@ Developed by: Yara:)
 
     def add_logo_image(self):
         try:
-            about_img = Image.open("assets/images/logo.png").resize(
-                (200, 200),
-                Image.LANCZOS
+            self.about_photo = AssetRegistry.for_widget(self.parent).photo(
+                LOGO_PATH,
+                (200, 200)
             )
-            self.about_photo = ImageTk.PhotoImage(about_img)
 
             tk.Label(
                 self.frame,
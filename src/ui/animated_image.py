@@ -0,0 +1,146 @@
+import threading
+
+from PIL import Image, ImageTk
+
+from resources import disk_cache
+from resources.scaled import iter_scaled_frames
+
+
+DEFAULT_FRAME_DURATION = 100  # ms, used when a frame carries no duration
+MIN_FRAME_DURATION = 20  # ms, browsers clamp shorter GIF delays the same way
+
+
+class _FrameSequence:
+    """
+    Decoded, scaled frames of one animation, filled in as they are first requested.
+
+    Once every frame has been decoded the whole sequence is written to the
+    disk cache, and later launches map it from there in one go.
+    """
+
+    def __init__(self, source, size, resample):
+        self._key = (source, size, resample)
+        self._raw_durations = []  # As stored in the file, for the disk cache
+        self.images = []
+        self.durations = []
+        self.complete = False
+
+        cached = disk_cache.load_frames(source, size, resample)
+        if cached:
+            self._frames = None
+            for image, duration in cached:
+                self._append(image, duration)
+            self.complete = True
+        else:
+            self._frames = iter_scaled_frames(source, size, resample)
+
+    def _append(self, image, duration):
+        self.images.append(image)
+        self._raw_durations.append(duration)
+        self.durations.append(max(duration or DEFAULT_FRAME_DURATION, MIN_FRAME_DURATION))
+
+    def get(self, index):
+        """Returns (image, duration) for frame `index`, decoding up to it if needed."""
+        while index >= len(self.images) and not self.complete:
+            try:
+                image, duration = next(self._frames)
+            except StopIteration:
+                self.complete = True
+                self._frames = None
+                # Several MB of pixels; write them without holding up the animation
+                threading.Thread(
+                    target=disk_cache.store_frames,
+                    args=(*self._key, list(zip(self.images, self._raw_durations))),
+                    daemon=True
+                ).start()
+                break
+
+            self._append(image, duration)
+
+        if not self.images:
+            raise ValueError("Animation has no frames")
+
+        index %= len(self.images)
+        return self.images[index], self.durations[index]
+
+    def next_index(self, index):
+        """Returns the index shown after `index`, wrapping once every frame is known."""
+        if self.complete and index + 1 >= len(self.images):
+            return 0
+        return index + 1
+
+
+# Converted frames are kept for the whole process so revisiting a page does not decode again
+_sequences = {}
+
+
+def _get_sequence(source, size, resample):
+    key = (str(source), tuple(size), resample)
+    if key not in _sequences:
+        _sequences[key] = _FrameSequence(source, size, resample)
+    return _sequences[key]
+
+
+class AnimatedImage:
+    """
+    Plays an animated image inside a Label.
+
+    Frames are decoded and scaled only when they are first displayed, and each
+    frame stays on screen for its own duration. The Tk images are released as
+    soon as the player stops, including when its label is destroyed.
+
+    With a Scheduler the frames are timed by its shared tick and pause while
+    the window is hidden; without one the label's own after() is used.
+    """
+
+    def __init__(self, label, source, size, resample=Image.LANCZOS, scheduler=None):
+        self.label = label
+        self.scheduler = scheduler
+        self.sequence = _get_sequence(source, size, resample)
+        self.photos = {}  # Frame index -> PhotoImage, only while playing
+        self.index = 0
+        self.after_id = None  # after() id, or Task when driven by the scheduler
+
+        self.label.bind("<Destroy>", lambda e: self.stop(), add="+")
+
+    @property
+    def playing(self):
+        return self.after_id is not None
+
+    def play(self):
+        """Starts (or resumes) the animation from the current frame."""
+        if not self.playing:
+            self._show_frame()
+
+    def stop(self):
+        """Stops the animation and frees its Tk images."""
+        if self.after_id is not None:
+            if self.scheduler is not None:
+                self.scheduler.cancel(self.after_id)
+            else:
+                try:
+                    self.label.after_cancel(self.after_id)
+                except Exception:
+                    pass  # The interpreter may already be gone
+            self.after_id = None
+        self.photos = {}
+
+    def _show_frame(self):
+        if not self.label.winfo_exists():
+            self.stop()
+            return
+
+        image, duration = self.sequence.get(self.index)
+
+        photo = self.photos.get(self.index)
+        if photo is None:
+            photo = self.photos[self.index] = ImageTk.PhotoImage(image)
+        self.label.configure(image=photo)
+
+        self.index = self.sequence.next_index(self.index)
+        if self.scheduler is not None:
+            self.after_id = self.scheduler.call_later(
+                duration, self._show_frame, owner=self.label, animation=True
+            )
+        else:
+            self.after_id = self.label.after(duration, self._show_frame)
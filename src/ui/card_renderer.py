@@ -0,0 +1,91 @@
+from resources.card_sets import CARD_IMAGES_DIR, card_resample, card_source, quantize_scale, scaled_size
+from resources.registry import AssetRegistry
+
+
+class CardRenderer:
+    """
+    Card PhotoImages sized for the space they are shown in.
+
+    Each card is scaled from the card set closest to its display size (see
+    resources.card_sets). When attached to a widget with track(), the cards
+    follow that widget's size in SCALE_LEVELS steps: <Configure> events are
+    debounced, and `on_rescale` is only called once the scale level changes.
+    Images of every level stay in the asset registry, so going back to a
+    level seen before costs nothing.
+    """
+
+    def __init__(self, widget, base_size, images_dir=CARD_IMAGES_DIR, resample=None, debounce_ms=150):
+        """
+        Args:
+            widget: Any widget of the Tk root the images are shown in.
+            base_size (tuple): Card size as (width, height) at scale 1.0.
+            images_dir (str | Path): Folder holding the card set folders.
+            resample: Pillow resampling filter (or its name), None for the default.
+            debounce_ms (int): Quiet time after the last resize before rescaling.
+        """
+        self.registry = AssetRegistry.for_widget(widget)
+        self.base_size = tuple(base_size)
+        self.images_dir = images_dir
+        self.resample = resample
+        self.debounce_ms = debounce_ms
+        self.scale = 1.0
+
+        self.tracked = None
+        self.on_rescale = None
+        self.reference_size = None  # Size of the tracked widget at scale 1.0
+        self._pending_id = None
+
+    @property
+    def size(self):
+        """Current card size as (width, height)."""
+        return scaled_size(self.base_size, self.scale)
+
+    def source(self, file_name):
+        """Returns the image file the card `file_name` is scaled from at the current size."""
+        return card_source(file_name, self.size, self.images_dir)
+
+    def photo(self, file_name):
+        """
+        Returns the PhotoImage of the card `file_name` at the current size.
+
+        Raises:
+            OSError: If the card image cannot be read.
+        """
+        return self.registry.photo(self.source(file_name), self.size, card_resample(self.size, self.resample))
+
+    def prefetch(self, file_name):
+        """Decodes the card `file_name` at the current size on a worker thread."""
+        self.registry.prefetch(self.source(file_name), self.size, card_resample(self.size, self.resample))
+
+    def track(self, widget, on_rescale):
+        """
+        Scales the cards with `widget`, calling `on_rescale()` when the level changes.
+
+        The first size the widget is laid out at counts as scale 1.0.
+        """
+        self.tracked = widget
+        self.on_rescale = on_rescale
+        widget.bind("<Configure>", self._on_configure, add="+")
+
+    def _on_configure(self, event):
+        if event.widget is not self.tracked:
+            return
+        if self._pending_id is not None:
+            self.tracked.after_cancel(self._pending_id)
+        self._pending_id = self.tracked.after(self.debounce_ms, self._apply_size, event.width, event.height)
+
+    def _apply_size(self, width, height):
+        self._pending_id = None
+        if width <= 1 or height <= 1:
+            return  # Not laid out yet
+
+        if self.reference_size is None:
+            self.reference_size = (width, height)
+            return
+
+        reference_width, reference_height = self.reference_size
+        scale = quantize_scale(min(width / reference_width, height / reference_height))
+        if scale != self.scale:
+            self.scale = scale
+            if self.on_rescale is not None:
+                self.on_rescale()
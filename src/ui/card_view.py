@@ -0,0 +1,121 @@
+import tkinter as tk
+
+
+SELECTED_BG = '#FF6F61'
+NORMAL_BG = 'white'
+SELECTED_BORDER = '#FF0000'
+NORMAL_BORDER = '#F5F5F5'
+
+
+class CardSlot:
+    """One persistent Frame/Label pair showing the card at a fixed hand position."""
+
+    def __init__(self, parent, column, on_click):
+        self.frame = tk.Frame(parent, bg=NORMAL_BORDER, bd=2, relief='ridge')
+        self.label = tk.Label(self.frame, bg=NORMAL_BG)
+        self.label.pack(padx=5, pady=5)
+        self.label.bind("<Button-1>", lambda e: on_click(column))
+        self.column = column
+
+        self.shown = None  # Last applied (card key, selected), None when hidden
+        self.visible = False
+
+    def show(self, card, photo, selected):
+        """Applies only the properties that differ from what is already on screen."""
+        key = (card.suit, card.value)
+        if not self.visible:
+            self.frame.grid(row=0, column=self.column, padx=10)
+            self.visible = True
+
+        previous_key, previous_selected = self.shown or (None, None)
+
+        if key != previous_key:
+            if photo is not None:
+                self.label.configure(image=photo, text='', width=0, height=0)
+            else:
+                # Fall back to text if the card image cannot be loaded
+                self.label.configure(image='', text=str(card), width=10, height=5)
+
+        if selected != previous_selected:
+            self.label.configure(bg=SELECTED_BG if selected else NORMAL_BG)
+            self.frame.configure(bg=SELECTED_BORDER if selected else NORMAL_BORDER)
+
+        self.shown = (key, selected)
+
+    def hide(self):
+        if self.visible:
+            self.frame.grid_remove()
+            self.visible = False
+        self.shown = None
+
+
+class CardHandView:
+    """
+    Retained view of the cards in a hand.
+
+    Slots are created once and updated in place, so changing a selection only
+    reconfigures the colours of one slot. refresh() coalesces any number of
+    requests into a single update on the next idle cycle.
+    """
+
+    def __init__(self, parent, get_state, get_file_name, on_click, renderer):
+        """
+        Args:
+            parent: Frame to grid the card slots into.
+            get_state: Returns (cards, selected indices) to display.
+            get_file_name: Returns the image file name of a card, e.g. "card_hearts_A.png".
+            on_click: Called with the slot index when a card is clicked.
+            renderer (CardRenderer): Supplies the card images at the current size.
+        """
+        self.parent = parent
+        self.get_state = get_state
+        self.get_file_name = get_file_name
+        self.on_click = on_click
+        self.renderer = renderer
+        self.slots = []
+        self._idle_id = None
+
+    def refresh(self):
+        """Schedules one render for the next idle cycle."""
+        if self._idle_id is None:
+            self._idle_id = self.parent.after_idle(self._render_idle)
+
+    def render(self):
+        """Brings every slot up to date with the current state right away."""
+        if self._idle_id is not None:
+            self.parent.after_cancel(self._idle_id)
+            self._idle_id = None
+
+        cards, selected = self.get_state()
+
+        while len(self.slots) < len(cards):
+            self.slots.append(CardSlot(self.parent, len(self.slots), self.on_click))
+
+        for i, slot in enumerate(self.slots):
+            if i < len(cards):
+                slot.show(cards[i], self._photo_for(cards[i], slot), i in selected)
+            else:
+                slot.hide()
+
+    def rescale(self):
+        """Swaps every card image for one at the renderer's new size."""
+        for slot in self.slots:
+            slot.shown = None  # Forces the image (and colours) to be applied again
+        self.render()
+
+    def prefetch(self, card):
+        """Decodes the image of a card about to be shown on a worker thread."""
+        self.renderer.prefetch(self.get_file_name(card))
+
+    def _render_idle(self):
+        self._idle_id = None
+        if self.parent.winfo_exists():
+            self.render()
+
+    def _photo_for(self, card, slot):
+        if slot.shown and slot.shown[0] == (card.suit, card.value):
+            return None  # Unchanged card, the slot keeps its image
+        try:
+            return self.renderer.photo(self.get_file_name(card))
+        except Exception:
+            return None
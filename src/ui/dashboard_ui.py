@@ -1,29 +1,44 @@
 import tkinter as tk
 import tkinter.font as tkFont
-from PIL import Image, ImageTk, ImageSequence
+
+from resources.manifest import LOGO_PATH
+from resources.registry import AssetRegistry
 
 from .about_ui import AboutUI
 from .game_ui import GameUI
 from .info_ui import InfoUI
+from .page_cache import PageCache
+from .profile_ui import ProfileUI
+from .router import ScreenRouter
+from .scheduler import Scheduler
 from .settings_ui import SettingsUI
 
 
 class DashboardUI:
-    def __init__(self, root, username):
+    def __init__(self, root, username, router=None):
         self.root = root
         self.username = username
+        self.router = router or ScreenRouter(root)
 
         self.root.title("Pip's Bluff - Dashboard")
         self.root.geometry("1024x700")
 
         self.current_page = None  # Track currently active page
 
+        # Every widget of this screen lives in one frame the router can swap out
+        self.frame = tk.Frame(self.root)
+        self.frame.pack(fill='both', expand=True)
+
+        # Drives every timer and animation of the dashboard, stops when it is closed
+        self.scheduler = Scheduler(self.root, owner=self.frame)
+
         self.center_window(1024, 700)
         self.load_logo()
         self.setup_fonts()
         self.setup_colors()
 
         self.root.configure(bg=self.colors['bg'])
+        self.frame.configure(bg=self.colors['bg'])
 
         self.create_widgets()
         self.show_profile()
@@ -40,17 +55,16 @@ class DashboardUI:
 
     def load_logo(self):
         try:
-            self.logo_img = Image.open("assets/images/logo.png").resize(
-                (150, 95),
-                Image.LANCZOS
+            self.logo_photo = AssetRegistry.for_widget(self.root).photo(
+                LOGO_PATH,
+                (150, 95)
             )
-            self.logo_photo = ImageTk.PhotoImage(self.logo_img)
         except Exception as e:
             print(f"Error loading logo: {e}")
             self.logo_photo = None
 
     def setup_fonts(self):
-        font_family = 'Arial Rounded MT Bold' if 'Arial Rounded MT Bold' in tkFont.families() else 'Arial'
+        font_family = 'Arial Rounded MT Bold' if 'Arial Rounded MT Bold' in self.router.font_families() else 'Arial'
 
         self.base_font = tkFont.Font(
             family=font_family,
@@ -90,7 +104,7 @@ class DashboardUI:
     def create_header(self):
         # Create header section
         header_frame = tk.Frame(
-            self.root,
+            self.frame,
             bg=self.colors['header'],
             height=100
         )
@@ -115,7 +129,7 @@ class DashboardUI:
     def create_content_area(self):
         # Create main content area
         content_frame = tk.Frame(
-            self.root,
+            self.frame,
             bg=self.colors['content']
         )
         content_frame.pack(
@@ -228,181 +242,70 @@ class DashboardUI:
             expand=True
         )
 
-    def show_profile(self):
-        self.clear_main_display()
-        self.current_page = None
-
-        # Main profile layout
-        profile_frame = tk.Frame(
-            self.main_display,
-            bg=self.colors['content']
-        )
-        profile_frame.pack(
-            fill='both',
-            expand=True,
-            padx=20,
-            pady=20
-        )
-
-        self.create_profile_top_section(profile_frame)
-        self.create_user_info_section(profile_frame)
-        self.create_gif_section(profile_frame)
-
-    def create_profile_top_section(self, parent_frame):
-        # Top section (title & username)
-        top_frame = tk.Frame(
-            parent_frame,
-            bg=self.colors['content']
-        )
-        top_frame.pack(
-            anchor='nw',
-            fill='x'
-        )
-
-        tk.Label(
-            top_frame,
-            text="User Profile",
-            font=self.header_font,
-            bg=self.colors['content'],
-            fg='#552CB7'
-        ).pack(
-            anchor='center',
-            pady=(0, 10)
-        )
-
-    def create_user_info_section(self, parent_frame):
-        user_info_frame = tk.Frame(
-            parent_frame,
-            bg=self.colors['content']
-        )
-        user_info_frame.pack(
-            anchor='nw',
-            padx=10,
-            pady=(0, 20)
-        )
-
-        tk.Label(
-            user_info_frame,
-            text="Username:",
-            bg=self.colors['content'],
-            fg='#FD5A46',
-            font=self.bold_font
-        ).grid(
-            row=0,
-            column=0,
-            sticky='w'
-        )
+        # Built pages stay alive and are only hidden when switching tabs; the
+        # game is pinned so its hand in progress and score are never evicted
+        self.pages = PageCache(self.main_display, capacity=4, pinned=('game',))
 
-        tk.Label(
-            user_info_frame,
-            text=self.username,
-            bg=self.colors['content'],
-            fg='#058CD7',
-            font=self.base_font
-        ).grid(
-            row=0,
-            column=1,
-            sticky='w'
-        )
-
-    def create_gif_section(self, parent_frame):
-        # Centered GIF frame
-        gif_holder = tk.Frame(
-            parent_frame,
-            bg=self.colors['content']
+    def show_profile(self):
+        # Show profile page
+        self.current_page = self.pages.show(
+            'profile',
+            lambda parent: ProfileUI(parent, self)
         )
-        gif_holder.pack(expand=True)
-
-        try:
-            gif_path = "assets/gif/gif1.gif"
-            gif = Image.open(gif_path)
-
-            self.gif_frames = [
-                ImageTk.PhotoImage(
-                    frame.copy().convert('RGBA').resize(
-                        (400, 300),
-                        Image.LANCZOS
-                    )
-                )
-                for frame in ImageSequence.Iterator(gif)
-            ]
-
-            self.gif_index = 0
-
-            self.gif_label = tk.Label(
-                gif_holder,
-                bg=self.colors['content']
-            )
-            self.gif_label.pack()
-
-            self.animate_gif()
-
-        except Exception as e:
-            print(f"Error loading animated gif: {e}")
 
     def show_game(self):
-        # Show game UI
-        self.clear_main_display()
-        self.current_page = GameUI(
-            self.main_display,
-            self.username,
-            "assets/images"
+        # Show game UI; the hand in progress survives switching tabs
+        self.current_page = self.pages.show(
+            'game',
+            lambda parent: GameUI(
+                parent,
+                self.username,
+                "assets/images",
+                scheduler=self.scheduler
+            )
         )
 
     def show_settings(self):
         # Show settings UI
-        self.clear_main_display()
-        self.current_page = SettingsUI(
-            self.main_display,
-            self.username,
-            self
+        self.current_page = self.pages.show(
+            'settings',
+            lambda parent: SettingsUI(
+                parent,
+                self.username,
+                self
+            )
         )
 
     def show_about(self):
         # Show about UI
-        self.clear_main_display()
-        self.current_page = AboutUI(
-            self.main_display,
-            self
+        self.current_page = self.pages.show(
+            'about',
+            lambda parent: AboutUI(
+                parent,
+                self
+            )
         )
 
     def show_info(self):
         # Show hand info UI
-        self.clear_main_display()
-        self.current_page = InfoUI(
-            self.main_display,
-            self
+        self.current_page = self.pages.show(
+            'info',
+            lambda parent: InfoUI(
+                parent,
+                self
+            )
         )
 
-    def animate_gif(self):
-        if hasattr(self, 'gif_label') and self.gif_label.winfo_exists():  # Check if the widget exists
-            if hasattr(self, 'gif_frames') and self.gif_frames:
-                self.gif_label.configure(
-                    image=self.gif_frames[self.gif_index]
-                )
-
-                self.gif_index = (self.gif_index + 1) % len(self.gif_frames)
-
-                # Adjust delay to control animation speed
-                self.root.after(100, self.animate_gif)
-
     def update_username(self, new_username):
-        # Update username variable
+        # Update username variable; the profile is rebuilt, the game is renamed in place
         self.username = new_username
+        self.pages.invalidate('profile')
+        game = self.pages.get('game')
+        if game is not None:
+            game.set_username(new_username)
 
     def logout(self):
-        # Destroy current window and return to login
+        # Return to the login screen in the same window
         from .login_ui import LoginUI
 
-        self.root.destroy()
-
-        login_root = tk.Tk()
-        LoginUI(login_root)
-        login_root.mainloop()
-
-    def clear_main_display(self):
-        # Clear the content display area
-        self.current_page = None
-
-        for widget in self.main_display.winfo_children():
-            widget.destroy()
\ No newline at end of file
+        self.router.show(LoginUI)
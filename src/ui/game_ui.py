@@ -1,21 +1,49 @@
+import os
+import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image, ImageTk
 from game.game_engine import GameEngine
+from game.history import HandHistoryWriter, HistoryError
+from resources.manifest import GAME_CARD_SIZE
+
+from .card_renderer import CardRenderer
+from .card_view import CardHandView
+
+
+ODDS_POLL_MS = 30  # Jeda pemeriksaan hasil perhitungan peluang
+
+_odds_executor = None
+_odds_lock = threading.Lock()
+
+
+def _submit_odds(fn, *args):
+    # Satu thread pekerja bersama untuk perhitungan peluang, dibuat saat pertama dibutuhkan
+    global _odds_executor
+    with _odds_lock:
+        if _odds_executor is None:
+            _odds_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="draw-odds")
+    return _odds_executor.submit(fn, *args)
 
 
 class GameUI:
-    def __init__(self, parent, username: str, assets_path: str):
+    def __init__(self, parent, username: str, assets_path: str, scheduler=None):
         # Inisialisasi UI permainan
         self.parent = parent
         self.username = username
         self.assets_path = Path(assets_path)
+        self.scheduler = scheduler  # Penjadwal bersama milik dashboard (opsional)
         self.engine = GameEngine()  # Mesin logika permainan
-        self.card_widgets = []  # Widget kartu yang ditampilkan
-        self.card_images = []  # Referensi gambar kartu agar tidak terhapus
+        # PIPS_HAND_HISTORY=<file> mencatat setiap tangan ke log biner (lihat game.history)
+        try:
+            self.engine.attach_history(HandHistoryWriter.from_env(os.environ))
+        except (OSError, HistoryError) as e:
+            print(f"Error opening hand history: {e}")
         self.selected_for_discard = set()  # Indeks kartu yang dipilih untuk dibuang
         self._processing = False  # Status pemrosesan
         self.hands_played = 0  # Jumlah tangan yang dimainkan
+        self._next_deck = None  # Dek tangan berikutnya yang gambarnya sudah dimuat lebih awal
+        self._odds_request = 0  # Nomor permintaan peluang terbaru; hasil yang lebih lama diabaikan
 
         self.setup_ui()  # Bangun tampilan UI
         self.start_new_hand()  # Mulai permainan pertama
@@ -31,13 +59,14 @@ class GameUI:
         self.header.pack(fill='x')
 
         # Label nama pengguna
-        tk.Label(
+        self.username_label = tk.Label(
             self.header,
             text=f"{self.username} - Bind",
             font=('Arial', 16, 'bold'),
             fg='#552CB7',
             bg='#F5F5F5'
-        ).pack(side='left', padx=20, pady=10)
+        )
+        self.username_label.pack(side='left', padx=20, pady=10)
 
         # Statistik permainan (di kanan atas)
         self.top_right = tk.Frame(self.header, bg='#F5F5F5')
@@ -71,9 +100,30 @@ class GameUI:
         )
         self.result_label.pack(anchor='e', pady=(5, 0))
 
-        # Area tampilan kartu
+        # Area tampilan kartu, satu widget tetap per posisi kartu
         self.cards_frame = tk.Frame(self.main_frame, bg='#F5F5F5')
         self.cards_frame.pack(pady=20)
+        # Ukuran kartu mengikuti ukuran jendela, diambil dari set gambar yang paling dekat
+        self.card_renderer = CardRenderer(self.cards_frame, GAME_CARD_SIZE, images_dir=self.assets_path)
+        self.card_view = CardHandView(
+            self.cards_frame,
+            self.card_view_state,
+            self.card_file_name,
+            self.toggle_card_selection,
+            self.card_renderer
+        )
+        self.card_renderer.track(self.main_frame, self.card_view.rescale)
+        self.main_frame.bind("<Destroy>", self._on_destroy, add="+")
+
+        # Peluang hasil akhir untuk kartu yang dipertahankan, diperbarui tanpa menahan UI
+        self.odds_label = tk.Label(
+            self.main_frame,
+            text="",
+            bg='#F5F5F5',
+            fg='#552CB7',
+            font=('Arial', 10)
+        )
+        self.odds_label.pack()
 
         # Tombol-tombol kontrol
         self.controls = tk.Frame(self.main_frame, bg='#F5F5F5')
@@ -119,8 +169,9 @@ class GameUI:
 
 
     def start_new_hand(self):
-        # Mulai tangan/kartu baru
-        self.engine.initialize_game(str(self.assets_path))
+        # Mulai tangan/kartu baru, memakai dek yang sudah disiapkan jika ada
+        deck, self._next_deck = self._next_deck, None
+        self.engine.initialize_game(str(self.assets_path), deck)
         self.engine.deal_hand()
         self.selected_for_discard = set()
         self._processing = False
@@ -128,7 +179,15 @@ class GameUI:
         self.display_cards()
         self.update_stats()
         self.result_label.config(text="")
+        self.update_odds()
+        # Kartu pengganti untuk discard sudah diketahui; muat gambarnya di latar belakang
+        self.prefetch_cards(self.engine.deck.peek(5))
+
 
+    def set_username(self, username: str):
+        # Ganti nama pemain tanpa mengulang permainan yang sedang berjalan
+        self.username = username
+        self.username_label.config(text=f"{self.username} - Bind")
 
     def update_stats(self):
         # Perbarui tampilan statistik
@@ -143,55 +202,19 @@ class GameUI:
 
 
     def display_cards(self):
-        # Hapus kartu lama dari UI
-        for widget in self.card_widgets:
-            widget.destroy()
-        self.card_widgets = []
-        self.card_images = []
+        # Perbarui kartu di layar; hanya slot yang berubah yang dikonfigurasi ulang
+        self.card_view.render()
 
-        if not self.engine.hand:
-            return
 
-        # Tampilkan kartu satu per satu
-        for i, card in enumerate(self.engine.hand.cards):
-            bg_color = '#FF6F61' if i in self.selected_for_discard else 'white'
-            frame_color = '#FF0000' if i in self.selected_for_discard else '#F5F5F5'
+    def card_view_state(self):
+        # Kartu dan indeks terpilih yang harus ditampilkan oleh card_view
+        cards = self.engine.hand.cards if self.engine.hand else []
+        return cards, self.selected_for_discard
 
-            card_frame = tk.Frame(
-                self.cards_frame,
-                bg=frame_color,
-                bd=2,
-                relief='ridge'
-            )
-            card_frame.grid(row=0, column=i, padx=10)
-
-            try:
-                # Coba tampilkan gambar kartu
-                img_path = self.assets_path / "cards_large" / f"card_{card.suit}_{self._format_value(card.value)}.png"
-                img = Image.open(img_path).resize((100, 145))
-                tk_img = ImageTk.PhotoImage(img)
-                self.card_images.append(tk_img)
-
-                lbl = tk.Label(
-                    card_frame,
-                    image=tk_img,
-                    bg=bg_color
-                )
-                lbl.pack(padx=5, pady=5)
-            except Exception:
-                # Jika gambar gagal dimuat, tampilkan teks
-                lbl = tk.Label(
-                    card_frame,
-                    text=str(card),
-                    bg=bg_color,
-                    width=10,
-                    height=5
-                )
-                lbl.pack(padx=5, pady=5)
-
-            # Event klik: pilih kartu
-            lbl.bind("<Button-1>", lambda e, idx=i: self.toggle_card_selection(idx))
-            self.card_widgets.append(card_frame)
+
+    def card_file_name(self, card):
+        # Nama file gambar kartu; folder set gambarnya dipilih oleh card_renderer
+        return f"card_{card.suit}_{self._format_value(card.value)}.png"
 
 
     def toggle_card_selection(self, index):
@@ -200,8 +223,9 @@ class GameUI:
             self.selected_for_discard.remove(index)
         else:
             self.selected_for_discard.add(index)
-        self.display_cards()
+        self.card_view.refresh()  # Klik beruntun digabung menjadi satu pembaruan
         self.update_button_states()
+        self.update_odds()
 
 
     def discard_and_replace(self):
@@ -216,12 +240,13 @@ class GameUI:
         self.selected_for_discard = set()
         self.display_cards()
         self.update_button_states()
+        self.update_odds()
 
         self.result_label.config(
             text=f"Replaced {len(discarded)} cards",
             fg='#2E7D32'
         )
-        self.parent.after(2000, lambda: self.result_label.config(text=""))
+        self.schedule(2000, lambda: self.result_label.config(text=""), key='clear_result')
 
 
     def play_hand(self):
@@ -234,17 +259,91 @@ class GameUI:
 
         try:
             result = self.engine.evaluate_hand()
+            self._odds_request += 1  # Tangan sudah selesai; hasil yang masih dihitung dibuang
+            self.odds_label.config(text="")
             self.hands_played += 1
+            if self.engine.history:
+                self.engine.history.flush()  # Satu tangan selesai; pastikan tercatat di file
             self.update_stats()
             self.result_label.config(
                 text=f"{result['type']} - {result['score']} points",
                 fg='#2E7D32'
             )
-            self.parent.after(2000, self.start_new_hand)
+            self.cancel_scheduled('clear_result')  # Jangan hapus hasil sebelum tangan baru
+            self.schedule(2000, self.start_new_hand, key='new_hand')
+            self.prefetch_next_hand()  # Manfaatkan jeda 2 detik untuk memuat tangan berikutnya
         finally:
             self._processing = False
 
 
+    def update_odds(self):
+        # Hitung peluang dari salinan tracker di thread pekerja; hasilnya diambil dengan polling
+        if not self.engine.hand:
+            self.odds_label.config(text="")
+            return
+
+        self._odds_request += 1
+        request = self._odds_request
+        hold = [card for i, card in enumerate(self.engine.hand.cards) if i not in self.selected_for_discard]
+        future = _submit_odds(self.engine.tracker.snapshot().odds, hold, self.engine.paytable.scores)
+        self.schedule(ODDS_POLL_MS, lambda: self._poll_odds(future, request), key='odds')
+
+
+    def _poll_odds(self, future, request):
+        # Tampilkan hasil jika masih untuk pilihan kartu terbaru
+        if request != self._odds_request:
+            return
+        if not future.done():
+            self.schedule(ODDS_POLL_MS, lambda: self._poll_odds(future, request), key='odds')
+            return
+        self.odds_label.config(text=self._format_odds(future.result()))
+
+
+    def _format_odds(self, odds) -> str:
+        # Empat jenis tangan paling mungkin selain High Card, lalu skor rata-rata
+        if not odds.outcomes:
+            return ""
+        likely = sorted(
+            ((chance, name) for name, chance in odds.categories.items() if chance > 0 and name != "High Card"),
+            reverse=True
+        )[:4]
+        parts = " · ".join(f"{name} {chance:.1%}" for chance, name in likely)
+        return f"Draw {odds.draws}: {parts or 'High Card'}  |  Avg {odds.expected_score:.1f} pts"
+
+
+    def prefetch_next_hand(self):
+        # Siapkan dek berikutnya sekarang dan dekode gambar 5 kartu teratasnya di thread pekerja
+        self._next_deck = self.engine.prepare_deck(str(self.assets_path))
+        self.prefetch_cards(self._next_deck.peek(5))
+
+
+    def prefetch_cards(self, cards):
+        # Hanya pembuatan PhotoImage yang tersisa untuk thread Tk
+        for card in cards:
+            self.card_view.prefetch(card)
+
+
+    def schedule(self, delay, callback, key):
+        # Jadwalkan callback; dibatalkan otomatis jika halaman ini dihancurkan
+        if self.scheduler is not None:
+            self.scheduler.call_later(delay, callback, owner=self.main_frame, key=(id(self), key))
+        else:
+            self.parent.after(delay, callback)
+
+
+    def cancel_scheduled(self, key):
+        # Batalkan callback terjadwal dengan kunci tertentu
+        if self.scheduler is not None:
+            self.scheduler.cancel((id(self), key))
+
+
+    def _on_destroy(self, event):
+        # Tutup log riwayat tangan saat halaman permainan dihancurkan
+        if event.widget is self.main_frame and self.engine.history:
+            self.engine.history.close()
+            self.engine.history = None
+
+
     def disable_buttons(self):
         # Matikan tombol sementara selama proses evaluasi
         self.discard_btn['state'] = tk.DISABLED
@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
-import os
+
+from resources.manifest import INFO_CARD_SIZE
+from .card_renderer import CardRenderer
+from .virtual_list import VirtualList
 
 
 class InfoUI:
@@ -10,7 +12,6 @@ class InfoUI:
         self.setup_colors()
         self.setup_paths()
         self.define_hand_rankings()
-        self.setup_scrollable_canvas()
         self.render_ui()
 
     def setup_colors(self):
@@ -19,9 +20,9 @@ class InfoUI:
         self.text_color = "#333333"
 
     def setup_paths(self):
-        self.cards_path = "assets/images/cards_small"
-        self.card_size = (50, 75)
-        self.card_tk_images = []
+        self.row_height = 215  # Fixed height of one ranking entry, separator included
+        # Thumbnails keep one size so every row fits the fixed row height
+        self.card_renderer = CardRenderer(self.root, INFO_CARD_SIZE, resample="LANCZOS")
 
     def define_hand_rankings(self):
         self.hand_rankings = [
@@ -76,170 +77,145 @@ class InfoUI:
              "Highest value card"),
         ]
 
-    def setup_scrollable_canvas(self):
-        # Canvas and scrollbar setup
-        self.canvas = tk.Canvas(
-            self.root,
-            bg=self.bg_color,
-            highlightthickness=0
-        )
+    def render_ui(self):
+        self.add_title()
+        self.setup_ranking_list()
 
-        self.scrollbar = ttk.Scrollbar(
+    def add_title(self):
+        title_label = tk.Label(
             self.root,
-            orient="vertical",
-            command=self.canvas.yview
-        )
-
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        # Pack canvas and scrollbar
-        self.scrollbar.pack(side="right", fill="y")
-        self.canvas.pack(side="left", fill="both", expand=True)
-
-        # Content container setup
-        self.content_container = tk.Frame(
-            self.canvas,
+            text="Bind Rank",
+            font=("Arial", 20, "bold"),
+            fg=self.accent_color,
             bg=self.bg_color
         )
+        title_label.pack(side="top", pady=20)
 
-        self.content_window_id = self.canvas.create_window(
-            (0, 0),
-            window=self.content_container,
-            anchor="nw"
-        )
-
-        # Main content frame
-        self.content_frame = tk.Frame(
-            self.content_container,
+    def setup_ranking_list(self):
+        # Only the entries in view get widgets; they are recycled while scrolling
+        self.ranking_list = VirtualList(
+            self.root,
+            len(self.hand_rankings),
+            self.row_height,
+            self.create_hand_row,
+            self.bind_hand_row,
+            overscan=1,
             bg=self.bg_color
         )
-        self.content_frame.pack(anchor="center", pady=20)
+        self.canvas = self.ranking_list.canvas
 
         # Scroll bindings
         self.setup_scroll_bindings()
 
     def setup_scroll_bindings(self):
-        self.content_container.bind("<Configure>", self.on_frame_configure)
-        self.canvas.bind("<Configure>", self.on_canvas_configure)
+        self.canvas.bind("<Destroy>", lambda e: self.unbind_mousewheel(), add="+")
+        self.bind_mousewheel()
+
+    def bind_mousewheel(self):
         self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)  # Windows/macOS
         self.canvas.bind_all("<Button-4>", self.on_mousewheel_linux)  # Linux scroll up
         self.canvas.bind_all("<Button-5>", self.on_mousewheel_linux)  # Linux scroll down
 
-    def render_ui(self):
-        self.add_title()
-        self.add_hand_rankings()
+    def unbind_mousewheel(self):
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.unbind_all(sequence)
 
-    def add_title(self):
-        title_label = tk.Label(
-            self.content_frame,
-            text="Bind Rank",
-            font=("Arial", 20, "bold"),
-            fg=self.accent_color,
-            bg=self.bg_color
-        )
-        title_label.pack(pady=(0, 20))
+    def on_show(self):
+        # Wheel bindings are global, only hold them while the page is visible
+        self.bind_mousewheel()
 
-    def add_hand_rankings(self):
-        for i, (name, points, images, desc) in enumerate(self.hand_rankings):
-            self.add_hand_info(name, points, images, desc)
+    def on_hide(self):
+        self.unbind_mousewheel()
 
-            if i < len(self.hand_rankings) - 1:
-                self.add_separator()
-
-    def add_hand_info(self, name, points, card_files, desc):
-        entry_frame = tk.Frame(
-            self.content_frame,
+    def create_hand_row(self, parent):
+        # Empty entry widget; bind_hand_row fills it in for a ranking
+        row = tk.Frame(
+            parent,
             bg=self.bg_color
         )
-        entry_frame.pack()
-
-        self.add_hand_title(entry_frame, name, points)
-        self.add_card_images(entry_frame, card_files)
-        self.add_description(entry_frame, desc)
 
-    def add_hand_title(self, parent, name, points):
-        title = f"{name} ({points} points)"
-        tk.Label(
-            parent,
-            text=title,
+        row.title_label = tk.Label(
+            row,
             font=("Arial", 16, "bold"),
             fg=self.text_color,
             bg=self.bg_color
-        ).pack(pady=(0, 10))
+        )
+        row.title_label.pack(pady=(0, 10))
 
-    def add_card_images(self, parent, card_files):
         card_frame = tk.Frame(
-            parent,
+            row,
             bg=self.bg_color
         )
         card_frame.pack()
 
-        for file_name in card_files:
-            self.add_card_image(card_frame, file_name)
-
-    def add_card_image(self, parent, file_name):
-        path = os.path.join(self.cards_path, file_name)
-
-        try:
-            img = Image.open(path).resize(self.card_size, Image.LANCZOS)
-            tk_img = ImageTk.PhotoImage(img)
-            self.card_tk_images.append(tk_img)
-
+        row.card_labels = []
+        for _ in range(5):
             label = tk.Label(
-                parent,
-                image=tk_img,
+                card_frame,
                 bg=self.bg_color,
                 borderwidth=1,
                 relief="solid"
             )
-            label.image = tk_img
             label.pack(side="left", padx=15)
+            row.card_labels.append(label)
 
-        except FileNotFoundError:
-            self.add_card_placeholder(parent)
-
-    def add_card_placeholder(self, parent):
-        placeholder = tk.Label(
-            parent,
-            text="?",
-            font=("Arial", 20, "bold"),
-            width=3,
-            height=1,
-            bg="white",
-            borderwidth=1,
-            relief="solid"
-        )
-        placeholder.pack(side="left", padx=15)
-
-    def add_description(self, parent, desc):
-        tk.Label(
-            parent,
-            text=desc,
+        row.desc_label = tk.Label(
+            row,
             font=("Arial", 12),
             bg=self.bg_color,
             fg=self.text_color,
             wraplength=550,
             justify="center"
-        ).pack(pady=(10, 0))
+        )
+        row.desc_label.pack(pady=(10, 0))
 
-    def add_separator(self):
-        separator = ttk.Separator(
-            self.content_frame,
+        row.separator = ttk.Separator(
+            row,
             orient='horizontal'
         )
-        separator.pack(fill='x', padx=20, pady=15)
 
-    def on_frame_configure(self, event):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        return row
+
+    def bind_hand_row(self, row, index):
+        name, points, card_files, desc = self.hand_rankings[index]
 
-    def on_canvas_configure(self, event):
-        self.canvas.itemconfig(self.content_window_id, width=event.width)
+        row.title_label.configure(text=f"{name} ({points} points)")
+        row.desc_label.configure(text=desc)
+
+        for label, file_name in zip(row.card_labels, card_files):
+            photo = self.card_photo(file_name)
+            if photo is not None:
+                label.configure(image=photo, text="", width=0, height=0, bg=self.bg_color)
+            else:
+                self.show_card_placeholder(label)
+
+        if index < len(self.hand_rankings) - 1:
+            row.separator.pack(fill='x', padx=20, pady=15)
+        else:
+            row.separator.pack_forget()
+
+    def card_photo(self, file_name):
+        # Thumbnails are loaded on first use and shared through the asset registry
+        try:
+            return self.card_renderer.photo(file_name)
+        except FileNotFoundError:
+            return None
+
+    def show_card_placeholder(self, label):
+        label.configure(
+            image="",
+            text="?",
+            font=("Arial", 20, "bold"),
+            width=3,
+            height=1,
+            bg="white"
+        )
 
     def on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        self.ranking_list.scroll(int(-1 * (event.delta / 120)))
 
     def on_mousewheel_linux(self, event):
         if event.num == 4:
-            self.canvas.yview_scroll(-1, "units")
+            self.ranking_list.scroll(-1)
         elif event.num == 5:
-            self.canvas.yview_scroll(1, "units")
\ No newline at end of file
+            self.ranking_list.scroll(1)
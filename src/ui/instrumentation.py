@@ -0,0 +1,183 @@
+import json
+import logging
+import sys
+import threading
+import time
+import tkinter
+import traceback
+
+from latency import LatencyHistogram
+
+
+logger = logging.getLogger(__name__)
+
+# Set to 1 to enable instrumentation, or to a file path to also save the histograms as JSON on exit.
+ENV_VAR = "PIPS_UI_TRACE"
+
+
+def _handler_name(func):
+    name = getattr(func, '__qualname__', None) or repr(func)
+    if name.endswith('.callit'):
+        # Misc.after() wraps its callback and only copies the callback's __name__
+        return f"after:{func.__name__}"
+    module = getattr(func, '__module__', None)
+    return f"{module}.{name}" if module else name
+
+
+class UIInstrumentation:
+    """
+    Measures how long Tk callbacks block the event loop.
+
+    While installed, every Tk callback registered afterwards (button commands,
+    event bindings, after() callbacks, scrollbar commands...) is timed into a
+    per-handler histogram. A heartbeat after() probe records how late the
+    event loop services it, and a watchdog thread logs a stack sample of the
+    main thread whenever a handler blocks for longer than `threshold_ms`.
+    """
+
+    def __init__(self, root, threshold_ms=100, heartbeat_ms=50, output=None):
+        self.root = root
+        self.threshold_ms = threshold_ms
+        self.heartbeat_ms = heartbeat_ms
+        self.output = output  # Optional JSON path written on exit
+
+        self.handlers = {}  # Handler name -> LatencyHistogram
+        self.loop_lag = LatencyHistogram()
+        self.stalls = []  # Handlers that blocked longer than the threshold
+
+        self._lock = threading.Lock()
+        self._current = None  # (handler name, start time) of the running callback
+        self._sampled = None  # Stack captured by the watchdog for the running callback
+        self._main_thread_id = threading.get_ident()
+        self._original_wrapper = None
+        self._stop = threading.Event()
+        self._heartbeat_id = None
+
+    @classmethod
+    def from_env(cls, root, environ):
+        """Returns an installed instrumentation if PIPS_UI_TRACE is set, else None."""
+        value = environ.get(ENV_VAR, "")
+        if not value or value == "0":
+            return None
+        instrumentation = cls(root, output=None if value == "1" else value)
+        instrumentation.install()
+        return instrumentation
+
+    def install(self):
+        """Starts timing callbacks, the heartbeat probe and the watchdog."""
+        if self._original_wrapper is not None:
+            return
+
+        self._original_wrapper = tkinter.CallWrapper
+        tkinter.CallWrapper = self._make_wrapper(self._original_wrapper)
+
+        self._schedule_heartbeat(time.perf_counter())
+        threading.Thread(target=self._watchdog, name="ui-watchdog", daemon=True).start()
+        self.root.bind("<Destroy>", self._on_root_destroy, add="+")
+
+    def uninstall(self):
+        """Restores plain Tk callbacks and stops the heartbeat and watchdog."""
+        if self._original_wrapper is None:
+            return
+        tkinter.CallWrapper = self._original_wrapper
+        self._original_wrapper = None
+        self._stop.set()
+        if self._heartbeat_id is not None:
+            try:
+                self.root.after_cancel(self._heartbeat_id)
+            except tkinter.TclError:
+                pass
+            self._heartbeat_id = None
+
+    def _make_wrapper(self, base):
+        instrumentation = self
+
+        class TimedCallWrapper(base):
+            def __init__(self, func, subst, widget):
+                super().__init__(func, subst, widget)
+                self.handler_name = _handler_name(func)
+
+            def __call__(self, *args):
+                return instrumentation._timed(self.handler_name, super().__call__, args)
+
+        return TimedCallWrapper
+
+    def _timed(self, name, call, args):
+        outer = self._current
+        start = time.perf_counter()
+        self._current = (name, start)
+        try:
+            return call(*args)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self._current = outer
+            self._record(name, elapsed)
+
+    def _record(self, name, elapsed):
+        with self._lock:
+            histogram = self.handlers.get(name)
+            if histogram is None:
+                histogram = self.handlers[name] = LatencyHistogram()
+            histogram.record(elapsed)
+
+            if elapsed < self.threshold_ms:
+                return
+            stack, self._sampled = self._sampled, None
+            self.stalls.append({"handler": name, "duration_ms": round(elapsed, 2), "stack": stack})
+
+        logger.warning(
+            "UI handler %s blocked the event loop for %.1f ms%s",
+            name, elapsed, f"\n{stack}" if stack else ""
+        )
+
+    def _watchdog(self):
+        # Samples the main thread's stack while a handler runs past the threshold
+        interval = self.threshold_ms / 2000
+        sampled_for = None
+        while not self._stop.wait(interval):
+            current = self._current
+            if current is None or current is sampled_for:
+                continue
+            if (time.perf_counter() - current[1]) * 1000 < self.threshold_ms:
+                continue
+
+            frame = sys._current_frames().get(self._main_thread_id)
+            if frame is not None:
+                with self._lock:
+                    self._sampled = "".join(traceback.format_stack(frame))
+            sampled_for = current
+
+    def _schedule_heartbeat(self, scheduled_at):
+        expected = scheduled_at + self.heartbeat_ms / 1000
+        self._heartbeat_id = self.root.after(self.heartbeat_ms, self._heartbeat, expected)
+
+    def _heartbeat(self, expected):
+        now = time.perf_counter()
+        with self._lock:
+            self.loop_lag.record(max(0.0, (now - expected) * 1000))
+        self._schedule_heartbeat(now)
+
+    def snapshot(self):
+        """Returns every histogram and recorded stall as a JSON-serializable dict."""
+        with self._lock:
+            return {
+                "threshold_ms": self.threshold_ms,
+                "loop_lag": self.loop_lag.to_dict(),
+                "handlers": {name: histogram.to_dict() for name, histogram in sorted(self.handlers.items())},
+                "stalls": list(self.stalls),
+            }
+
+    def export_json(self, path=None):
+        """Returns the snapshot as JSON, also writing it to `path` if given."""
+        data = json.dumps(self.snapshot(), indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(data)
+        return data
+
+    def _on_root_destroy(self, event):
+        if event.widget is not self.root:
+            return
+        self.uninstall()
+        if self.output:
+            self.export_json(self.output)
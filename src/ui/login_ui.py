@@ -1,24 +1,55 @@
-import os
 import tkinter as tk
 import tkinter.font as tkFont
 from tkinter import messagebox
-from PIL import Image, ImageTk
-from auth.login import Login
+from resources.manifest import LOGO_PATH
+from resources.registry import AssetRegistry
+
+from .router import ScreenRouter
 
 
 class LoginUI:
-    def __init__(self, root):
+    def __init__(self, root, router=None):
         self.root = root
+        self.router = router or ScreenRouter(root)
         self.root.title("Login")
         self.root.geometry("600x500")
         self.center_window(600, 500)
 
         self.configure_fonts()
-        self.login_handler = Login()
+        self._login_handler = None  # Created on first login, see login_handler
         self.root.configure(bg='#552CB7')
 
+        # Every widget of this screen lives in one frame the router can swap out
+        self.frame = tk.Frame(self.root, bg='#552CB7')
+        self.frame.pack(fill='both', expand=True)
+
         self.create_widgets()
 
+        # Connect to the database while the user types; nothing is imported before the first paint
+        self.root.after_idle(self.prewarm_login)
+        self.frame.bind("<Destroy>", self.on_destroy, add="+")
+
+    @property
+    def login_handler(self):
+        """The authentication handler, imported and created on first use to keep startup light."""
+        if self._login_handler is None:
+            from auth.login import Login
+            self._login_handler = Login()
+        return self._login_handler
+
+    def prewarm_login(self):
+        """Start connecting to the database in the background."""
+        if self.frame.winfo_exists():
+            self.login_handler.prewarm()
+
+    def on_username_focus_out(self, event):
+        """Fetch the typed user's record in the background."""
+        self.login_handler.prefetch_user(self.username_entry.get())
+
+    def on_destroy(self, event):
+        if event.widget is self.frame and self._login_handler is not None:
+            self._login_handler.close()
+
     def center_window(self, width, height):
         """Center the window on the screen."""
         screen_width = self.root.winfo_screenwidth()
@@ -29,7 +60,7 @@ class LoginUI:
 
     def configure_fonts(self):
         """Set font families and sizes."""
-        available_fonts = tkFont.families()
+        available_fonts = self.router.font_families()
         if 'Verdana' in available_fonts:
             font_family = 'Verdana'
         elif 'Arial' in available_fonts:
@@ -48,15 +79,12 @@ class LoginUI:
 
     def create_header(self):
         """Display the logo or fallback title."""
-        header_frame = tk.Frame(self.root, bg='#FD5A46', height=100)
+        header_frame = tk.Frame(self.frame, bg='#FD5A46', height=100)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
 
         try:
-            logo_path = os.path.join(os.getcwd(), "assets", "images", "logo.png")
-            image = Image.open(logo_path)
-            image = image.resize((175, 120), Image.Resampling.LANCZOS)
-            logo = ImageTk.PhotoImage(image)
+            logo = AssetRegistry.for_widget(self.root).photo(LOGO_PATH, (175, 120))
 
             self.logo_label = tk.Label(header_frame, image=logo, bg='#FD5A46')
             self.logo_label.image = logo
@@ -74,7 +102,7 @@ class LoginUI:
 
     def create_form(self):
         """Build the login form UI."""
-        container = tk.Frame(self.root, bg='#552CB7')
+        container = tk.Frame(self.frame, bg='#552CB7')
         container.pack(fill='both', expand=True, padx=20, pady=20)
 
         center_frame = tk.Frame(container, bg='white', bd=3, relief='ridge')
@@ -119,6 +147,7 @@ class LoginUI:
             width=25
         )
         self.username_entry.pack(side='left')
+        self.username_entry.bind("<FocusOut>", self.on_username_focus_out, add="+")
 
     def create_password_field(self, parent):
         password_frame = tk.Frame(parent, bg='white')
@@ -191,22 +220,16 @@ class LoginUI:
         success, message = self.login_handler.authenticate(username, password)
 
         if success:
-            self.root.destroy()
             self.show_dashboard(username)
         else:
             messagebox.showerror("Login Error", message)
 
     def show_register(self):
-        """Open register page UI."""
+        """Switch to the register screen."""
         from ui.register_ui import RegisterUI
-        self.root.destroy()
-        register_root = tk.Tk()
-        RegisterUI(register_root)
-        register_root.mainloop()
+        self.router.show(RegisterUI)
 
     def show_dashboard(self, username):
-        """Open dashboard UI after successful login."""
+        """Switch to the dashboard after successful login."""
         from ui.dashboard_ui import DashboardUI
-        dashboard_root = tk.Tk()
-        DashboardUI(dashboard_root, username)
-        dashboard_root.mainloop()
+        self.router.show(DashboardUI, username)
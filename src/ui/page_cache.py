@@ -0,0 +1,95 @@
+from collections import OrderedDict
+import tkinter as tk
+
+
+class PageCache:
+    """
+    Keeps constructed dashboard pages alive and shows one of them at a time.
+
+    Each page gets its own container frame; switching pages only hides and
+    shows those frames. At most `capacity` pages are kept, the least recently
+    shown one is destroyed first; pages named in `pinned` (e.g. a game whose
+    hand is in progress) are never evicted. Pages may define `on_show()` and
+    `on_hide()` to pause work (animations, global bindings) while they are hidden.
+    """
+
+    def __init__(self, parent, capacity=4, pinned=()):
+        self.parent = parent
+        self.capacity = capacity
+        self.pinned = set(pinned)  # Names of pages that are never evicted
+        self.pages = OrderedDict()  # name -> (container frame, page)
+        self.current = None  # Name of the page on screen
+
+    def show(self, name, factory):
+        """
+        Shows the page called `name`, building it with `factory` if it is not cached.
+
+        Args:
+            name (str): Cache key of the page, e.g. "game".
+            factory (callable): Called with the page's container frame, returns the page.
+
+        Returns:
+            The page object.
+        """
+        if self.current == name:
+            return self.pages[name][1]
+
+        self._hide_current()
+
+        if name in self.pages:
+            self.pages.move_to_end(name)
+            container, page = self.pages[name]
+            container.pack(fill='both', expand=True)
+            self._call(page, 'on_show')
+        else:
+            container = tk.Frame(self.parent, bg=self.parent['bg'])
+            container.pack(fill='both', expand=True)
+            page = factory(container)
+            self.pages[name] = (container, page)
+            self._evict()
+
+        self.current = name
+        return page
+
+    def get(self, name):
+        """Returns the cached page called `name`, or None."""
+        entry = self.pages.get(name)
+        return entry[1] if entry else None
+
+    def invalidate(self, name=None):
+        """
+        Destroys a cached page (or all of them when `name` is None).
+
+        The page is rebuilt from scratch the next time it is shown. If it is
+        the page on screen, the display is left empty until the next show().
+        """
+        names = [name] if name is not None else list(self.pages)
+        for key in names:
+            if key not in self.pages:
+                continue
+            container, page = self.pages.pop(key)
+            if key == self.current:
+                self._call(page, 'on_hide')
+                self.current = None
+            container.destroy()
+
+    def _hide_current(self):
+        if self.current is None:
+            return
+        container, page = self.pages[self.current]
+        self._call(page, 'on_hide')
+        container.pack_forget()
+        self.current = None
+
+    def _evict(self):
+        # Least recently shown first, skipping the page on screen and pinned pages
+        candidates = [name for name in self.pages if name != self.current and name not in self.pinned]
+        for name in candidates[:max(len(self.pages) - self.capacity, 0)]:
+            container, _ = self.pages.pop(name)
+            container.destroy()
+
+    @staticmethod
+    def _call(page, hook):
+        method = getattr(page, hook, None)
+        if method is not None:
+            method()
@@ -0,0 +1,127 @@
+import tkinter as tk
+from PIL import Image
+
+from .animated_image import AnimatedImage
+
+
+class ProfileUI:
+    def __init__(self, parent, dashboard):
+        self.parent = parent
+        self.dashboard = dashboard
+        self.colors = dashboard.colors
+        self.gif_player = None  # Profile animation, if it could be loaded
+
+        self.create_main_frame()
+        self.create_profile_top_section()
+        self.create_user_info_section()
+        self.create_gif_section()
+
+    def create_main_frame(self):
+        # Main profile layout
+        self.frame = tk.Frame(
+            self.parent,
+            bg=self.colors['content']
+        )
+        self.frame.pack(
+            fill='both',
+            expand=True,
+            padx=20,
+            pady=20
+        )
+
+    def create_profile_top_section(self):
+        # Top section (title & username)
+        top_frame = tk.Frame(
+            self.frame,
+            bg=self.colors['content']
+        )
+        top_frame.pack(
+            anchor='nw',
+            fill='x'
+        )
+
+        tk.Label(
+            top_frame,
+            text="User Profile",
+            font=self.dashboard.header_font,
+            bg=self.colors['content'],
+            fg='#552CB7'
+        ).pack(
+            anchor='center',
+            pady=(0, 10)
+        )
+
+    def create_user_info_section(self):
+        user_info_frame = tk.Frame(
+            self.frame,
+            bg=self.colors['content']
+        )
+        user_info_frame.pack(
+            anchor='nw',
+            padx=10,
+            pady=(0, 20)
+        )
+
+        tk.Label(
+            user_info_frame,
+            text="Username:",
+            bg=self.colors['content'],
+            fg='#FD5A46',
+            font=self.dashboard.bold_font
+        ).grid(
+            row=0,
+            column=0,
+            sticky='w'
+        )
+
+        tk.Label(
+            user_info_frame,
+            text=self.dashboard.username,
+            bg=self.colors['content'],
+            fg='#058CD7',
+            font=self.dashboard.base_font
+        ).grid(
+            row=0,
+            column=1,
+            sticky='w'
+        )
+
+    def create_gif_section(self):
+        # Centered GIF frame
+        gif_holder = tk.Frame(
+            self.frame,
+            bg=self.colors['content']
+        )
+        gif_holder.pack(expand=True)
+
+        try:
+            gif_path = "assets/Gif/gif1.gif"
+
+            self.gif_label = tk.Label(
+                gif_holder,
+                bg=self.colors['content']
+            )
+            self.gif_label.pack()
+
+            # Frames are decoded as they are first shown and reused on later visits
+            self.gif_player = AnimatedImage(
+                self.gif_label,
+                gif_path,
+                (400, 300),
+                Image.LANCZOS,
+                scheduler=self.dashboard.scheduler
+            )
+            self.gif_player.play()
+
+        except Exception as e:
+            print(f"Error loading animated gif: {e}")
+
+    def on_show(self):
+        # Resume the animation when the page comes back on screen
+        if self.gif_player:
+            self.gif_player.play()
+
+    def on_hide(self):
+        # Stop the animation and release its frames while the page is hidden
+        if self.gif_player:
+            self.gif_player.stop()
@@ -1,20 +1,23 @@
-import os
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
+from resources.manifest import LOGO_PATH
+from resources.registry import AssetRegistry
 from auth.register import Register
 import tkinter.font as tkFont
 
+from .router import ScreenRouter
+
 
 class RegisterUI:
-    def __init__(self, root):
+    def __init__(self, root, router=None):
         self.root = root
+        self.router = router or ScreenRouter(root)
         self.root.title("Register")
         self.root.geometry("600x500")
         self.center_window(600, 500)
 
         # Font selection based on system availability
-        available_fonts = tkFont.families()
+        available_fonts = self.router.font_families()
         if 'Verdana' in available_fonts:
             font_family = 'Verdana'
         elif 'Arial' in available_fonts:
@@ -30,6 +33,10 @@ class RegisterUI:
         # Background theme
         self.root.configure(bg='#552CB7')
 
+        # Every widget of this screen lives in one frame the router can swap out
+        self.frame = tk.Frame(self.root, bg='#552CB7')
+        self.frame.pack(fill='both', expand=True)
+
         # Register handler
         self.register_handler = Register()
 
@@ -48,15 +55,12 @@ class RegisterUI:
         """Construct all UI components."""
 
         # Header with logo or fallback
-        header_frame = tk.Frame(self.root, bg='#FD5A46', height=100)
+        header_frame = tk.Frame(self.frame, bg='#FD5A46', height=100)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
 
         try:
-            logo_path = os.path.join(os.getcwd(), "assets", "images", "logo.png")
-            image = Image.open(logo_path)
-            image = image.resize((175, 120), Image.Resampling.LANCZOS)
-            logo = ImageTk.PhotoImage(image)
+            logo = AssetRegistry.for_widget(self.root).photo(LOGO_PATH, (175, 120))
 
             self.logo_label = tk.Label(header_frame, image=logo, bg='#FD5A46')
             self.logo_label.image = logo  # Prevent GC
@@ -72,7 +76,7 @@ class RegisterUI:
             ).pack(pady=0)
 
         # Container for content
-        container = tk.Frame(self.root, bg='#552CB7')
+        container = tk.Frame(self.frame, bg='#552CB7')
         container.pack(fill='both', expand=True, padx=20, pady=20)
 
         # Center white panel
@@ -186,9 +190,6 @@ class RegisterUI:
             messagebox.showerror("Registration Error", message)
 
     def show_login(self):
-        """Open login UI and close registration window."""
-        self.root.destroy()
+        """Switch back to the login screen."""
         from ui.login_ui import LoginUI
-        login_root = tk.Tk()
-        LoginUI(login_root)
-        login_root.mainloop()
+        self.router.show(LoginUI)
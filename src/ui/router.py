@@ -0,0 +1,54 @@
+import tkinter.font as tkFont
+
+
+class ScreenRouter:
+    """
+    Owns the application's single Tk root and swaps screens inside it.
+
+    A screen is any class built as `ScreenClass(root, *args, router=router)`
+    that packs all of its widgets into its own `frame`. Switching screens only
+    destroys that frame, so Tcl, fonts and loaded images stay alive for the
+    whole session and no nested mainloop is started.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.screen = None  # Currently shown screen
+        self._font_families = None
+
+    def show(self, screen_cls, *args, **kwargs):
+        """
+        Replaces the current screen with a new instance of `screen_cls`.
+
+        Args:
+            screen_cls: Screen class to build, e.g. LoginUI.
+            *args: Extra positional arguments after the root, e.g. the username.
+
+        Returns:
+            The new screen instance.
+        """
+        if self.screen is not None:
+            self.screen.frame.destroy()
+            self.screen = None
+
+        self.screen = screen_cls(self.root, *args, router=self, **kwargs)
+        return self.screen
+
+    def font_families(self):
+        """Returns the font families of the display, queried once per session."""
+        if self._font_families is None:
+            self._font_families = set(tkFont.families(self.root))
+        return self._font_families
+
+
+def unbind(widget, sequence, funcid):
+    """
+    Removes one binding added with `add="+"` and keeps the others.
+
+    `Misc.unbind()` in older Pythons drops every binding of the sequence,
+    which would break the other screens sharing the root.
+    """
+    script = widget.tk.call('bind', widget._w, sequence)
+    kept = '\n'.join(line for line in script.split('\n') if funcid not in line)
+    widget.tk.call('bind', widget._w, sequence, kept)
+    widget.deletecommand(funcid)
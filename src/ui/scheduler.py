@@ -0,0 +1,248 @@
+import heapq
+import itertools
+import sys
+import time
+import tkinter as tk
+
+from .router import unbind
+
+
+class Task:
+    """A callback waiting in the Scheduler."""
+
+    def __init__(self, due, callback, interval=None, owner=None, key=None, animation=False):
+        self.due = due
+        self.callback = callback
+        self.interval = interval  # ms between runs for periodic tasks, None for one-shot
+        self.owner = owner  # Widget whose destruction cancels the task
+        self.key = key  # Scheduling again with the same key replaces this task
+        self.animation = animation  # Animations are suspended while the window is hidden
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Scheduler:
+    """
+    Drives every delayed and periodic UI task from a single Tk timer.
+
+    Only one `after()` is pending at any time, set for the earliest due task.
+    Tasks due within `resolution` ms of each other run in the same tick, tasks
+    whose owner widget is destroyed are dropped, and animation tasks are held
+    back while the window is minimized or unfocused.
+
+    The scheduler shuts down when `owner` (the root by default) is destroyed.
+    """
+
+    def __init__(self, root, resolution=10, owner=None):
+        self.root = root
+        self.owner = owner or root
+        self.resolution = resolution
+        self.paused = False
+
+        self._queue = []  # Heap of (due, order, task)
+        self._order = itertools.count()
+        self._keys = {}  # key -> Task
+        self._suspended = []  # Animation tasks held back while paused
+        self._owners = set()  # Widgets that already cancel their tasks on <Destroy>
+        self._after_id = None
+        self._after_due = None
+        self._closed = False
+
+        # Root bindings are removed again in close(), the root may outlive us
+        self._bindings = [
+            (sequence, self.root.bind(sequence, handler, add="+"))
+            for sequence, handler in [
+                ("<Unmap>", self._on_visibility),
+                ("<Map>", self._on_visibility),
+                ("<FocusIn>", self._on_focus),
+                ("<FocusOut>", self._on_focus),
+            ]
+        ]
+        self.owner.bind("<Destroy>", self._on_owner_destroyed, add="+")
+
+    def _now(self):
+        return time.monotonic() * 1000
+
+    def call_later(self, delay, callback, owner=None, key=None, animation=False):
+        """
+        Runs `callback` once, `delay` ms from now.
+
+        Args:
+            delay (int): Delay in milliseconds.
+            callback (callable): Function called without arguments.
+            owner (tk.Widget): Optional widget; destroying it cancels the task.
+            key (hashable): Optional name; a pending task with the same key is replaced.
+            animation (bool): True if the task should wait while the window is hidden.
+
+        Returns:
+            Task: Handle that can be passed to cancel().
+        """
+        return self._add(Task(self._now() + delay, callback, None, owner, key, animation))
+
+    def call_every(self, interval, callback, owner=None, key=None, animation=True):
+        """Runs `callback` every `interval` ms until cancelled. See call_later()."""
+        return self._add(Task(self._now() + interval, callback, interval, owner, key, animation))
+
+    def cancel(self, task_or_key):
+        """Cancels a task, given its handle or its key."""
+        task = task_or_key if isinstance(task_or_key, Task) else self._keys.get(task_or_key)
+        if task is None:
+            return
+
+        task.cancel()
+        if task.key is not None and self._keys.get(task.key) is task:
+            del self._keys[task.key]
+
+    def cancel_owner(self, owner):
+        """Cancels every task tied to `owner`."""
+        for _, _, task in self._queue:
+            if task.owner is owner:
+                self.cancel(task)
+        for task in self._suspended:
+            if task.owner is owner:
+                self.cancel(task)
+
+    def _add(self, task):
+        if self._closed:
+            return task
+
+        if task.key is not None:
+            self.cancel(task.key)
+            self._keys[task.key] = task
+
+        if task.owner is not None and str(task.owner) not in self._owners:
+            self._owners.add(str(task.owner))
+            task.owner.bind("<Destroy>", lambda e, w=task.owner: self._on_task_owner_destroy(e, w), add="+")
+
+        if task.animation and self.paused:
+            self._suspended.append(task)
+        else:
+            heapq.heappush(self._queue, (task.due, next(self._order), task))
+            self._arm()
+        return task
+
+    def _arm(self):
+        # Keep exactly one after() pending, for the earliest task
+        while self._queue and self._queue[0][2].cancelled:
+            heapq.heappop(self._queue)
+        if not self._queue:
+            return
+
+        due = self._queue[0][0]
+        if self._after_id is not None:
+            if self._after_due <= due:
+                return
+            self.root.after_cancel(self._after_id)
+
+        delay = max(0, int(due - self._now()))
+        # Round up to the resolution so timers falling close together share a tick
+        delay = -(-delay // self.resolution) * self.resolution
+        self._after_due = due
+        self._after_id = self.root.after(delay, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        self._after_due = None
+
+        horizon = self._now() + self.resolution
+        ready = []
+        while self._queue and self._queue[0][0] <= horizon:
+            ready.append(heapq.heappop(self._queue)[2])
+
+        for task in ready:
+            if task.cancelled:
+                continue
+            if task.owner is not None and not task.owner.winfo_exists():
+                self.cancel(task)
+                continue
+            if task.animation and self.paused:
+                self._suspended.append(task)
+                continue
+
+            if task.interval is None:
+                if task.key is not None and self._keys.get(task.key) is task:
+                    del self._keys[task.key]
+                task.cancelled = True
+            else:
+                task.due = max(task.due + task.interval, self._now())
+                heapq.heappush(self._queue, (task.due, next(self._order), task))
+
+            try:
+                task.callback()
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+
+        if not self._closed:
+            self._arm()
+
+    def pause(self):
+        """Holds back animation tasks until resume()."""
+        self.paused = True
+
+    def resume(self):
+        """Restarts animation tasks held back by pause()."""
+        if not self.paused:
+            return
+        self.paused = False
+
+        now = self._now()
+        suspended, self._suspended = self._suspended, []
+        for task in suspended:
+            if not task.cancelled:
+                task.due = now
+                heapq.heappush(self._queue, (task.due, next(self._order), task))
+        self._arm()
+
+    def _on_visibility(self, event):
+        if event.widget is not self.root:
+            return  # Child widgets being packed or hidden
+        if event.type == tk.EventType.Unmap:
+            self.pause()
+        else:
+            self.resume()
+
+    def _on_focus(self, event):
+        # Focus also moves between our own widgets; check once it has settled
+        self.root.after_idle(self._check_focus)
+
+    def _check_focus(self):
+        if self._closed:
+            return
+        try:
+            focused = self.root.focus_get() is not None
+        except KeyError:
+            focused = True  # Focus is on an internal Tk widget (e.g. a combobox list)
+        if focused:
+            self.resume()
+        else:
+            self.pause()
+
+    def _on_task_owner_destroy(self, event, owner):
+        if event.widget is owner:
+            self._owners.discard(str(owner))
+            self.cancel_owner(owner)
+
+    def close(self):
+        """Cancels every task and detaches from the root."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue = []
+        self._suspended = []
+        self._keys = {}
+
+        try:
+            if self._after_id is not None:
+                self.root.after_cancel(self._after_id)
+            for sequence, funcid in self._bindings:
+                unbind(self.root, sequence, funcid)
+        except tk.TclError:
+            pass  # The root itself is being destroyed
+        self._after_id = None
+        self._bindings = []
+
+    def _on_owner_destroyed(self, event):
+        if event.widget is self.owner:
+            self.close()
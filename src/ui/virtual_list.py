@@ -0,0 +1,106 @@
+import math
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualList:
+    """
+    Scrollable list that only builds widgets for the rows in view.
+
+    Rows have a fixed height, so the scroll region is known without measuring
+    any widget. Only the visible rows plus `overscan` rows on each side have a
+    widget; rows scrolled out of range are handed back to a pool and re-bound
+    to the rows scrolling in.
+    """
+
+    def __init__(self, parent, row_count, row_height, create_row, bind_row, overscan=1, bg=None):
+        """
+        Args:
+            parent: Widget to pack the list into.
+            row_count (int): Number of rows in the list.
+            row_height (int): Height of every row in pixels.
+            create_row: Called with the canvas, returns a new, empty row widget.
+            bind_row: Called with (row widget, row index) to fill the widget in.
+            overscan (int): Extra rows kept built above and below the viewport.
+            bg (str): Background colour of the list.
+        """
+        self.row_count = row_count
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.overscan = overscan
+
+        self.canvas = tk.Canvas(parent, bg=bg, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.rows = {}  # Row index -> (widget, canvas item) currently placed
+        self.pool = []  # (widget, canvas item) ready for reuse
+
+        self.canvas.bind("<Configure>", self.on_canvas_configure)
+        self.set_row_count(row_count)
+
+    def set_row_count(self, row_count):
+        """Changes the number of rows and re-binds the visible ones."""
+        self.row_count = row_count
+        self.canvas.configure(scrollregion=(0, 0, 0, row_count * self.row_height))
+        for index in list(self.rows):
+            self._release(index)
+        self.update_visible()
+
+    def yview(self, *args):
+        self.canvas.yview(*args)
+        self.update_visible()
+
+    def scroll(self, amount, what="units"):
+        self.canvas.yview_scroll(amount, what)
+        self.update_visible()
+
+    def on_canvas_configure(self, event):
+        # Keep rows centred and fill in any rows uncovered by a taller window
+        for _, item in self.rows.values():
+            self.canvas.coords(item, event.width // 2, self.canvas.coords(item)[1])
+        self.update_visible()
+
+    def visible_range(self):
+        """Returns the (first, last + 1) row indices that should have widgets."""
+        height = self.canvas.winfo_height()
+        top = self.canvas.canvasy(0)
+        first = max(0, int(top // self.row_height) - self.overscan)
+        last = min(self.row_count, math.ceil((top + height) / self.row_height) + self.overscan)
+        return first, max(first, last)
+
+    def update_visible(self):
+        first, last = self.visible_range()
+
+        for index in [i for i in self.rows if not first <= i < last]:
+            self._release(index)
+
+        x = self.canvas.winfo_width() // 2
+        for index in range(first, last):
+            if index in self.rows:
+                continue
+
+            if self.pool:
+                widget, item = self.pool.pop()
+                self.canvas.coords(item, x, index * self.row_height)
+            else:
+                widget = self.create_row(self.canvas)
+                item = self.canvas.create_window(
+                    (x, index * self.row_height),
+                    window=widget,
+                    anchor="n",
+                    height=self.row_height
+                )
+
+            self.bind_row(widget, index)
+            self.rows[index] = (widget, item)
+
+    def _release(self, index):
+        widget, item = self.rows.pop(index)
+        # Park the row above the scroll region, where it can never be seen
+        self.canvas.coords(item, 0, -2 * self.row_height)
+        self.pool.append((widget, item))